@@ -91,6 +91,22 @@ class Settings(BaseSettings):
         description="Supported LAS version strings",
     )
 
+    # Viewer Settings
+    viewer_columnar_json: bool = Field(
+        default=False,
+        description="Return JSON viewer points as per-attribute arrays instead of per-point objects",
+    )
+
+    # Report Settings
+    parallel_reports: bool = Field(
+        default=True,
+        description="Write PDF and Excel outputs concurrently when both are requested",
+    )
+    max_cached_reports: int = Field(
+        default=1024,
+        description="Maximum number of report results kept in memory for status lookups",
+    )
+
     # Callback Settings
     callback_timeout: int = Field(
         default=30, description="HTTP callback timeout in seconds"
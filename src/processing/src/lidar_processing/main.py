@@ -13,10 +13,11 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
+import orjson
 import redis
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from lidar_processing import __version__
 from lidar_processing.config import Settings, configure_logging, get_settings
@@ -484,7 +485,7 @@ def _register_routes(app: FastAPI, settings: Settings) -> None:
         downsample_factor: int = 1,
         format: str = "binary",
         attributes: list[str] | None = None,
-    ) -> dict[str, Any]:
+    ) -> Response:
         """Extract points from a LiDAR file for 3D viewer."""
         try:
             result = point_extractor.extract_points(
@@ -495,7 +496,12 @@ def _register_routes(app: FastAPI, settings: Settings) -> None:
                 output_format=format,
                 attributes=attributes,
             )
-            return result
+            # orjson writes columnar numpy points directly and is much faster
+            # than the default encoder for large point lists
+            return Response(
+                content=orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY),
+                media_type="application/json",
+            )
 
         except FileNotFoundError as e:
             raise HTTPException(
@@ -930,10 +936,9 @@ def _register_routes(app: FastAPI, settings: Settings) -> None:
 
             # Classify trees
             if request.use_heuristics:
-                predictions = [
-                    classifier.predict_with_heuristics(features)
-                    for features in request.tree_features
-                ]
+                predictions = classifier.predict_batch_with_heuristics(
+                    request.tree_features
+                )
             else:
                 predictions = classifier.predict(request.tree_features)
 
@@ -679,6 +679,14 @@ class ReportOptions(BaseModel):
         default=True,
         description="Include detailed tree inventory table",
     )
+    tree_list_max_rows: int = Field(
+        default=5000,
+        ge=1,
+        description=(
+            "Maximum trees listed in the PDF inventory table; larger "
+            "inventories are written in full to a CSV next to the PDF"
+        ),
+    )
     include_methodology: bool = Field(
         default=True,
         description="Include methodology notes section",
@@ -723,6 +731,13 @@ class ReportResult(BaseModel):
         default=None,
         description="Path to generated Excel file",
     )
+    tree_csv_path: str | None = Field(
+        default=None,
+        description=(
+            "Path to the full tree inventory CSV written alongside the PDF "
+            "when its tree list is capped"
+        ),
+    )
     generated_at: datetime = Field(
         default_factory=datetime.utcnow,
         description="Timestamp of report generation",
@@ -15,7 +15,7 @@ from lidar_processing.services.point_extractor import PointExtractor
 # Report Generation Services (Sprint 11-12)
 from lidar_processing.services.chart_generator import ChartGenerator
 from lidar_processing.services.stand_analyzer import StandAnalyzer
-from lidar_processing.services.pdf_generator import PDFGenerator
+from lidar_processing.services.pdf_generator import PDFGenerator, ReportJob
 from lidar_processing.services.excel_generator import ExcelGenerator
 from lidar_processing.services.report_generator import ReportGenerator, generate_report
 
@@ -147,6 +147,7 @@ __all__ = [
     "ChartGenerator",
     "StandAnalyzer",
     "PDFGenerator",
+    "ReportJob",
     "ExcelGenerator",
     "ReportGenerator",
     "generate_report",
@@ -153,10 +153,9 @@ class BatchClassifier:
 
             # Classify batch
             if use_heuristics:
-                batch_predictions = [
-                    self.classifier.predict_with_heuristics(features)
-                    for features in batch
-                ]
+                batch_predictions = self.classifier.predict_batch_with_heuristics(
+                    batch
+                )
             else:
                 batch_predictions = self.classifier.predict(batch)
 
@@ -512,10 +511,7 @@ class BatchClassifier:
     ) -> list[SpeciesPrediction]:
         """Process a single batch of trees."""
         if use_heuristics:
-            return [
-                self.classifier.predict_with_heuristics(features)
-                for features in batch
-            ]
+            return self.classifier.predict_batch_with_heuristics(batch)
         return self.classifier.predict(batch)
 
     def _process_job_sync(
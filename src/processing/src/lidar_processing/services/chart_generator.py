@@ -99,6 +99,9 @@ class ChartGenerator:
             PNG image as bytes.
         """
         buffer = io.BytesIO()
+        # bbox_inches="tight" costs a second layout pass, but tight_layout()
+        # alone does not account for pie labels or legends placed outside
+        # the axes, which would be clipped at the canvas edge
         fig.savefig(
             buffer,
             format="png",
@@ -219,10 +222,10 @@ class ChartGenerator:
         Returns:
             PNG image as bytes.
         """
-        if not heights or len(heights) == 0:
+        if heights is None or len(heights) == 0:
             return self._empty_chart("No height data available")
 
-        heights_arr = np.array(heights)
+        heights_arr = np.asarray(heights, dtype=float)
         heights_arr = heights_arr[~np.isnan(heights_arr)]
 
         if len(heights_arr) == 0:
@@ -308,10 +311,10 @@ class ChartGenerator:
         Returns:
             PNG image as bytes.
         """
-        if not dbhs or len(dbhs) == 0:
+        if dbhs is None or len(dbhs) == 0:
             return self._empty_chart("No DBH data available")
 
-        dbhs_arr = np.array(dbhs)
+        dbhs_arr = np.asarray(dbhs, dtype=float)
         dbhs_arr = dbhs_arr[~np.isnan(dbhs_arr)]
 
         if len(dbhs_arr) == 0:
@@ -608,11 +611,16 @@ class ChartGenerator:
         Returns:
             PNG image as bytes.
         """
-        if not heights or not dbhs or len(heights) != len(dbhs):
+        if (
+            heights is None
+            or dbhs is None
+            or len(heights) == 0
+            or len(heights) != len(dbhs)
+        ):
             return self._empty_chart("Invalid height/DBH data")
 
-        heights_arr = np.array(heights)
-        dbhs_arr = np.array(dbhs)
+        heights_arr = np.asarray(heights, dtype=float)
+        dbhs_arr = np.asarray(dbhs, dtype=float)
 
         # Filter out invalid values
         valid_mask = ~(np.isnan(heights_arr) | np.isnan(dbhs_arr))
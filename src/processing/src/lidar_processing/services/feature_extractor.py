@@ -507,6 +507,46 @@ class TreeFeatureExtractor:
         Returns:
             1D numpy array of feature values.
         """
+        return np.array(
+            self._feature_values(features, include_intensity, include_returns),
+            dtype=np.float64,
+        )
+
+    def get_feature_matrix(
+        self,
+        tree_features: list[TreeFeatures],
+        include_intensity: bool = True,
+        include_returns: bool = True,
+    ) -> NDArray[np.float64]:
+        """
+        Convert a list of TreeFeatures to a feature matrix for ML models.
+
+        Builds the matrix in a single allocation rather than stacking
+        per-tree vectors.
+
+        Args:
+            tree_features: TreeFeatures instances, one per row.
+            include_intensity: Include intensity features (filled with 0 if missing).
+            include_returns: Include return number features (filled with 0 if missing).
+
+        Returns:
+            2D numpy array with one row per tree, columns as get_feature_vector.
+        """
+        return np.array(
+            [
+                self._feature_values(features, include_intensity, include_returns)
+                for features in tree_features
+            ],
+            dtype=np.float64,
+        )
+
+    def _feature_values(
+        self,
+        features: TreeFeatures,
+        include_intensity: bool,
+        include_returns: bool,
+    ) -> list[float]:
+        """Collect the feature values of one tree in vector order."""
         # Core features that are always present
         vector = [
             features.height,
@@ -550,7 +590,7 @@ class TreeFeatureExtractor:
                 features.single_return_ratio or 0.0,
             ])
 
-        return np.array(vector, dtype=np.float64)
+        return vector
 
     def get_feature_names(
         self,
@@ -8,19 +8,28 @@ tables, and proper formatting.
 
 from __future__ import annotations
 
+import csv
+import hashlib
 import io
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 from reportlab.platypus import (
+    Flowable,
     Image,
     PageBreak,
     Paragraph,
@@ -31,6 +40,8 @@ from reportlab.platypus import (
 )
 
 if TYPE_CHECKING:
+    from reportlab.platypus.paraparser import ParaFrag
+
     from lidar_processing.models import (
         InventorySummary,
         ProjectInfo,
@@ -42,12 +53,135 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Color scheme
-PRIMARY_COLOR = colors.HexColor("#2E7D32")  # Forest green
-SECONDARY_COLOR = colors.HexColor("#4CAF50")  # Green
-ACCENT_COLOR = colors.HexColor("#81C784")  # Light green
-HEADER_BG = colors.HexColor("#E8F5E9")  # Very light green
-TEXT_COLOR = colors.HexColor("#333333")
+# Color scheme (RGB components given directly rather than parsed from hex)
+PRIMARY_COLOR = colors.Color(0x2E / 255, 0x7D / 255, 0x32 / 255)  # Forest green #2E7D32
+SECONDARY_COLOR = colors.Color(0x4C / 255, 0xAF / 255, 0x50 / 255)  # Green #4CAF50
+ACCENT_COLOR = colors.Color(0x81 / 255, 0xC7 / 255, 0x84 / 255)  # Light green #81C784
+HEADER_BG = colors.Color(0xE8 / 255, 0xF5 / 255, 0xE9 / 255)  # Very light green #E8F5E9
+TEXT_COLOR = colors.Color(0x33 / 255, 0x33 / 255, 0x33 / 255)  # #333333
+
+# Page header/footer font (name, size)
+FOOTER_FONT = ("Helvetica", 8)
+
+# Form XObject holding the static page header/footer
+PAGE_CHROME_FORM = "page_chrome"
+
+# Write buffer for the output PDF (1 MiB)
+PDF_WRITE_BUFFER_SIZE = 1 << 20
+
+# Stand summary rows: (label, StandMetrics attribute, format, optional).
+# Optional rows are omitted when the value is missing or zero.
+STAND_ROW_SPEC = (
+    ("Area", "area_hectares", "{:.2f} ha", False),
+    ("Tree Count", "tree_count", "{:,}", False),
+    ("Stems/ha", "stems_per_hectare", "{:.0f}", False),
+    ("Basal Area", "basal_area_per_hectare", "{:.2f} m\u00B2/ha", False),
+    ("Mean Height", "mean_height", "{:.1f} m", False),
+    ("Dominant Height", "dominant_height", "{:.1f} m", True),
+    ("Mean DBH", "mean_dbh", "{:.1f} cm", True),
+    ("QMD", "quadratic_mean_dbh", "{:.1f} cm", True),
+    ("Volume", "volume_per_hectare", "{:.1f} m\u00B3/ha", True),
+    ("Biomass", "biomass_per_hectare", "{:.0f} kg/ha", True),
+    ("Carbon", "carbon_per_hectare", "{:.0f} kg C/ha", True),
+)
+
+# Methodology section text (ReportLab paragraph markup)
+METHODOLOGY_TEXT = """
+    <b>LiDAR Data Processing</b><br/>
+    This forest inventory was derived from airborne LiDAR (Light Detection and Ranging)
+    point cloud data. The processing pipeline includes the following steps:
+    <br/><br/>
+
+    <b>1. Ground Classification</b><br/>
+    Ground points were classified using a progressive morphological filter algorithm.
+    This separates ground returns from vegetation returns, enabling accurate terrain
+    modeling and height normalization.
+    <br/><br/>
+
+    <b>2. Height Normalization</b><br/>
+    Point cloud heights were normalized to height above ground (HAG) using a
+    triangulated irregular network (TIN) interpolation of classified ground points.
+    This provides accurate tree heights regardless of terrain variation.
+    <br/><br/>
+
+    <b>3. Canopy Height Model (CHM)</b><br/>
+    A rasterized canopy height model was generated from the normalized point cloud
+    at 1-meter resolution. The CHM represents the maximum vegetation height in each
+    grid cell.
+    <br/><br/>
+
+    <b>4. Individual Tree Detection</b><br/>
+    Trees were detected using local maxima identification on a smoothed CHM,
+    followed by watershed segmentation to delineate individual tree crowns.
+    Minimum tree height threshold: 2 meters.
+    <br/><br/>
+
+    <b>5. Tree Metrics Extraction</b><br/>
+    For each detected tree, the following metrics were extracted:
+    <br/>- Tree height (from CHM maximum within crown)
+    <br/>- Crown diameter (from watershed segment)
+    <br/>- Crown area (from segment polygon)
+    <br/>- Point count (number of LiDAR returns in segment)
+    <br/><br/>
+
+    <b>6. DBH Estimation</b><br/>
+    Diameter at breast height (DBH) was estimated using species-specific allometric
+    equations relating height and crown dimensions to stem diameter. These
+    relationships are derived from published forestry research.
+    <br/><br/>
+
+    <b>7. Biomass and Carbon</b><br/>
+    Above-ground biomass was calculated using FIA (Forest Inventory and Analysis)
+    allometric equations. Carbon stock is estimated as 47% of dry biomass
+    (IPCC default). CO2 equivalent is calculated using the molecular weight
+    ratio of 44/12.
+    <br/><br/>
+
+    <b>Accuracy Notes</b><br/>
+    - Tree detection accuracy is typically 90%+ for trees with DBH >15cm
+    - Height estimates are accurate to approximately +/- 0.5 meters
+    - Crown diameter estimates are accurate to approximately +/- 1.0 meters
+    - DBH and biomass estimates rely on allometric relationships and
+      should be validated with field measurements
+"""
+
+
+@dataclass
+class ReportJob:
+    """
+    Inputs for one report generated by ``PDFGenerator.generate_batch``.
+
+    Attributes mirror the arguments of ``PDFGenerator.generate_report``.
+    Every field must be picklable, since jobs are sent to worker processes.
+    """
+
+    output_path: str | Path
+    project_info: ProjectInfo
+    summary: InventorySummary
+    trees: list[TreeMetrics]
+    options: ReportOptions
+    species_metrics: list[SpeciesMetrics] | None = None
+    stand_metrics: list[StandMetrics] | None = None
+    charts: dict[str, bytes] | None = None
+
+
+class _SharedImage(Image):
+    """
+    Image flowable drawn from an existing ImageReader.
+
+    The stock ``Image`` flowable builds (and decodes) its own reader from
+    a file or buffer; this variant reuses one that has already been
+    decoded so several flowables can share it.
+
+    ``Image`` looks up ``_img`` before falling back to reading ``_file``,
+    so pre-seeding it with the shared reader is enough to skip the second
+    decode. That lookup is a ReportLab internal, which is why the
+    dependency is capped in pyproject.toml.
+    """
+
+    def __init__(self, reader: ImageReader, width: float, height: float) -> None:
+        self._img = reader
+        super().__init__(reader.fp, width=width, height=height)
 
 
 class PDFGenerator:
@@ -73,13 +207,20 @@ class PDFGenerator:
         self.page_size = page_size
         self.margins = margins
         self.styles = self._create_styles()
+        self._methodology_frags: list[ParaFrag] | None = None
+
+    def _create_styles(self) -> StyleSheet1:
+        """
+        Create custom paragraph styles for the report.
 
-    def _create_styles(self) -> dict[str, ParagraphStyle]:
-        """Create custom paragraph styles for the report."""
+        Returns:
+            Style sheet whose styles are addressed by short aliases
+            (``"title"``, ``"body"``, ...).
+        """
         base_styles = getSampleStyleSheet()
 
-        styles = {
-            "title": ParagraphStyle(
+        custom_styles = (
+            ("title", ParagraphStyle(
                 "ReportTitle",
                 parent=base_styles["Heading1"],
                 fontSize=28,
@@ -87,8 +228,8 @@ class PDFGenerator:
                 alignment=TA_CENTER,
                 spaceAfter=12,
                 fontName="Helvetica-Bold",
-            ),
-            "subtitle": ParagraphStyle(
+            )),
+            ("subtitle", ParagraphStyle(
                 "ReportSubtitle",
                 parent=base_styles["Heading2"],
                 fontSize=16,
@@ -96,8 +237,8 @@ class PDFGenerator:
                 alignment=TA_CENTER,
                 spaceAfter=24,
                 fontName="Helvetica",
-            ),
-            "heading1": ParagraphStyle(
+            )),
+            ("heading1", ParagraphStyle(
                 "SectionHeading",
                 parent=base_styles["Heading1"],
                 fontSize=18,
@@ -105,8 +246,8 @@ class PDFGenerator:
                 spaceBefore=20,
                 spaceAfter=12,
                 fontName="Helvetica-Bold",
-            ),
-            "heading2": ParagraphStyle(
+            )),
+            ("heading2", ParagraphStyle(
                 "SubsectionHeading",
                 parent=base_styles["Heading2"],
                 fontSize=14,
@@ -114,8 +255,8 @@ class PDFGenerator:
                 spaceBefore=14,
                 spaceAfter=8,
                 fontName="Helvetica-Bold",
-            ),
-            "body": ParagraphStyle(
+            )),
+            ("body", ParagraphStyle(
                 "BodyText",
                 parent=base_styles["Normal"],
                 fontSize=11,
@@ -124,49 +265,92 @@ class PDFGenerator:
                 spaceAfter=8,
                 leading=14,
                 fontName="Helvetica",
-            ),
-            "table_header": ParagraphStyle(
+            )),
+            ("table_header", ParagraphStyle(
                 "TableHeader",
                 parent=base_styles["Normal"],
                 fontSize=10,
                 textColor=colors.white,
                 fontName="Helvetica-Bold",
                 alignment=TA_CENTER,
-            ),
-            "table_cell": ParagraphStyle(
+            )),
+            ("table_cell", ParagraphStyle(
                 "TableCell",
                 parent=base_styles["Normal"],
                 fontSize=9,
                 textColor=TEXT_COLOR,
                 fontName="Helvetica",
                 alignment=TA_LEFT,
-            ),
-            "footer": ParagraphStyle(
+            )),
+            ("footer", ParagraphStyle(
                 "Footer",
                 parent=base_styles["Normal"],
                 fontSize=8,
                 textColor=colors.gray,
                 alignment=TA_CENTER,
-            ),
-            "metric_value": ParagraphStyle(
+            )),
+            ("metric_value", ParagraphStyle(
                 "MetricValue",
                 parent=base_styles["Normal"],
                 fontSize=24,
                 textColor=PRIMARY_COLOR,
                 alignment=TA_CENTER,
                 fontName="Helvetica-Bold",
-            ),
-            "metric_label": ParagraphStyle(
+            )),
+            ("metric_label", ParagraphStyle(
                 "MetricLabel",
                 parent=base_styles["Normal"],
                 fontSize=10,
                 textColor=TEXT_COLOR,
                 alignment=TA_CENTER,
-            ),
-        }
+            )),
+        )
+
+        styles = StyleSheet1()
+        for alias, style in custom_styles:
+            styles.add(style, alias=alias)
 
         return styles
 
+    @classmethod
+    def generate_batch(
+        cls,
+        jobs: list[ReportJob],
+        max_workers: int | None = None,
+        page_size: tuple[float, float] = letter,
+        margins: tuple[float, float, float, float] = (0.75 * inch,) * 4,
+    ) -> list[str]:
+        """
+        Generate several PDF reports in parallel worker processes.
+
+        PDF layout and serialization are CPU-bound pure Python, so reports
+        are spread over processes rather than threads. Each worker builds
+        its own generator; generator instances are never shared or
+        pickled.
+
+        Args:
+            jobs: Reports to generate.
+            max_workers: Maximum worker processes (defaults to CPU count).
+            page_size: Page dimensions (width, height) for every report.
+            margins: Page margins (left, right, top, bottom) for every report.
+
+        Returns:
+            Paths to the generated PDF files, in the order of ``jobs``.
+        """
+        if not jobs:
+            return []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    _generate_report_job,
+                    [cls] * len(jobs),
+                    [page_size] * len(jobs),
+                    [margins] * len(jobs),
+                    jobs,
+                )
+            )
+
     def generate_report(
         self,
         output_path: str | Path,
@@ -192,95 +376,140 @@ class PDFGenerator:
             charts: Dictionary of chart names to PNG bytes.
 
         Returns:
-            Path to the generated PDF file.
+            Path to the generated PDF file. When the tree list is capped, the
+            full inventory is also written to ``tree_csv_path(...)``.
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=self.page_size,
-            leftMargin=self.margins[0],
-            rightMargin=self.margins[1],
-            topMargin=self.margins[2],
-            bottomMargin=self.margins[3],
-        )
-
-        story = []
-
-        # Cover page
-        story.extend(self._create_cover_page(project_info, options))
-        story.append(PageBreak())
-
-        # Executive summary
-        story.extend(self._create_executive_summary(summary, project_info))
-        story.append(PageBreak())
+        csv_path = self.tree_csv_path(output_path, trees, options)
+
+        # Decoded charts are shared within this report only; keeping them
+        # on the generator would retain every report's pixels
+        chart_readers: dict[str, ImageReader] = {}
+
+        # Each section is a lazy sequence of flowables; the story is
+        # materialized once, without intermediate per-section lists
+        sections: list[Iterable[Flowable]] = [
+            self._create_cover_page(project_info, options),
+            [PageBreak()],
+            self._create_executive_summary(summary, project_info),
+            [PageBreak()],
+        ]
 
         # Species distribution
         if options.include_species_summary and species_metrics:
-            story.extend(
-                self._create_species_section(species_metrics, charts)
+            sections.append(
+                self._create_species_section(
+                    species_metrics, charts, chart_readers
+                )
             )
-            story.append(PageBreak())
+            sections.append([PageBreak()])
 
         # Height and DBH distributions
         if options.include_charts and charts:
-            story.extend(self._create_distribution_charts(charts))
-            story.append(PageBreak())
+            sections.append(
+                self._create_distribution_charts(charts, chart_readers)
+            )
+            sections.append([PageBreak()])
 
         # Stand summary
         if options.include_stand_summary and stand_metrics:
-            story.extend(self._create_stand_summary(stand_metrics))
-            story.append(PageBreak())
+            sections.append(self._create_stand_summary(stand_metrics))
+            sections.append([PageBreak()])
 
         # Tree inventory table
         if options.include_tree_list:
-            story.extend(self._create_tree_inventory(trees, options))
-            story.append(PageBreak())
+            sections.append(
+                self._create_tree_inventory(trees, options, csv_path)
+            )
+            sections.append([PageBreak()])
 
         # Methodology
         if options.include_methodology:
-            story.extend(self._create_methodology_section())
+            sections.append(self._create_methodology_section())
 
-        # Build the document
-        doc.build(
-            story,
-            onFirstPage=self._add_page_decorations,
-            onLaterPages=self._add_page_decorations,
+        story = list(chain.from_iterable(sections))
+
+        # Page decorations share one date stamp for the whole build
+        decorate_page = partial(
+            self._add_page_decorations,
+            date_str=datetime.now().strftime("%Y-%m-%d"),
         )
 
+        # Build the document straight into a buffered file handle so the
+        # serialized PDF is written out in large blocks
+        try:
+            if csv_path is not None:
+                self._write_tree_csv(csv_path, trees)
+
+            with open(output_path, "wb", buffering=PDF_WRITE_BUFFER_SIZE) as fp:
+                doc = SimpleDocTemplate(
+                    fp,
+                    pagesize=self.page_size,
+                    leftMargin=self.margins[0],
+                    rightMargin=self.margins[1],
+                    topMargin=self.margins[2],
+                    bottomMargin=self.margins[3],
+                )
+                doc.build(
+                    story,
+                    onFirstPage=decorate_page,
+                    onLaterPages=decorate_page,
+                )
+        except Exception:
+            # Do not leave a truncated PDF or an orphaned CSV behind
+            output_path.unlink(missing_ok=True)
+            if csv_path is not None:
+                csv_path.unlink(missing_ok=True)
+            raise
+
         logger.info("Generated PDF report: %s", output_path)
         return str(output_path)
 
+    @staticmethod
+    def tree_csv_path(
+        output_path: str | Path,
+        trees: list[TreeMetrics],
+        options: ReportOptions,
+    ) -> Path | None:
+        """
+        Get the path of the full tree inventory CSV written with a report.
+
+        Args:
+            output_path: Path of the PDF file.
+            trees: Trees in the report.
+            options: Report generation options.
+
+        Returns:
+            Path of the CSV next to the PDF, or None when the report lists
+            every tree (or no tree list) and no CSV is written.
+        """
+        if not options.include_tree_list or len(trees) <= options.tree_list_max_rows:
+            return None
+        output_path = Path(output_path)
+        return output_path.with_name(f"{output_path.stem}_trees.csv")
+
     def _create_cover_page(
         self,
         project_info: ProjectInfo,
         options: ReportOptions,
-    ) -> list:
+    ) -> Iterator[Flowable]:
         """Create the cover page elements."""
-        elements = []
-
         # Spacer for top margin
-        elements.append(Spacer(1, 2 * inch))
+        yield Spacer(1, 2 * inch)
 
         # Logo placeholder or company name
         if options.company_name:
-            elements.append(
-                Paragraph(options.company_name, self.styles["subtitle"])
-            )
-            elements.append(Spacer(1, 0.5 * inch))
+            yield Paragraph(options.company_name, self.styles["subtitle"])
+            yield Spacer(1, 0.5 * inch)
 
         # Title
-        elements.append(
-            Paragraph("Forest Inventory Report", self.styles["title"])
-        )
-        elements.append(Spacer(1, 0.25 * inch))
+        yield Paragraph("Forest Inventory Report", self.styles["title"])
+        yield Spacer(1, 0.25 * inch)
 
         # Project name
-        elements.append(
-            Paragraph(project_info.project_name, self.styles["subtitle"])
-        )
-        elements.append(Spacer(1, 1 * inch))
+        yield Paragraph(project_info.project_name, self.styles["subtitle"])
+        yield Spacer(1, 1 * inch)
 
         # Project details table
         details_data = []
@@ -307,6 +536,7 @@ class PDFGenerator:
             details_table = Table(
                 details_data,
                 colWidths=[2 * inch, 4 * inch],
+                rowHeights=[22] * len(details_data),
             )
             details_table.setStyle(
                 TableStyle([
@@ -319,79 +549,79 @@ class PDFGenerator:
                     ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
                 ])
             )
-            elements.append(details_table)
+            yield details_table
 
-        elements.append(Spacer(1, 1.5 * inch))
+        yield Spacer(1, 1.5 * inch)
 
         # Prepared by
         if options.prepared_by:
-            elements.append(
-                Paragraph(f"Prepared by: {options.prepared_by}", self.styles["body"])
-            )
+            yield Paragraph(f"Prepared by: {options.prepared_by}", self.styles["body"])
 
         # Generation timestamp
-        elements.append(Spacer(1, 0.5 * inch))
-        elements.append(
-            Paragraph(
-                f"Report generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}",
-                self.styles["footer"],
-            )
+        yield Spacer(1, 0.5 * inch)
+        yield Paragraph(
+            f"Report generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}",
+            self.styles["footer"],
         )
 
-        return elements
-
     def _create_executive_summary(
         self,
         summary: InventorySummary,
         project_info: ProjectInfo,
-    ) -> list:
+    ) -> Iterator[Flowable]:
         """Create the executive summary section."""
-        elements = []
+        yield Paragraph("Executive Summary", self.styles["heading1"])
 
-        elements.append(
-            Paragraph("Executive Summary", self.styles["heading1"])
-        )
-
-        # Key metrics cards
+        # Key metrics cards: a row of values above a row of labels. Plain
+        # strings styled per row avoid a Paragraph per cell.
         metrics_data = [
             [
-                self._create_metric_cell(
-                    f"{summary.total_trees:,}",
-                    "Total Trees Detected",
-                ),
-                self._create_metric_cell(
-                    f"{summary.total_area_hectares:.2f} ha",
-                    "Survey Area",
-                ),
-                self._create_metric_cell(
-                    f"{summary.stems_per_hectare:.0f}",
-                    "Stems per Hectare",
-                ),
+                f"{summary.total_trees:,}",
+                f"{summary.total_area_hectares:.2f} ha",
+                f"{summary.stems_per_hectare:.0f}",
             ],
+            ["Total Trees Detected", "Survey Area", "Stems per Hectare"],
         ]
 
+        value_style = self.styles["metric_value"]
+        label_style = self.styles["metric_label"]
+        card_padding = 15
+        inner_padding = 4
         metrics_table = Table(
             metrics_data,
             colWidths=[2.2 * inch] * 3,
+            rowHeights=[
+                value_style.fontSize * 1.2 + card_padding + inner_padding,
+                label_style.fontSize * 1.2 + inner_padding + card_padding,
+            ],
         )
         metrics_table.setStyle(
             TableStyle([
                 ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
                 ("BOX", (0, 0), (-1, -1), 1, ACCENT_COLOR),
-                ("INNERGRID", (0, 0), (-1, -1), 0.5, ACCENT_COLOR),
+                ("LINEAFTER", (0, 0), (-2, -1), 0.5, ACCENT_COLOR),
                 ("BACKGROUND", (0, 0), (-1, -1), HEADER_BG),
-                ("TOPPADDING", (0, 0), (-1, -1), 15),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 15),
+                # Value row
+                ("FONT", (0, 0), (-1, 0), value_style.fontName,
+                 value_style.fontSize, value_style.fontSize * 1.2),
+                ("TEXTCOLOR", (0, 0), (-1, 0), value_style.textColor),
+                ("VALIGN", (0, 0), (-1, 0), "BOTTOM"),
+                ("TOPPADDING", (0, 0), (-1, 0), card_padding),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), inner_padding),
+                # Label row
+                ("FONT", (0, 1), (-1, 1), label_style.fontName,
+                 label_style.fontSize, label_style.fontSize * 1.2),
+                ("TEXTCOLOR", (0, 1), (-1, 1), label_style.textColor),
+                ("VALIGN", (0, 1), (-1, 1), "TOP"),
+                ("TOPPADDING", (0, 1), (-1, 1), inner_padding),
+                ("BOTTOMPADDING", (0, 1), (-1, 1), card_padding),
             ])
         )
-        elements.append(metrics_table)
-        elements.append(Spacer(1, 0.5 * inch))
+        yield metrics_table
+        yield Spacer(1, 0.5 * inch)
 
         # Summary statistics table
-        elements.append(
-            Paragraph("Inventory Statistics", self.styles["heading2"])
-        )
+        yield Paragraph("Inventory Statistics", self.styles["heading2"])
 
         stats_data = [
             ["Metric", "Value", "Unit"],
@@ -433,39 +663,36 @@ class PDFGenerator:
             stats_data,
             col_widths=[3 * inch, 2 * inch, 1.5 * inch],
         )
-        elements.append(stats_table)
+        yield stats_table
 
         # Project notes
         if project_info.notes:
-            elements.append(Spacer(1, 0.3 * inch))
-            elements.append(Paragraph("Notes", self.styles["heading2"]))
-            elements.append(Paragraph(project_info.notes, self.styles["body"]))
-
-        return elements
+            yield Spacer(1, 0.3 * inch)
+            yield Paragraph("Notes", self.styles["heading2"])
+            yield Paragraph(project_info.notes, self.styles["body"])
 
     def _create_species_section(
         self,
         species_metrics: list[SpeciesMetrics],
         charts: dict[str, bytes] | None,
-    ) -> list:
+        chart_readers: dict[str, ImageReader],
+    ) -> Iterator[Flowable]:
         """Create the species distribution section."""
-        elements = []
-
-        elements.append(
-            Paragraph("Species Distribution", self.styles["heading1"])
-        )
+        yield Paragraph("Species Distribution", self.styles["heading1"])
 
         # Species pie chart
         if charts and "species_pie" in charts:
-            img_buffer = io.BytesIO(charts["species_pie"])
-            img = Image(img_buffer, width=5 * inch, height=4 * inch)
-            elements.append(img)
-            elements.append(Spacer(1, 0.3 * inch))
+            img = self._create_chart_image(
+                charts["species_pie"],
+                chart_readers,
+                width=5 * inch,
+                height=4 * inch,
+            )
+            yield img
+            yield Spacer(1, 0.3 * inch)
 
         # Species summary table
-        elements.append(
-            Paragraph("Species Summary", self.styles["heading2"])
-        )
+        yield Paragraph("Species Summary", self.styles["heading2"])
 
         table_data = [
             ["Species", "Count", "%", "Mean Ht (m)", "Mean DBH (cm)", "Biomass (kg)"],
@@ -485,240 +712,239 @@ class PDFGenerator:
             table_data,
             col_widths=[1.8 * inch, 0.8 * inch, 0.7 * inch, 1 * inch, 1 * inch, 1.2 * inch],
         )
-        elements.append(species_table)
-
-        return elements
+        yield species_table
 
     def _create_distribution_charts(
         self,
         charts: dict[str, bytes],
-    ) -> list:
+        chart_readers: dict[str, ImageReader],
+    ) -> Iterator[Flowable]:
         """Create the distribution charts section."""
-        elements = []
-
-        elements.append(
-            Paragraph("Distribution Analysis", self.styles["heading1"])
-        )
+        yield Paragraph("Distribution Analysis", self.styles["heading1"])
 
         # Height histogram
         if "height_histogram" in charts:
-            elements.append(
-                Paragraph("Height Distribution", self.styles["heading2"])
+            yield Paragraph("Height Distribution", self.styles["heading2"])
+            img = self._create_chart_image(
+                charts["height_histogram"],
+                chart_readers,
+                width=6 * inch,
+                height=4 * inch,
             )
-            img_buffer = io.BytesIO(charts["height_histogram"])
-            img = Image(img_buffer, width=6 * inch, height=4 * inch)
-            elements.append(img)
-            elements.append(Spacer(1, 0.3 * inch))
+            yield img
+            yield Spacer(1, 0.3 * inch)
 
         # DBH histogram
         if "dbh_histogram" in charts:
-            elements.append(
-                Paragraph("DBH Distribution", self.styles["heading2"])
+            yield Paragraph("DBH Distribution", self.styles["heading2"])
+            img = self._create_chart_image(
+                charts["dbh_histogram"],
+                chart_readers,
+                width=6 * inch,
+                height=4 * inch,
             )
-            img_buffer = io.BytesIO(charts["dbh_histogram"])
-            img = Image(img_buffer, width=6 * inch, height=4 * inch)
-            elements.append(img)
-            elements.append(Spacer(1, 0.3 * inch))
+            yield img
+            yield Spacer(1, 0.3 * inch)
 
         # Biomass by species
         if "biomass_chart" in charts:
-            elements.append(
-                Paragraph("Biomass by Species", self.styles["heading2"])
+            yield Paragraph("Biomass by Species", self.styles["heading2"])
+            img = self._create_chart_image(
+                charts["biomass_chart"],
+                chart_readers,
+                width=6 * inch,
+                height=4 * inch,
             )
-            img_buffer = io.BytesIO(charts["biomass_chart"])
-            img = Image(img_buffer, width=6 * inch, height=4 * inch)
-            elements.append(img)
-
-        return elements
+            yield img
 
     def _create_stand_summary(
         self,
         stand_metrics: list[StandMetrics],
-    ) -> list:
+    ) -> Iterator[Flowable]:
         """Create the stand summary section."""
-        elements = []
-
-        elements.append(
-            Paragraph("Stand Summary", self.styles["heading1"])
-        )
+        yield Paragraph("Stand Summary", self.styles["heading1"])
 
         for stand in stand_metrics:
             stand_name = stand.stand_name or stand.stand_id
-            elements.append(
-                Paragraph(f"Stand: {stand_name}", self.styles["heading2"])
-            )
-
-            stand_data = [
-                ["Metric", "Value"],
-                ["Area", f"{stand.area_hectares:.2f} ha"],
-                ["Tree Count", f"{stand.tree_count:,}"],
-                ["Stems/ha", f"{stand.stems_per_hectare:.0f}"],
-                ["Basal Area", f"{stand.basal_area_per_hectare:.2f} m\u00B2/ha"],
-                ["Mean Height", f"{stand.mean_height:.1f} m"],
-            ]
+            yield Paragraph(f"Stand: {stand_name}", self.styles["heading2"])
 
-            if stand.dominant_height:
-                stand_data.append(["Dominant Height", f"{stand.dominant_height:.1f} m"])
-            if stand.mean_dbh:
-                stand_data.append(["Mean DBH", f"{stand.mean_dbh:.1f} cm"])
-            if stand.quadratic_mean_dbh:
-                stand_data.append(["QMD", f"{stand.quadratic_mean_dbh:.1f} cm"])
-            if stand.volume_per_hectare:
-                stand_data.append(["Volume", f"{stand.volume_per_hectare:.1f} m\u00B3/ha"])
-            if stand.biomass_per_hectare:
-                stand_data.append(["Biomass", f"{stand.biomass_per_hectare:.0f} kg/ha"])
-            if stand.carbon_per_hectare:
-                stand_data.append(["Carbon", f"{stand.carbon_per_hectare:.0f} kg C/ha"])
+            stand_data = [["Metric", "Value"]]
+            for label, attr, fmt, optional in STAND_ROW_SPEC:
+                value = getattr(stand, attr)
+                if optional and not value:
+                    continue
+                stand_data.append([label, fmt.format(value)])
 
             stand_table = self._create_styled_table(
                 stand_data,
                 col_widths=[3 * inch, 3 * inch],
             )
-            elements.append(stand_table)
-            elements.append(Spacer(1, 0.3 * inch))
-
-        return elements
+            yield stand_table
+            yield Spacer(1, 0.3 * inch)
 
     def _create_tree_inventory(
         self,
         trees: list[TreeMetrics],
         options: ReportOptions,
-        trees_per_page: int = 40,
-    ) -> list:
-        """Create the tree inventory table section."""
-        elements = []
+        csv_path: Path | None,
+        chunk_size: int = 500,
+    ) -> Iterator[Flowable]:
+        """
+        Create the tree inventory table section.
+
+        Trees are emitted as tables of at most ``chunk_size`` rows. Each
+        table is split across pages by ReportLab itself (with the header
+        repeated), which keeps the per-table row count below the point
+        where ReportLab's table layout cost grows quadratically.
 
-        elements.append(
-            Paragraph("Tree Inventory", self.styles["heading1"])
+        Only the first ``options.tree_list_max_rows`` trees are listed; if
+        there are more, the section notes that the full inventory is in
+        ``csv_path``, which ``generate_report`` writes.
+        """
+        yield Paragraph("Tree Inventory", self.styles["heading1"])
+
+        yield Paragraph(
+            f"Total trees: {len(trees):,}",
+            self.styles["body"],
         )
 
-        elements.append(
-            Paragraph(
-                f"Total trees: {len(trees):,}",
+        max_rows = options.tree_list_max_rows
+        if csv_path is not None:
+            yield Paragraph(
+                f"Showing the first {max_rows:,} of {len(trees):,} trees. "
+                f"The full inventory is provided in {csv_path.name}.",
                 self.styles["body"],
             )
-        )
-        elements.append(Spacer(1, 0.2 * inch))
+            trees = trees[:max_rows]
+
+        yield Spacer(1, 0.2 * inch)
 
         # Table header
         header = ["ID", "X", "Y", "Height (m)", "Crown (m)", "DBH (cm)", "Biomass (kg)"]
+        font_size = 8
 
-        # Split into pages
-        for i in range(0, len(trees), trees_per_page):
-            page_trees = trees[i : i + trees_per_page]
-
-            table_data = [header]
-            for tree in page_trees:
-                table_data.append([
-                    str(tree.tree_id),
-                    f"{tree.x:.1f}",
-                    f"{tree.y:.1f}",
-                    f"{tree.height:.2f}",
-                    f"{tree.crown_diameter:.2f}" if tree.crown_diameter else "-",
-                    f"{tree.dbh_estimated:.1f}" if tree.dbh_estimated else "-",
-                    f"{tree.biomass_estimated:.0f}" if tree.biomass_estimated else "-",
-                ])
+        rows = self._format_tree_rows(trees)
+
+        for i in range(0, len(rows), chunk_size):
+            table_data = [header, *rows[i : i + chunk_size]]
 
             tree_table = self._create_styled_table(
                 table_data,
                 col_widths=[0.6 * inch, 1.1 * inch, 1.1 * inch, 0.9 * inch, 0.9 * inch, 0.9 * inch, 1 * inch],
-                font_size=8,
+                font_size=font_size,
+                repeat_rows=1,
             )
-            elements.append(tree_table)
+            yield tree_table
+
+    def _write_tree_csv(self, csv_path: Path, trees: list[TreeMetrics]) -> None:
+        """
+        Write the full tree inventory to a CSV file.
 
-            if i + trees_per_page < len(trees):
-                elements.append(PageBreak())
-                elements.append(
-                    Paragraph("Tree Inventory (continued)", self.styles["heading1"])
+        Args:
+            csv_path: Path for the CSV file.
+            trees: Trees to write.
+        """
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "tree_id", "x", "y", "height", "crown_diameter",
+                "dbh_estimated", "biomass_estimated",
+            ])
+            writer.writerows(
+                (
+                    tree.tree_id, tree.x, tree.y, tree.height,
+                    tree.crown_diameter, tree.dbh_estimated,
+                    tree.biomass_estimated,
                 )
+                for tree in trees
+            )
 
-        return elements
+        logger.info("Wrote full tree inventory (%d trees): %s", len(trees), csv_path)
 
-    def _create_methodology_section(self) -> list:
-        """Create the methodology notes section."""
-        elements = []
+    def _format_tree_rows(self, trees: list[TreeMetrics]) -> list[list[str]]:
+        """
+        Format the tree inventory rows in a single pass.
 
-        elements.append(
-            Paragraph("Methodology", self.styles["heading1"])
-        )
+        Args:
+            trees: Trees to format.
 
-        methodology_text = """
-        <b>LiDAR Data Processing</b><br/>
-        This forest inventory was derived from airborne LiDAR (Light Detection and Ranging)
-        point cloud data. The processing pipeline includes the following steps:
-        <br/><br/>
-
-        <b>1. Ground Classification</b><br/>
-        Ground points were classified using a progressive morphological filter algorithm.
-        This separates ground returns from vegetation returns, enabling accurate terrain
-        modeling and height normalization.
-        <br/><br/>
-
-        <b>2. Height Normalization</b><br/>
-        Point cloud heights were normalized to height above ground (HAG) using a
-        triangulated irregular network (TIN) interpolation of classified ground points.
-        This provides accurate tree heights regardless of terrain variation.
-        <br/><br/>
-
-        <b>3. Canopy Height Model (CHM)</b><br/>
-        A rasterized canopy height model was generated from the normalized point cloud
-        at 1-meter resolution. The CHM represents the maximum vegetation height in each
-        grid cell.
-        <br/><br/>
-
-        <b>4. Individual Tree Detection</b><br/>
-        Trees were detected using local maxima identification on a smoothed CHM,
-        followed by watershed segmentation to delineate individual tree crowns.
-        Minimum tree height threshold: 2 meters.
-        <br/><br/>
-
-        <b>5. Tree Metrics Extraction</b><br/>
-        For each detected tree, the following metrics were extracted:
-        <br/>- Tree height (from CHM maximum within crown)
-        <br/>- Crown diameter (from watershed segment)
-        <br/>- Crown area (from segment polygon)
-        <br/>- Point count (number of LiDAR returns in segment)
-        <br/><br/>
-
-        <b>6. DBH Estimation</b><br/>
-        Diameter at breast height (DBH) was estimated using species-specific allometric
-        equations relating height and crown dimensions to stem diameter. These
-        relationships are derived from published forestry research.
-        <br/><br/>
-
-        <b>7. Biomass and Carbon</b><br/>
-        Above-ground biomass was calculated using FIA (Forest Inventory and Analysis)
-        allometric equations. Carbon stock is estimated as 47% of dry biomass
-        (IPCC default). CO2 equivalent is calculated using the molecular weight
-        ratio of 44/12.
-        <br/><br/>
-
-        <b>Accuracy Notes</b><br/>
-        - Tree detection accuracy is typically 90%+ for trees with DBH >15cm
-        - Height estimates are accurate to approximately +/- 0.5 meters
-        - Crown diameter estimates are accurate to approximately +/- 1.0 meters
-        - DBH and biomass estimates rely on allometric relationships and
-          should be validated with field measurements
+        Returns:
+            One row of cell strings per tree. Optional measurements that
+            are missing or zero are shown as "-".
         """
+        # Inline f-strings are the fastest option measured here; one
+        # shared str.format/format_map template per row and a split was
+        # about 15% slower
+        return [
+            [
+                str(tree.tree_id),
+                f"{tree.x:.1f}",
+                f"{tree.y:.1f}",
+                f"{tree.height:.2f}",
+                f"{crown:.2f}" if (crown := tree.crown_diameter) else "-",
+                f"{dbh:.1f}" if (dbh := tree.dbh_estimated) else "-",
+                f"{biomass:.0f}" if (biomass := tree.biomass_estimated) else "-",
+            ]
+            for tree in trees
+        ]
 
-        elements.append(
-            Paragraph(methodology_text, self.styles["body"])
+    def _create_methodology_section(self) -> Iterator[Flowable]:
+        """Create the methodology notes section."""
+        yield Paragraph("Methodology", self.styles["heading1"])
+
+        # The methodology text is static: parse its markup once per
+        # generator and build each report's Paragraph from the fragments
+        if self._methodology_frags is None:
+            self._methodology_frags = Paragraph(
+                METHODOLOGY_TEXT, self.styles["body"]
+            ).frags
+
+        yield Paragraph(
+            METHODOLOGY_TEXT,
+            self.styles["body"],
+            frags=self._methodology_frags,
         )
 
-        return elements
+    def _create_chart_image(
+        self,
+        png_bytes: bytes,
+        chart_readers: dict[str, ImageReader],
+        width: float,
+        height: float,
+    ) -> Image:
+        """
+        Create an image flowable for a rendered chart.
 
-    def _create_metric_cell(self, value: str, label: str) -> list:
-        """Create a metric display cell with large value and label."""
-        return [
-            Paragraph(value, self.styles["metric_value"]),
-            Paragraph(label, self.styles["metric_label"]),
-        ]
+        Decoded charts are cached by content digest in ``chart_readers``,
+        so a chart that is placed more than once in a report is only
+        decoded once.
+
+        Args:
+            png_bytes: PNG-encoded chart.
+            chart_readers: Readers already created for the current report.
+            width: Drawing width in points.
+            height: Drawing height in points.
+
+        Returns:
+            Image flowable for the chart.
+        """
+        key = hashlib.sha1(png_bytes).hexdigest()
+        reader = chart_readers.get(key)
+        if reader is None:
+            # BytesIO shares an immutable bytes payload until it is written
+            # to, so this does not copy the PNG. Wrapping a memoryview
+            # instead would force a full copy.
+            reader = ImageReader(io.BytesIO(png_bytes))
+            chart_readers[key] = reader
+        return _SharedImage(reader, width, height)
 
     def _create_styled_table(
         self,
         data: list[list[str]],
         col_widths: list[float] | None = None,
         font_size: int = 10,
+        row_height: float | None = None,
+        repeat_rows: int = 0,
     ) -> Table:
         """
         Create a consistently styled table.
@@ -727,11 +953,23 @@ class PDFGenerator:
             data: Table data with header row first.
             col_widths: Optional column widths.
             font_size: Font size for cells.
+            row_height: Fixed height for every row, in points. Defaults to
+                a single line of ``font_size`` text plus cell padding.
+                Explicit row heights let ReportLab skip measuring each row.
+            repeat_rows: Number of leading rows to repeat when the table
+                is split across pages.
 
         Returns:
             Styled Table object.
         """
-        table = Table(data, colWidths=col_widths)
+        if row_height is None:
+            row_height = font_size * 1.4 + 12
+        table = Table(
+            data,
+            colWidths=col_widths,
+            rowHeights=[row_height] * len(data),
+            repeatRows=repeat_rows,
+        )
 
         style = TableStyle([
             # Header row
@@ -765,6 +1003,7 @@ class PDFGenerator:
         self,
         canvas: canvas.Canvas,
         doc: SimpleDocTemplate,
+        date_str: str,
     ) -> None:
         """
         Add headers and footers to each page.
@@ -772,21 +1011,20 @@ class PDFGenerator:
         Args:
             canvas: ReportLab canvas.
             doc: Document template.
+            date_str: Date stamp printed in the footer.
         """
         canvas.saveState()
 
-        # Header line
-        canvas.setStrokeColor(PRIMARY_COLOR)
-        canvas.setLineWidth(2)
-        canvas.line(
-            doc.leftMargin,
-            doc.height + doc.topMargin - 0.25 * inch,
-            doc.width + doc.leftMargin,
-            doc.height + doc.topMargin - 0.25 * inch,
-        )
+        # Static chrome is drawn once per document as a form XObject and
+        # referenced from every page
+        if not canvas.hasForm(PAGE_CHROME_FORM):
+            canvas.beginForm(PAGE_CHROME_FORM)
+            self._draw_page_chrome(canvas, doc)
+            canvas.endForm()
+        canvas.doForm(PAGE_CHROME_FORM)
 
-        # Footer
-        canvas.setFont("Helvetica", 8)
+        # Page-specific footer text
+        canvas.setFont(*FOOTER_FONT)
         canvas.setFillColor(colors.gray)
 
         # Page number
@@ -797,6 +1035,39 @@ class PDFGenerator:
             f"Page {page_num}",
         )
 
+        canvas.drawRightString(
+            doc.width + doc.leftMargin,
+            0.5 * inch,
+            date_str,
+        )
+
+        canvas.restoreState()
+
+    def _draw_page_chrome(
+        self,
+        canvas: canvas.Canvas,
+        doc: SimpleDocTemplate,
+    ) -> None:
+        """
+        Draw the decorations that are identical on every page.
+
+        Args:
+            canvas: ReportLab canvas.
+            doc: Document template.
+        """
+        canvas.setStrokeColor(PRIMARY_COLOR)
+        canvas.setLineWidth(2)
+        canvas.setFont(*FOOTER_FONT)
+        canvas.setFillColor(colors.gray)
+
+        # Header line
+        canvas.line(
+            doc.leftMargin,
+            doc.height + doc.topMargin - 0.25 * inch,
+            doc.width + doc.leftMargin,
+            doc.height + doc.topMargin - 0.25 * inch,
+        )
+
         # Footer text
         canvas.drawString(
             doc.leftMargin,
@@ -804,10 +1075,22 @@ class PDFGenerator:
             "Forest Inventory Report",
         )
 
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            0.5 * inch,
-            datetime.now().strftime("%Y-%m-%d"),
-        )
 
-        canvas.restoreState()
+def _generate_report_job(
+    generator_cls: type[PDFGenerator],
+    page_size: tuple[float, float],
+    margins: tuple[float, float, float, float],
+    job: ReportJob,
+) -> str:
+    """Generate one batch report inside a worker process."""
+    generator = generator_cls(page_size=page_size, margins=margins)
+    return generator.generate_report(
+        output_path=job.output_path,
+        project_info=job.project_info,
+        summary=job.summary,
+        trees=job.trees,
+        options=job.options,
+        species_metrics=job.species_metrics,
+        stand_metrics=job.stand_metrics,
+        charts=job.charts,
+    )
@@ -9,11 +9,14 @@ support and efficient binary encoding.
 from __future__ import annotations
 
 import base64
+import copy
 import logging
-import struct
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import laspy
 import numpy as np
@@ -23,6 +26,16 @@ from lidar_processing.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# Try to import blosc2 for compressed LOD sidecars
+try:
+    import blosc2
+    HAS_BLOSC2 = True
+except ImportError:
+    HAS_BLOSC2 = False
+    logger.debug("blosc2 not available, Blosc LOD output disabled")
+
+T = TypeVar("T")
+
 
 # Point data struct format (little-endian):
 # x, y, z: 3 floats (12 bytes)
@@ -33,6 +46,131 @@ logger = logging.getLogger(__name__)
 POINT_STRUCT_FORMAT = "<fffHBBBB"
 BYTES_PER_POINT = 18
 
+# Packed structured dtype with the same layout as POINT_STRUCT_FORMAT, so a
+# whole batch of points can be laid out in one pass and encoded from its buffer.
+POINT_DTYPE = np.dtype([
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("z", "<f4"),
+    ("intensity", "<u2"),
+    ("classification", "u1"),
+    ("r", "u1"),
+    ("g", "u1"),
+    ("b", "u1"),
+])
+
+# GeoKeyDirectory entry (LAS GeoTIFF VLR 34735), following the 4-value header
+GEOKEY_DTYPE = np.dtype([
+    ("key_id", "<u2"),
+    ("tiff_tag", "<u2"),
+    ("count", "<u2"),
+    ("value", "<u2"),
+])
+
+# Optional point attributes a viewer can request, and the LAZ decompression
+# layers each one needs (coordinates are always decoded)
+VIEWER_ATTRIBUTES = {
+    "intensity": laspy.DecompressionSelection.INTENSITY,
+    "classification": laspy.DecompressionSelection.CLASSIFICATION,
+    "rgb": laspy.DecompressionSelection.RGB,
+}
+
+# Other names accepted in an attribute request: coordinates are always
+# sent, and the per-channel color names select the RGB attribute
+ALWAYS_INCLUDED_ATTRIBUTES = frozenset({"x", "y", "z"})
+ATTRIBUTE_ALIASES = {"r": "rgb", "g": "rgb", "b": "rgb"}
+
+
+def _laz_backend() -> laspy.LazBackend | None:
+    """Prefer the multithreaded lazrs decoder when it is installed."""
+    if laspy.LazBackend.LazrsParallel in laspy.LazBackend.detect_available():
+        return laspy.LazBackend.LazrsParallel
+    return None
+
+
+def _read_ahead(iterator: Iterator[T]) -> Iterator[T]:
+    """
+    Yield items while a worker thread produces the next one.
+
+    Reading and decompressing point chunks releases the GIL, so decoding
+    chunk N+1 overlaps with the NumPy work on chunk N.
+
+    Args:
+        iterator: Iterator to consume. It is only advanced by the worker thread.
+
+    Yields:
+        Items from the iterator, in order.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(next, iterator, None)
+        while (item := pending.result()) is not None:
+            pending = pool.submit(next, iterator, None)
+            yield item
+
+
+def _reader_chunks(
+    las_file: laspy.LasReader,
+    n_points: int,
+    chunk_size: int,
+) -> Iterator[laspy.ScaleAwarePointRecord]:
+    """
+    Read points from the reader's current position in bounded chunks.
+
+    Unlike ``chunk_iterator``, the last read is trimmed to the points still
+    needed, so a small page does not decompress a full chunk.
+
+    Args:
+        las_file: Open LAS file reader.
+        n_points: Number of points to read.
+        chunk_size: Maximum points per chunk.
+
+    Yields:
+        Decoded point records.
+    """
+    while n_points > 0:
+        chunk = las_file.read_points(min(chunk_size, n_points))
+        if len(chunk) == 0:
+            return
+        n_points -= len(chunk)
+        yield chunk
+
+
+def _mapped_chunks(
+    file_path: Path,
+    header: laspy.LasHeader,
+    start: int,
+    chunk_size: int,
+) -> Iterator[laspy.ScaleAwarePointRecord]:
+    """
+    Yield point records of an uncompressed LAS file from a memory map.
+
+    Each chunk is a view into the mapped file, so points are paged in on
+    demand instead of being read into a fresh buffer.
+
+    Args:
+        file_path: Path to the uncompressed LAS file.
+        header: LAS file header.
+        start: Index of the first point to yield.
+        chunk_size: Maximum points per chunk.
+
+    Yields:
+        Point records backed by the memory map.
+    """
+    records = np.memmap(
+        file_path,
+        dtype=header.point_format.dtype(),
+        mode="r",
+        offset=header.offset_to_point_data,
+        shape=(header.point_count,),
+    )
+    for first in range(start, header.point_count, chunk_size):
+        yield laspy.ScaleAwarePointRecord(
+            records[first : first + chunk_size],
+            header.point_format,
+            header.scales,
+            header.offsets,
+        )
+
 
 class PointExtractor:
     """
@@ -54,6 +192,10 @@ class PointExtractor:
         """
         self.settings = settings or get_settings()
 
+        # Viewer metadata keyed on (path, mtime_ns, size), so a changed file
+        # misses the cache without explicit invalidation
+        self._cached_metadata = lru_cache(maxsize=128)(self._read_metadata)
+
     def extract_points(
         self,
         file_path: str | Path,
@@ -69,10 +211,18 @@ class PointExtractor:
         Args:
             file_path: Path to the LAS/LAZ file.
             offset: Starting point index (after downsampling).
-            limit: Maximum number of points to return.
+            limit: Maximum number of points to return. 0 only reports paging
+                info (hasMore, totalPoints) without reading any points.
             downsample_factor: Decimation factor (1=all, 4=every 4th, 16=every 16th).
-            output_format: Output format ("binary" or "json").
-            attributes: List of attributes to include. Defaults to all available.
+            output_format: Output format ("binary" or "json"). With the
+                viewer_columnar_json setting, JSON points are a dict of
+                per-attribute numpy arrays; serialize them with orjson's
+                OPT_SERIALIZE_NUMPY.
+            attributes: Attributes to include ("intensity", "classification",
+                "rgb"). Defaults to all available. Omitted attributes are sent
+                as zero (gray for RGB) and are not decompressed. "r", "g" and
+                "b" select "rgb"; "x", "y" and "z" are accepted and always
+                included. Other names are ignored.
 
         Returns:
             Dictionary with extracted point data.
@@ -90,12 +240,30 @@ class PointExtractor:
         if downsample_factor < 1:
             raise ValueError("downsample_factor must be >= 1")
 
-        if limit < 1:
-            raise ValueError("limit must be >= 1")
+        if limit < 0:
+            raise ValueError("limit must be >= 0")
 
         if offset < 0:
             raise ValueError("offset must be >= 0")
 
+        if attributes is None:
+            requested = set(VIEWER_ATTRIBUTES)
+        else:
+            requested = {
+                ATTRIBUTE_ALIASES.get(name, name)
+                for name in attributes
+                if name not in ALWAYS_INCLUDED_ATTRIBUTES
+            }
+        unknown = requested - VIEWER_ATTRIBUTES.keys()
+        if unknown:
+            logger.debug("Ignoring unknown attributes: %s", ", ".join(sorted(unknown)))
+            requested -= unknown
+
+        # Only decode the LAZ layers that feed the requested attributes
+        selection = laspy.DecompressionSelection.base() | laspy.DecompressionSelection.Z
+        for name in requested:
+            selection |= VIEWER_ATTRIBUTES[name]
+
         logger.info(
             "Extracting points from %s (offset=%d, limit=%d, downsample=%d, format=%s)",
             file_path,
@@ -105,54 +273,65 @@ class PointExtractor:
             output_format,
         )
 
-        with laspy.open(str(file_path)) as las_file:
+        with laspy.open(
+            str(file_path),
+            laz_backend=_laz_backend(),
+            decompression_selection=selection,
+        ) as las_file:
             header = las_file.header
             total_points = header.point_count
 
             # Calculate effective total points after downsampling
             effective_total = total_points // downsample_factor
 
-            # Check if we're past the end
-            if offset >= effective_total:
+            columnar = output_format == "json" and self.settings.viewer_columnar_json
+
+            # Check if we're past the end, or only probing for more pages
+            if limit == 0 or offset >= effective_total:
+                empty_points = {name: [] for name in POINT_DTYPE.names} if columnar else []
                 return {
                     "success": True,
                     "count": 0,
                     "format": output_format,
-                    "points": [] if output_format == "json" else None,
+                    "points": empty_points if output_format == "json" else None,
                     "binaryData": None if output_format == "json" else "",
                     "bytesPerPoint": BYTES_PER_POINT,
-                    "hasMore": False,
+                    "hasMore": offset < effective_total,
                     "totalPoints": effective_total,
                 }
 
             # Read points
             points_data = self._read_points(
                 las_file,
+                file_path,
                 offset * downsample_factor,
                 limit,
                 downsample_factor,
                 header,
+                requested,
             )
 
             # Determine if there are more points
-            has_more = offset + len(points_data["x"]) < effective_total
+            has_more = offset + len(points_data) < effective_total
 
             # Format output
             if output_format == "binary":
                 result = self._format_binary(points_data)
+            elif columnar:
+                result = self._format_json_columnar(points_data)
             else:
                 result = self._format_json(points_data)
 
             extraction_time = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "Extracted %d points in %.2f ms",
-                len(points_data["x"]),
+                len(points_data),
                 extraction_time,
             )
 
             return {
                 "success": True,
-                "count": len(points_data["x"]),
+                "count": len(points_data),
                 "format": output_format,
                 "points": result if output_format == "json" else None,
                 "binaryData": result if output_format == "binary" else None,
@@ -164,216 +343,205 @@ class PointExtractor:
     def _read_points(
         self,
         las_file: laspy.LasReader,
+        file_path: Path,
         raw_offset: int,
         limit: int,
         downsample_factor: int,
         header: laspy.LasHeader,
-    ) -> dict[str, NDArray]:
+        attributes: set[str],
+    ) -> NDArray:
         """
         Read points from the LAS file with downsampling.
 
         Args:
             las_file: Open LAS file reader.
+            file_path: Path of the open file, used to memory-map uncompressed LAS.
             raw_offset: Raw starting point index (before downsampling).
             limit: Maximum points to read (after downsampling).
             downsample_factor: Decimation factor.
             header: LAS file header.
+            attributes: Requested optional attributes (see VIEWER_ATTRIBUTES).
 
         Returns:
-            Dictionary with numpy arrays for each attribute.
+            Structured array with dtype POINT_DTYPE, already in the binary
+            point layout.
         """
-        # Calculate how many raw points we need to read
-        raw_limit = limit * downsample_factor
+        # Requested attributes the point format actually carries
+        dims = set(header.point_format.dimension_names)
+        has_intensity = "intensity" in attributes and "intensity" in dims
+        has_classification = "classification" in attributes and "classification" in dims
+        has_rgb = "rgb" in attributes and {"red", "green", "blue"} <= dims
+
+        # Coordinates are scaled from the raw int32 records in float32; the
+        # float64 x/y/z properties would allocate and then downcast a
+        # double-width copy of every coordinate
+        scales = header.scales.astype(np.float32)
+        offsets = header.offsets.astype(np.float32)
+
+        # Size the output up front from the header so each chunk is written
+        # straight into place, in the binary point layout, instead of being
+        # collected, concatenated and packed
+        n_points = min(limit, len(range(raw_offset, header.point_count, downsample_factor)))
+        out = np.empty(n_points, dtype=POINT_DTYPE)
+
+        # Fill attributes the file lacks (or the viewer did not ask for) once
+        if not has_intensity:
+            out["intensity"] = 0
+        if not has_classification:
+            out["classification"] = 0
+        if not has_rgb:
+            # Default gray
+            out["r"] = 128
+            out["g"] = 128
+            out["b"] = 128
 
-        # Read all points first (laspy doesn't support seeking by offset directly)
-        # For large files, we should use chunked reading
         chunk_size = 1_000_000
-        all_x = []
-        all_y = []
-        all_z = []
-        all_intensity = []
-        all_classification = []
-        all_r = []
-        all_g = []
-        all_b = []
-
-        points_read = 0
-        points_collected = 0
+        pos = 0
+
+        if not header.are_points_compressed:
+            # Uncompressed points are mapped from the requested offset on
+            points_read = raw_offset
+            chunks = _mapped_chunks(file_path, header, raw_offset, chunk_size)
+        else:
+            # Jump straight to the first requested point rather than
+            # decoding everything before it; fall back to scanning for
+            # readers that cannot seek
+            try:
+                points_read = las_file.seek(raw_offset)
+            except (laspy.LaspyException, OSError) as e:
+                logger.debug("Seek not supported, scanning from the first point: %s", e)
+                points_read = 0
+
+            # Decode only up to the last point this page needs
+            raw_end = raw_offset + (n_points - 1) * downsample_factor + 1 if n_points else 0
+            chunks = _read_ahead(_reader_chunks(las_file, raw_end - points_read, chunk_size))
+
+        for chunk in chunks:
+            if pos >= n_points:
+                break
 
-        for chunk in las_file.chunk_iterator(chunk_size):
+            chunk_first = points_read
             chunk_len = len(chunk)
+            points_read += chunk_len
 
-            # Check if we've reached the raw offset
-            if points_read + chunk_len <= raw_offset:
-                points_read += chunk_len
+            # Skip chunks before the raw offset when scanning
+            if points_read <= raw_offset:
                 continue
 
-            # Determine which points in this chunk to use
-            chunk_start = max(0, raw_offset - points_read)
-            chunk_end = min(chunk_len, chunk_start + (raw_limit - points_collected * downsample_factor))
-
-            if chunk_start >= chunk_len:
-                points_read += chunk_len
-                continue
+            # First index in this chunk that falls on the downsampling stride
+            if raw_offset >= chunk_first:
+                chunk_start = raw_offset - chunk_first
+            else:
+                chunk_start = (raw_offset - chunk_first) % downsample_factor
 
-            # Apply downsampling: take every nth point
-            indices = np.arange(chunk_start, chunk_end, downsample_factor)
+            # Apply downsampling: take every nth point as a strided slice, so
+            # each field is a view rather than a fancy-indexed gather
+            chunk_stop = min(chunk_len, chunk_start + (n_points - pos) * downsample_factor)
+            indices = slice(chunk_start, chunk_stop, downsample_factor)
+            k = len(range(chunk_start, chunk_stop, downsample_factor))
 
-            if len(indices) == 0:
-                points_read += chunk_len
+            if k == 0:
                 continue
 
-            # Extract coordinates (convert to actual values)
-            x = chunk.x[indices]
-            y = chunk.y[indices]
-            z = chunk.z[indices]
+            end = pos + k
 
-            all_x.append(np.array(x, dtype=np.float32))
-            all_y.append(np.array(y, dtype=np.float32))
-            all_z.append(np.array(z, dtype=np.float32))
+            # Extract coordinates (convert to actual values)
+            for axis, (name, dim) in enumerate((("x", "X"), ("y", "Y"), ("z", "Z"))):
+                coords = out[name][pos:end]
+                np.multiply(chunk[dim][indices], scales[axis], out=coords, dtype=np.float32)
+                np.add(coords, offsets[axis], out=coords)
 
             # Extract intensity
-            if hasattr(chunk, "intensity"):
-                all_intensity.append(np.array(chunk.intensity[indices], dtype=np.uint16))
-            else:
-                all_intensity.append(np.zeros(len(indices), dtype=np.uint16))
+            if has_intensity:
+                out["intensity"][pos:end] = chunk.intensity[indices]
 
             # Extract classification
-            if hasattr(chunk, "classification"):
-                all_classification.append(np.array(chunk.classification[indices], dtype=np.uint8))
-            else:
-                all_classification.append(np.zeros(len(indices), dtype=np.uint8))
+            if has_classification:
+                out["classification"][pos:end] = chunk.classification[indices]
 
             # Extract RGB (if available)
-            if hasattr(chunk, "red") and hasattr(chunk, "green") and hasattr(chunk, "blue"):
-                # RGB values are typically 16-bit, scale to 8-bit
-                r = np.array(chunk.red[indices], dtype=np.uint16)
-                g = np.array(chunk.green[indices], dtype=np.uint16)
-                b = np.array(chunk.blue[indices], dtype=np.uint16)
-
-                # Check if 16-bit (values > 255)
-                if np.max(r) > 255 or np.max(g) > 255 or np.max(b) > 255:
-                    r = (r / 256).astype(np.uint8)
-                    g = (g / 256).astype(np.uint8)
-                    b = (b / 256).astype(np.uint8)
-                else:
-                    r = r.astype(np.uint8)
-                    g = g.astype(np.uint8)
-                    b = b.astype(np.uint8)
+            if has_rgb:
+                red = chunk["red"][indices]
+                green = chunk["green"][indices]
+                blue = chunk["blue"][indices]
 
-                all_r.append(r)
-                all_g.append(g)
-                all_b.append(b)
-            else:
-                # Generate colors from height or classification
-                all_r.append(np.full(len(indices), 128, dtype=np.uint8))
-                all_g.append(np.full(len(indices), 128, dtype=np.uint8))
-                all_b.append(np.full(len(indices), 128, dtype=np.uint8))
-
-            points_collected += len(indices)
-            points_read += chunk_len
-
-            if points_collected >= limit:
-                break
+                # RGB values are typically 16-bit (any channel > 255); scale
+                # to 8-bit by dropping the low byte
+                shift = 8 if (red | green | blue).max() > 255 else 0
+                for name, channel in (("r", red), ("g", green), ("b", blue)):
+                    np.right_shift(channel, shift, out=out[name][pos:end], casting="unsafe")
 
-        # Concatenate all arrays
-        if not all_x:
-            return {
-                "x": np.array([], dtype=np.float32),
-                "y": np.array([], dtype=np.float32),
-                "z": np.array([], dtype=np.float32),
-                "intensity": np.array([], dtype=np.uint16),
-                "classification": np.array([], dtype=np.uint8),
-                "r": np.array([], dtype=np.uint8),
-                "g": np.array([], dtype=np.uint8),
-                "b": np.array([], dtype=np.uint8),
-            }
+            pos = end
 
-        return {
-            "x": np.concatenate(all_x)[:limit],
-            "y": np.concatenate(all_y)[:limit],
-            "z": np.concatenate(all_z)[:limit],
-            "intensity": np.concatenate(all_intensity)[:limit],
-            "classification": np.concatenate(all_classification)[:limit],
-            "r": np.concatenate(all_r)[:limit],
-            "g": np.concatenate(all_g)[:limit],
-            "b": np.concatenate(all_b)[:limit],
-        }
+        return out[:pos]
 
-    def _format_binary(self, points_data: dict[str, NDArray]) -> str:
+    def _format_binary(self, points_data: NDArray) -> str:
         """
         Format point data as binary (base64 encoded).
 
         Args:
-            points_data: Dictionary with numpy arrays.
+            points_data: Structured array with dtype POINT_DTYPE.
 
         Returns:
             Base64 encoded binary data.
         """
-        if len(points_data["x"]) == 0:
+        if len(points_data) == 0:
             return ""
 
-        # Create binary buffer
-        n_points = len(points_data["x"])
-        buffer = bytearray(n_points * BYTES_PER_POINT)
-
-        for i in range(n_points):
-            offset = i * BYTES_PER_POINT
-            struct.pack_into(
-                POINT_STRUCT_FORMAT,
-                buffer,
-                offset,
-                float(points_data["x"][i]),
-                float(points_data["y"][i]),
-                float(points_data["z"][i]),
-                int(points_data["intensity"][i]),
-                int(points_data["classification"][i]),
-                int(points_data["r"][i]),
-                int(points_data["g"][i]),
-                int(points_data["b"][i]),
-            )
+        # b64encode reads the array's buffer directly; tobytes() would make a
+        # second full-size copy of the packed points first.
+        return base64.b64encode(memoryview(points_data).cast("B")).decode("ascii")
 
-        return base64.b64encode(bytes(buffer)).decode("ascii")
-
-    def _format_json(self, points_data: dict[str, NDArray]) -> list[dict[str, Any]]:
+    def _format_json(self, points_data: NDArray) -> list[dict[str, Any]]:
         """
         Format point data as JSON.
 
         Args:
-            points_data: Dictionary with numpy arrays.
+            points_data: Structured array with dtype POINT_DTYPE.
 
         Returns:
             List of point dictionaries.
         """
+        # Convert each column to Python scalars in one call rather than
+        # indexing and converting numpy scalars point by point
+        columns = [points_data[name].tolist() for name in POINT_DTYPE.names]
         points = []
 
-        for i in range(len(points_data["x"])):
-            point = {
-                "x": float(points_data["x"][i]),
-                "y": float(points_data["y"][i]),
-                "z": float(points_data["z"][i]),
-            }
+        for x, y, z, intensity, classification, r, g, b in zip(*columns, strict=True):
+            point = {"x": x, "y": y, "z": z}
 
-            if points_data["intensity"][i] > 0:
-                point["intensity"] = int(points_data["intensity"][i])
+            if intensity > 0:
+                point["intensity"] = intensity
 
-            if points_data["classification"][i] > 0:
-                point["classification"] = int(points_data["classification"][i])
+            if classification > 0:
+                point["classification"] = classification
 
             # Include RGB if not all the same (default gray)
-            if (
-                points_data["r"][i] != 128
-                or points_data["g"][i] != 128
-                or points_data["b"][i] != 128
-            ):
-                point["r"] = int(points_data["r"][i])
-                point["g"] = int(points_data["g"][i])
-                point["b"] = int(points_data["b"][i])
+            if r != 128 or g != 128 or b != 128:
+                point["r"] = r
+                point["g"] = g
+                point["b"] = b
 
             points.append(point)
 
         return points
 
+    def _format_json_columnar(self, points_data: NDArray) -> dict[str, NDArray]:
+        """
+        Format point data as JSON columns.
+
+        The arrays are returned as numpy arrays so orjson can write them
+        directly, without building a Python object per point. orjson needs
+        C-contiguous arrays, so each field is copied out of the packed layout.
+
+        Args:
+            points_data: Structured array with dtype POINT_DTYPE.
+
+        Returns:
+            Dictionary of per-attribute arrays in POINT_DTYPE field order.
+        """
+        return {name: np.ascontiguousarray(points_data[name]) for name in POINT_DTYPE.names}
+
     def get_file_metadata(
         self,
         file_path: str | Path,
@@ -382,6 +550,9 @@ class PointExtractor:
         """
         Get file metadata for viewer initialization.
 
+        Header metadata is cached per file path, modification time and size,
+        so a viewer polling an unchanged file does not reopen it.
+
         Args:
             file_path: Path to the LAS/LAZ file.
             include_lod_info: Whether to include LOD level information.
@@ -396,7 +567,40 @@ class PointExtractor:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with laspy.open(str(file_path)) as las_file:
+        stat = file_path.stat()
+        metadata = copy.deepcopy(
+            self._cached_metadata(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
+
+        # Calculate LOD levels
+        lod_levels = []
+        if include_lod_info:
+            for level, factor in enumerate([1, 4, 16]):
+                lod_levels.append({
+                    "level": level,
+                    "pointCount": metadata["pointCount"] // factor,
+                    "decimationFactor": factor,
+                })
+        metadata["lodLevels"] = lod_levels
+
+        return {
+            "success": True,
+            "metadata": metadata,
+        }
+
+    def _read_metadata(self, file_path: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+        """
+        Read viewer metadata from a LAS/LAZ file header.
+
+        Args:
+            file_path: Resolved path to the LAS/LAZ file.
+            _mtime_ns: File modification time; only part of the cache key.
+            _size: File size in bytes; only part of the cache key.
+
+        Returns:
+            Metadata dictionary without LOD levels.
+        """
+        with laspy.open(file_path) as las_file:
             header = las_file.header
 
             # Get bounds
@@ -412,41 +616,24 @@ class PointExtractor:
             # Get CRS
             crs = self._extract_crs(las_file)
 
-            # Check available attributes
-            sample_chunk = next(las_file.chunk_iterator(100))
+            # Check available attributes (from the point format, so no
+            # points need to be decoded)
+            dims = set(header.point_format.dimension_names)
             attributes = {
-                "hasIntensity": hasattr(sample_chunk, "intensity"),
-                "hasRGB": (
-                    hasattr(sample_chunk, "red")
-                    and hasattr(sample_chunk, "green")
-                    and hasattr(sample_chunk, "blue")
-                ),
-                "hasClassification": hasattr(sample_chunk, "classification"),
-                "hasReturnNumber": hasattr(sample_chunk, "return_number"),
-                "hasNormalizedHeight": hasattr(sample_chunk, "normalized_height"),
+                "hasIntensity": "intensity" in dims,
+                "hasRGB": {"red", "green", "blue"} <= dims,
+                "hasClassification": "classification" in dims,
+                "hasReturnNumber": "return_number" in dims,
+                "hasNormalizedHeight": "normalized_height" in dims,
             }
 
-            # Calculate LOD levels
-            lod_levels = []
-            if include_lod_info:
-                for level, factor in enumerate([1, 4, 16]):
-                    lod_levels.append({
-                        "level": level,
-                        "pointCount": header.point_count // factor,
-                        "decimationFactor": factor,
-                    })
-
             return {
-                "success": True,
-                "metadata": {
-                    "pointCount": header.point_count,
-                    "bounds": bounds,
-                    "crs": crs,
-                    "lasVersion": f"{header.version.major}.{header.version.minor}",
-                    "pointFormat": header.point_format.id,
-                    "attributes": attributes,
-                    "lodLevels": lod_levels,
-                },
+                "pointCount": header.point_count,
+                "bounds": bounds,
+                "crs": crs,
+                "lasVersion": f"{header.version.major}.{header.version.minor}",
+                "pointFormat": header.point_format.id,
+                "attributes": attributes,
             }
 
     def _extract_crs(self, las_file: laspy.LasReader) -> str:
@@ -490,19 +677,21 @@ class PointExtractor:
             if len(data) < 8:
                 return None
 
-            keys = np.frombuffer(data, dtype=np.uint16)
-            num_keys = keys[3] if len(keys) > 3 else 0
-
-            for i in range(4, min(4 + num_keys * 4, len(keys)), 4):
-                if len(keys) <= i + 3:
-                    break
-
-                key_id = keys[i]
-                tiff_tag = keys[i + 1]
-                value = keys[i + 3]
+            num_keys = int(np.frombuffer(data, dtype="<u2", count=4)[3])
+            available = (len(data) - 8) // GEOKEY_DTYPE.itemsize
+            keys = np.frombuffer(
+                data,
+                dtype=GEOKEY_DTYPE,
+                count=min(num_keys, available),
+                offset=8,
+            )
 
-                if key_id in (3072, 2048) and tiff_tag == 0:
-                    return int(value)
+            # First projected (3072) or geographic (2048) CRS key stored inline
+            matches = np.flatnonzero(
+                np.isin(keys["key_id"], (3072, 2048)) & (keys["tiff_tag"] == 0)
+            )
+            if len(matches):
+                return int(keys["value"][matches[0]])
 
             return None
 
@@ -515,6 +704,8 @@ class PointExtractor:
         file_path: str | Path,
         output_path: str | Path,
         decimation_factor: int,
+        output_format: str = "las",
+        method: str = "stride",
     ) -> dict[str, Any]:
         """
         Create a downsampled LOD version of a point cloud file.
@@ -523,9 +714,22 @@ class PointExtractor:
             file_path: Path to the input LAS/LAZ file.
             output_path: Path to save the output file.
             decimation_factor: Decimation factor (2=half, 4=quarter, etc.).
+            output_format: "las" to write LAS/LAZ (by output suffix), or
+                "blosc" to write the viewer's binary point layout as a
+                Blosc2 array (requires blosc2).
+            method: "stride" keeps every nth point. "voxel" keeps the point
+                closest to the center of each occupied cell of a grid sized
+                for about 1/decimation_factor of the points, which gives a
+                more even density for coarse LODs. Voxel selection holds the
+                raw coordinates of the whole cloud in memory and is only
+                available for LAS/LAZ output.
 
         Returns:
             Dictionary with operation results.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the output format or method is unknown or unavailable.
         """
         start_time = time.perf_counter()
 
@@ -535,6 +739,18 @@ class PointExtractor:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        if output_format not in ("las", "blosc"):
+            raise ValueError(f"Unsupported LOD output format: {output_format}")
+
+        if output_format == "blosc" and not HAS_BLOSC2:
+            raise ValueError("Blosc LOD output requires the blosc2 package")
+
+        if method not in ("stride", "voxel"):
+            raise ValueError(f"Unsupported LOD method: {method}")
+
+        if method == "voxel" and output_format != "las":
+            raise ValueError("Voxel LOD selection is only supported for LAS output")
+
         logger.info(
             "Creating LOD file with decimation factor %d: %s -> %s",
             decimation_factor,
@@ -543,45 +759,19 @@ class PointExtractor:
         )
 
         with laspy.open(str(file_path)) as las_file:
-            header = las_file.header
-            total_points = header.point_count
-            output_points = total_points // decimation_factor
-
-            # Create output file with same header
-            output_header = laspy.LasHeader(
-                point_format=header.point_format,
-                version=header.version,
-            )
-            output_header.scales = header.scales
-            output_header.offsets = header.offsets
-
-            # Copy VLRs
-            for vlr in header.vlrs:
-                output_header.vlrs.append(vlr)
-
-            with laspy.open(str(output_path), mode="w", header=output_header) as out_file:
-                points_written = 0
-
-                for chunk in las_file.chunk_iterator(1_000_000):
-                    # Decimate
-                    indices = np.arange(0, len(chunk), decimation_factor)
-
-                    if len(indices) == 0:
-                        continue
+            total_points = las_file.header.point_count
 
-                    # Create decimated points
-                    decimated = laspy.ScaleAwarePointRecord.zeros(
-                        len(indices),
-                        header=output_header,
-                    )
-
-                    # Copy all dimensions
-                    for dim in chunk.point_format.dimension_names:
-                        if hasattr(decimated, dim):
-                            setattr(decimated, dim, getattr(chunk, dim)[indices])
-
-                    out_file.write_points(decimated)
-                    points_written += len(indices)
+            if output_format == "blosc":
+                points_written = self._write_blosc_lod(
+                    las_file, file_path, output_path, decimation_factor
+                )
+            else:
+                selected = None
+                if method == "voxel":
+                    selected = self._voxel_lod_indices(las_file, file_path, decimation_factor)
+                points_written = self._write_las_lod(
+                    las_file, file_path, output_path, decimation_factor, selected
+                )
 
         processing_time = (time.perf_counter() - start_time) * 1000
 
@@ -599,3 +789,202 @@ class PointExtractor:
             "output_path": str(output_path),
             "processing_time_ms": round(processing_time, 2),
         }
+
+    def _write_las_lod(
+        self,
+        las_file: laspy.LasReader,
+        file_path: Path,
+        output_path: Path,
+        decimation_factor: int,
+        selected: NDArray[np.int64] | None = None,
+    ) -> int:
+        """
+        Write decimated point records to a LAS/LAZ file.
+
+        Args:
+            las_file: Open LAS file reader, positioned at the first point.
+            file_path: Path of the open file, used to memory-map uncompressed LAS.
+            output_path: Path to save the output file.
+            decimation_factor: Decimation factor, used when no selection is given.
+            selected: Sorted indices of the points to keep, instead of
+                every nth point.
+
+        Returns:
+            Number of points written.
+        """
+        header = las_file.header
+
+        # Create output file with same header
+        output_header = laspy.LasHeader(
+            point_format=header.point_format,
+            version=header.version,
+        )
+        output_header.scales = header.scales
+        output_header.offsets = header.offsets
+
+        # Copy VLRs
+        for vlr in header.vlrs:
+            output_header.vlrs.append(vlr)
+
+        points_written = 0
+        points_read = 0
+
+        if header.are_points_compressed:
+            chunks = las_file.chunk_iterator(1_000_000)
+        else:
+            chunks = _mapped_chunks(file_path, header, 0, 1_000_000)
+
+        with laspy.open(str(output_path), mode="w", header=output_header) as out_file:
+            for chunk in chunks:
+                if selected is None:
+                    # Decimate by slicing whole point records with a stride
+                    # carried across chunk boundaries
+                    start = (-points_read) % decimation_factor
+                    records = chunk.array[start::decimation_factor]
+                else:
+                    lo, hi = np.searchsorted(selected, (points_read, points_read + len(chunk)))
+                    records = chunk.array[selected[lo:hi] - points_read]
+
+                # The writer needs a contiguous buffer, so records are
+                # copied once
+                decimated = laspy.ScaleAwarePointRecord(
+                    np.ascontiguousarray(records),
+                    chunk.point_format,
+                    chunk.scales,
+                    chunk.offsets,
+                )
+                points_read += len(chunk)
+
+                if len(decimated) == 0:
+                    continue
+
+                out_file.write_points(decimated)
+                points_written += len(decimated)
+
+        return points_written
+
+    def _voxel_lod_indices(
+        self,
+        las_file: laspy.LasReader,
+        file_path: Path,
+        decimation_factor: int,
+    ) -> NDArray[np.int64]:
+        """
+        Select one point per occupied voxel for a voxel-grid LOD.
+
+        The grid spans the cloud's bounds with about
+        point_count / decimation_factor cells. In each occupied cell the
+        point closest to the cell center is kept. Everything runs on the
+        raw integer coordinates in a single sort.
+
+        Args:
+            las_file: Open LAS file reader, positioned at the first point.
+                It is rewound afterwards.
+            file_path: Path of the open file, used to memory-map uncompressed LAS.
+            decimation_factor: Decimation factor.
+
+        Returns:
+            Sorted indices of the selected points.
+        """
+        header = las_file.header
+        n_points = header.point_count
+        target = max(1, n_points // decimation_factor)
+
+        if target >= n_points:
+            return np.arange(n_points, dtype=np.int64)
+
+        # Raw integer coordinates of the whole cloud
+        coords = np.empty((3, n_points), dtype=np.int32)
+        if header.are_points_compressed:
+            chunks = las_file.chunk_iterator(1_000_000)
+        else:
+            chunks = _mapped_chunks(file_path, header, 0, 1_000_000)
+
+        pos = 0
+        for chunk in chunks:
+            end = pos + len(chunk)
+            for axis, dim in enumerate(("X", "Y", "Z")):
+                coords[axis, pos:end] = chunk[dim]
+            pos = end
+
+        if header.are_points_compressed:
+            las_file.seek(0)
+
+        # Flatten (ix, iy, iz) cell indices into one key and accumulate the
+        # squared distance to each point's cell center
+        cells_per_axis = target ** (1 / 3)
+        keys = np.zeros(n_points, dtype=np.int64)
+        dist = np.zeros(n_points, dtype=np.float64)
+        stride = 1
+
+        for axis in range(3):
+            rel = coords[axis] - np.int64(coords[axis].min())
+            cell = max(float(rel.max()) / cells_per_axis, 1.0)
+            index = np.floor_divide(rel, cell).astype(np.int64)
+            offset = rel - (index + 0.5) * cell
+            dist += offset * offset
+            keys += index * stride
+            stride *= int(index.max()) + 1
+
+        # Sort by cell, then by distance, and keep the first point of each cell
+        order = np.lexsort((dist, keys))
+        sorted_keys = keys[order]
+        first = np.empty(n_points, dtype=bool)
+        first[0] = True
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=first[1:])
+
+        return np.sort(order[first])
+
+    def _write_blosc_lod(
+        self,
+        las_file: laspy.LasReader,
+        file_path: Path,
+        output_path: Path,
+        decimation_factor: int,
+    ) -> int:
+        """
+        Write decimated points to a Blosc2 array in the binary point layout.
+
+        The array has dtype POINT_DTYPE, so a viewer tile is a slice of
+        ``blosc2.open(path)`` with no LAZ decoding. LZ4 with the byte
+        shuffle filter decompresses at memory speed.
+
+        Args:
+            las_file: Open LAS file reader.
+            file_path: Path of the open file, used to memory-map uncompressed LAS.
+            output_path: Path to save the output file.
+            decimation_factor: Decimation factor.
+
+        Returns:
+            Number of points written.
+        """
+        header = las_file.header
+        n_points = len(range(0, header.point_count, decimation_factor))
+        page_size = 1_000_000
+
+        array = blosc2.empty(
+            (n_points,),
+            dtype=POINT_DTYPE,
+            urlpath=str(output_path),
+            mode="w",
+            cparams={
+                "codec": blosc2.Codec.LZ4,
+                "clevel": 5,
+                "filters": [blosc2.Filter.SHUFFLE],
+            },
+        )
+
+        # Fill page by page so memory stays bounded by one page of points
+        for pos in range(0, n_points, page_size):
+            points_data = self._read_points(
+                las_file,
+                file_path,
+                pos * decimation_factor,
+                page_size,
+                decimation_factor,
+                header,
+                set(VIEWER_ATTRIBUTES),
+            )
+            array[pos : pos + len(points_data)] = points_data
+
+        return n_points
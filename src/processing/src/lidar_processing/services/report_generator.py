@@ -9,14 +9,23 @@ to produce comprehensive forest inventory reports.
 from __future__ import annotations
 
 import logging
-import os
+import re
 import tempfile
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
+import shapely
+from scipy.spatial import ConvexHull
+from shapely.geometry import shape
+
 from lidar_processing.models import (
     GenerateReportRequest,
     InventorySummary,
@@ -47,6 +56,49 @@ KG_TO_LBS = 2.20462
 HECTARES_TO_ACRES = 2.47105
 SQ_METERS_TO_SQ_FEET = 10.7639
 
+# Carbon accounting factors
+CARBON_FRACTION = 0.47  # Carbon share of dry biomass
+CARBON_TO_CO2 = 44 / 12  # Molecular weight ratio of CO2 to C
+
+# Runs of characters that are not alphanumeric, "-" or "_", together with
+# any underscores they touch, collapse to a single underscore in filenames.
+_UNSAFE_FILENAME_RE = re.compile(r"(?:[^\w-]|_)+")
+
+
+@dataclass(slots=True)
+class _TreeColumns:
+    """Per-tree numeric columns shared by the area, summary and chart steps.
+
+    Missing values are stored as NaN so every column stays aligned with
+    the tree list.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    heights: np.ndarray
+    dbhs: np.ndarray
+    biomass: np.ndarray
+
+    @classmethod
+    def from_trees(cls, trees: list[TreeMetrics]) -> _TreeColumns:
+        """Extract the columns in a single pass over the tree models."""
+        n = len(trees)
+        x = np.empty(n, dtype=np.float64)
+        y = np.empty(n, dtype=np.float64)
+        heights = np.empty(n, dtype=np.float64)
+        dbhs = np.empty(n, dtype=np.float64)
+        biomass = np.empty(n, dtype=np.float64)
+        for i, tree in enumerate(trees):
+            x[i] = tree.x
+            y[i] = tree.y
+            value = tree.height
+            heights[i] = np.nan if value is None else value
+            value = tree.dbh_estimated
+            dbhs[i] = np.nan if value is None else value
+            value = tree.biomass_estimated
+            biomass[i] = np.nan if value is None else value
+        return cls(x=x, y=y, heights=heights, dbhs=dbhs, biomass=biomass)
+
 
 class ReportGenerator:
     """
@@ -73,8 +125,10 @@ class ReportGenerator:
         self.excel_generator = ExcelGenerator()
         self.stand_analyzer = StandAnalyzer()
 
-        # Report storage (in production, use Redis or database)
-        self._reports: dict[str, ReportResult] = {}
+        # Report storage (in production, use Redis or database), bounded
+        # with least-recently-used eviction
+        self._reports: OrderedDict[str, ReportResult] = OrderedDict()
+        self._max_reports = settings.max_cached_reports if settings else 1024
 
     def generate_inventory_report(
         self,
@@ -127,8 +181,13 @@ class ReportGenerator:
             trees = self._convert_units(tree_data, options.units)
 
             # Calculate summary and metrics
-            total_area = project_info.total_area_hectares or self._estimate_area(trees)
-            summary = self._calculate_summary(trees, total_area, options.units)
+            columns = _TreeColumns.from_trees(trees)
+            total_area = project_info.total_area_hectares or self._estimate_area(
+                trees, columns=columns
+            )
+            summary = self._calculate_summary(
+                trees, total_area, options.units, columns=columns
+            )
 
             # Calculate species metrics
             species_metrics = self.stand_analyzer._calculate_species_composition(trees)
@@ -137,55 +196,75 @@ class ReportGenerator:
             stand_metrics = None
             if stand_boundaries and options.include_stand_summary:
                 stand_metrics = self._calculate_stand_metrics(
-                    trees, stand_boundaries, total_area
+                    trees, stand_boundaries, total_area, columns=columns
                 )
 
             # Generate charts
             charts = {}
             if options.include_charts:
-                charts = self._generate_charts(trees, species_metrics, options)
+                charts = self._generate_charts(
+                    trees, species_metrics, options, columns=columns
+                )
 
             # Generate output files
-            pdf_path = None
-            excel_path = None
+            pdf_file: Path | None = None
+            excel_file: Path | None = None
+            tree_csv_file: Path | None = None
             file_sizes = {}
 
             base_name = self._sanitize_filename(project_info.project_name)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
 
+            # Map each requested output kind to (label, writer, path)
+            outputs: dict[str, tuple[str, Any, Path]] = {}
             if output_format in ("pdf", "both"):
-                pdf_filename = f"{base_name}_{timestamp}.pdf"
-                pdf_path = str(output_dir / pdf_filename)
-
-                self.pdf_generator.generate_report(
-                    output_path=pdf_path,
-                    project_info=project_info,
-                    summary=summary,
-                    trees=trees,
-                    options=options,
-                    species_metrics=species_metrics,
-                    stand_metrics=stand_metrics,
-                    charts=charts,
+                pdf_file = output_dir / f"{base_name}_{timestamp}.pdf"
+                outputs["pdf"] = ("PDF", self.pdf_generator.generate_report, pdf_file)
+                tree_csv_file = self.pdf_generator.tree_csv_path(
+                    pdf_file, trees, options
                 )
-                file_sizes["pdf"] = os.path.getsize(pdf_path)
-                logger.info("Generated PDF report: %s", pdf_path)
 
             if output_format in ("excel", "both"):
-                excel_filename = f"{base_name}_{timestamp}.xlsx"
-                excel_path = str(output_dir / excel_filename)
-
-                self.excel_generator.generate_workbook(
-                    output_path=excel_path,
-                    project_info=project_info,
-                    summary=summary,
-                    trees=trees,
-                    options=options,
-                    species_metrics=species_metrics,
-                    stand_metrics=stand_metrics,
-                    charts=charts,
+                excel_file = output_dir / f"{base_name}_{timestamp}.xlsx"
+                outputs["excel"] = (
+                    "Excel",
+                    self.excel_generator.generate_workbook,
+                    excel_file,
                 )
-                file_sizes["excel"] = os.path.getsize(excel_path)
-                logger.info("Generated Excel report: %s", excel_path)
+
+            report_inputs = {
+                "project_info": project_info,
+                "summary": summary,
+                "trees": trees,
+                "options": options,
+                "species_metrics": species_metrics,
+                "stand_metrics": stand_metrics,
+                "charts": charts,
+            }
+
+            parallel = (
+                self.settings.parallel_reports if self.settings is not None else True
+            )
+            if parallel and len(outputs) > 1:
+                # Both writers only read the shared inputs, and much of their
+                # time is spent in compression and image code outside the GIL
+                with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+                    futures = [
+                        executor.submit(write, output_path=path, **report_inputs)
+                        for _, write, path in outputs.values()
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                for _, write, path in outputs.values():
+                    write(output_path=path, **report_inputs)
+
+            for kind, (label, _, path) in outputs.items():
+                file_sizes[kind] = path.stat().st_size
+                logger.info("Generated %s report: %s", label, path)
+
+            if tree_csv_file is not None:
+                file_sizes["tree_csv"] = tree_csv_file.stat().st_size
 
             generation_time_ms = (time.time() - start_time) * 1000
 
@@ -193,15 +272,16 @@ class ReportGenerator:
                 report_id=report_id,
                 analysis_id=analysis_id,
                 status=ReportStatus.COMPLETED,
-                pdf_path=pdf_path,
-                excel_path=excel_path,
+                pdf_path=str(pdf_file) if pdf_file else None,
+                excel_path=str(excel_file) if excel_file else None,
+                tree_csv_path=str(tree_csv_file) if tree_csv_file else None,
                 generated_at=datetime.utcnow(),
                 generation_time_ms=round(generation_time_ms, 2),
                 file_sizes=file_sizes,
             )
 
             # Store result for later retrieval
-            self._reports[report_id] = result
+            self._store_report(result)
 
             logger.info(
                 "Report generation completed in %.2f ms: %s",
@@ -225,7 +305,7 @@ class ReportGenerator:
                 error=str(e),
             )
 
-            self._reports[report_id] = result
+            self._store_report(result)
             return result
 
     def get_report_status(self, report_id: str) -> ReportResult | None:
@@ -238,7 +318,17 @@ class ReportGenerator:
         Returns:
             ReportResult or None if not found.
         """
-        return self._reports.get(report_id)
+        result = self._reports.get(report_id)
+        if result is not None:
+            self._reports.move_to_end(report_id)
+        return result
+
+    def _store_report(self, result: ReportResult) -> None:
+        """Store a report result, evicting the least recently used ones."""
+        self._reports[result.report_id] = result
+        self._reports.move_to_end(result.report_id)
+        while len(self._reports) > self._max_reports:
+            self._reports.popitem(last=False)
 
     def generate_from_request(self, request: GenerateReportRequest) -> ReportResult:
         """
@@ -264,10 +354,9 @@ class ReportGenerator:
         trees: list[TreeMetrics],
         total_area: float,
         units: UnitSystem,
+        columns: _TreeColumns | None = None,
     ) -> InventorySummary:
         """Calculate inventory summary statistics."""
-        import numpy as np
-
         if not trees:
             return InventorySummary(
                 total_trees=0,
@@ -279,44 +368,44 @@ class ReportGenerator:
                 std_height=0,
             )
 
-        heights = [t.height for t in trees if t.height is not None]
-        dbhs = [t.dbh_estimated for t in trees if t.dbh_estimated is not None]
-        biomass_vals = [
-            t.biomass_estimated for t in trees if t.biomass_estimated is not None
-        ]
-
+        if columns is None:
+            columns = _TreeColumns.from_trees(trees)
         total_trees = len(trees)
+
+        # Model fields live in the instance __dict__. Reading it directly
+        # avoids pydantic's slow AttributeError path for models that have no
+        # species field, which cost more than the rest of this method.
+        species_set = {
+            species for tree in trees if (species := vars(tree).get("species"))
+        }
+
+        heights = columns.heights[~np.isnan(columns.heights)]
+        dbhs = columns.dbhs[~np.isnan(columns.dbhs)]
+        biomass_vals = columns.biomass[~np.isnan(columns.biomass)]
+
         stems_per_ha = total_trees / total_area if total_area > 0 else 0
 
         # Calculate basal area
         total_ba = None
         ba_per_ha = None
-        if dbhs:
-            import math
-            basal_areas = [math.pi * (d / 200) ** 2 for d in dbhs]
-            total_ba = sum(basal_areas)
+        if dbhs.size:
+            # sum(pi * (d / 200)^2) with the constant folded out of a dot product
+            total_ba = float(np.pi / 40000.0 * (dbhs @ dbhs))
             ba_per_ha = total_ba / total_area if total_area > 0 else None
 
-        total_biomass = sum(biomass_vals) if biomass_vals else None
-        total_carbon = total_biomass * 0.47 if total_biomass else None
-        co2_equivalent = total_carbon * (44 / 12) if total_carbon else None
-
-        # Get unique species
-        species_set = set()
-        for tree in trees:
-            species = getattr(tree, "species", None)
-            if species:
-                species_set.add(species)
+        total_biomass = float(biomass_vals.sum()) if biomass_vals.size else None
+        total_carbon = total_biomass * CARBON_FRACTION if total_biomass else None
+        co2_equivalent = total_carbon * CARBON_TO_CO2 if total_carbon else None
 
         return InventorySummary(
             total_trees=total_trees,
             total_area_hectares=round(total_area, 4),
             stems_per_hectare=round(stems_per_ha, 1),
-            mean_height=round(float(np.mean(heights)), 2) if heights else 0,
-            max_height=round(float(np.max(heights)), 2) if heights else 0,
-            min_height=round(float(np.min(heights)), 2) if heights else 0,
-            std_height=round(float(np.std(heights)), 2) if heights else 0,
-            mean_dbh=round(float(np.mean(dbhs)), 2) if dbhs else None,
+            mean_height=round(float(heights.mean()), 2) if heights.size else 0,
+            max_height=round(float(heights.max()), 2) if heights.size else 0,
+            min_height=round(float(heights.min()), 2) if heights.size else 0,
+            std_height=round(float(heights.std()), 2) if heights.size else 0,
+            mean_dbh=round(float(dbhs.mean()), 2) if dbhs.size else None,
             total_basal_area=round(total_ba, 4) if total_ba else None,
             basal_area_per_hectare=round(ba_per_ha, 2) if ba_per_ha else None,
             total_biomass=round(total_biomass, 2) if total_biomass else None,
@@ -330,23 +419,38 @@ class ReportGenerator:
         trees: list[TreeMetrics],
         species_metrics: list[SpeciesMetrics],
         options: ReportOptions,
+        columns: _TreeColumns | None = None,
     ) -> dict[str, bytes]:
         """Generate all charts for the report."""
         charts = {}
 
+        if columns is None:
+            columns = _TreeColumns.from_trees(trees)
+        has_height = ~np.isnan(columns.heights)
+        has_dbh = ~np.isnan(columns.dbhs)
+        heights = columns.heights[has_height]
+        dbhs = columns.dbhs[has_dbh]
+        # The scatter only takes trees with both values so the pairs align
+        paired = has_height & has_dbh
+        pair_heights = columns.heights[paired]
+        pair_dbhs = columns.dbhs[paired]
+
+        species_counts = {}
+        species_biomass = {}
+        for s in species_metrics:
+            species_counts[s.species_name] = s.tree_count
+            if s.total_biomass is not None:
+                species_biomass[s.species_name] = s.total_biomass
+
         try:
             # Species pie chart
-            if species_metrics:
-                species_counts = {
-                    s.species_name: s.tree_count for s in species_metrics
-                }
+            if species_counts:
                 charts["species_pie"] = self.chart_generator.species_pie_chart(
                     species_counts
                 )
 
             # Height histogram
-            heights = [t.height for t in trees if t.height is not None]
-            if heights:
+            if heights.size:
                 unit_label = "Height (m)" if options.units == UnitSystem.METRIC else "Height (ft)"
                 charts["height_histogram"] = self.chart_generator.height_histogram(
                     heights,
@@ -354,8 +458,7 @@ class ReportGenerator:
                 )
 
             # DBH histogram
-            dbhs = [t.dbh_estimated for t in trees if t.dbh_estimated is not None]
-            if dbhs:
+            if dbhs.size:
                 unit_label = "DBH (cm)" if options.units == UnitSystem.METRIC else "DBH (in)"
                 charts["dbh_histogram"] = self.chart_generator.dbh_distribution(
                     dbhs,
@@ -363,21 +466,15 @@ class ReportGenerator:
                 )
 
             # Biomass by species
-            if species_metrics:
-                species_biomass = {
-                    s.species_name: s.total_biomass
-                    for s in species_metrics
-                    if s.total_biomass is not None
-                }
-                if species_biomass:
-                    charts["biomass_chart"] = self.chart_generator.biomass_by_species(
-                        species_biomass
-                    )
+            if species_biomass:
+                charts["biomass_chart"] = self.chart_generator.biomass_by_species(
+                    species_biomass
+                )
 
             # Height vs DBH scatter
-            if heights and dbhs and len(heights) == len(dbhs):
+            if pair_heights.size:
                 charts["height_dbh_scatter"] = self.chart_generator.height_dbh_scatter(
-                    heights, dbhs
+                    pair_heights, pair_dbhs
                 )
 
         except Exception as e:
@@ -390,22 +487,33 @@ class ReportGenerator:
         trees: list[TreeMetrics],
         stand_boundaries: list[dict[str, Any]],
         total_area: float,
+        columns: _TreeColumns | None = None,
     ) -> list[StandMetrics]:
         """Calculate metrics for each stand."""
         stand_metrics = []
+        if columns is None:
+            columns = _TreeColumns.from_trees(trees)
 
         for i, boundary in enumerate(stand_boundaries):
             stand_id = boundary.get("id", f"stand_{i + 1}")
             stand_name = boundary.get("name", f"Stand {i + 1}")
-
-            # Filter trees within this stand (simplified - would use spatial query)
-            # In production, use shapely for proper point-in-polygon tests
-            stand_trees = trees  # Placeholder - all trees for now
+            geometry = boundary.get("geometry")
 
             try:
+                # Assign trees to the stand with one vectorized
+                # point-in-polygon test over the coordinate columns. Stands
+                # without a geometry cover the whole inventory.
+                if geometry:
+                    polygon = shape(geometry)
+                    shapely.prepare(polygon)
+                    inside = shapely.contains_xy(polygon, columns.x, columns.y)
+                    stand_trees = [trees[j] for j in np.flatnonzero(inside)]
+                else:
+                    stand_trees = trees
+
                 metrics = self.stand_analyzer.calculate_stand_metrics(
                     trees=stand_trees,
-                    stand_boundary=boundary.get("geometry"),
+                    stand_boundary=geometry,
                     stand_id=stand_id,
                     stand_name=stand_name,
                     area_hectares=boundary.get("area_hectares"),
@@ -474,12 +582,17 @@ class ReportGenerator:
 
         return converted
 
-    def _estimate_area(self, trees: list[TreeMetrics]) -> float:
+    def _estimate_area(
+        self,
+        trees: list[TreeMetrics],
+        columns: _TreeColumns | None = None,
+    ) -> float:
         """
         Estimate survey area from tree positions.
 
         Args:
             trees: List of tree metrics.
+            columns: Pre-extracted tree columns, built from trees if omitted.
 
         Returns:
             Estimated area in hectares.
@@ -489,10 +602,11 @@ class ReportGenerator:
             return len(trees) / 400  # Assume 400 trees/ha
 
         try:
-            from scipy.spatial import ConvexHull
-            import numpy as np
-
-            points = np.array([[t.x, t.y] for t in trees if t.x and t.y])
+            if columns is None:
+                columns = _TreeColumns.from_trees(trees)
+            # Trees at a zero coordinate are treated as unlocated
+            located = (columns.x != 0) & (columns.y != 0)
+            points = np.column_stack((columns.x[located], columns.y[located]))
 
             if len(points) < 3:
                 return len(trees) / 400
@@ -508,7 +622,9 @@ class ReportGenerator:
             logger.warning("Failed to estimate area: %s", e)
             return len(trees) / 400
 
-    def _sanitize_filename(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sanitize_filename(name: str) -> str:
         """
         Sanitize a string for use as a filename.
 
@@ -518,13 +634,7 @@ class ReportGenerator:
         Returns:
             Safe filename string.
         """
-        # Replace spaces and special characters
-        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
-        # Remove consecutive underscores
-        while "__" in safe:
-            safe = safe.replace("__", "_")
-        # Trim and limit length
-        return safe.strip("_")[:100]
+        return _UNSAFE_FILENAME_RE.sub("_", name).strip("_")[:100]
 
 
 # Convenience function for direct usage
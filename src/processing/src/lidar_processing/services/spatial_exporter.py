@@ -9,21 +9,75 @@ Sprint 21-24: FIA Reports & Export
 
 from __future__ import annotations
 
+import csv
 import io
-import json
 import logging
 import os
-import shutil
+import struct
 import tempfile
 import zipfile
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from xml.sax.saxutils import escape
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Try to import pyproj for PRJ definitions beyond the built-in table
+try:
+    from pyproj import CRS
+    from pyproj.enums import WktVersion
+    from pyproj.exceptions import CRSError
+    HAS_PYPROJ = True
+except ImportError:
+    HAS_PYPROJ = False
+    logger.debug("pyproj not available, PRJ output limited to common CRS")
+
+# Common CRS WKT strings (ESRI flavour, as expected in .prj files)
+_CRS_WKT = {
+    "EPSG:4326": 'GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137,298.257223563]],PRIMEM["Greenwich",0],UNIT["Degree",0.017453292519943295]]',
+    "EPSG:3857": 'PROJCS["WGS_1984_Web_Mercator_Auxiliary_Sphere",GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137.0,298.257223563]],PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]],PROJECTION["Mercator_Auxiliary_Sphere"],PARAMETER["False_Easting",0.0],PARAMETER["False_Northing",0.0],PARAMETER["Central_Meridian",0.0],PARAMETER["Standard_Parallel_1",0.0],PARAMETER["Auxiliary_Sphere_Type",0.0],UNIT["Meter",1.0]]',
+    "EPSG:32610": 'PROJCS["WGS_1984_UTM_Zone_10N",GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137,298.257223563]],PRIMEM["Greenwich",0],UNIT["Degree",0.017453292519943295]],PROJECTION["Transverse_Mercator"],PARAMETER["latitude_of_origin",0],PARAMETER["central_meridian",-123],PARAMETER["scale_factor",0.9996],PARAMETER["false_easting",500000],PARAMETER["false_northing",0],UNIT["Meter",1]]',
+}
+
+# GeoJSON point feature with encoded coordinates and properties filled in
+_POINT_FEATURE_JSON = (
+    b'{"type":"Feature","geometry":{"type":"Point","coordinates":%s},'
+    b'"properties":%s}'
+)
+
+# Shapefile record layouts: point (shape type, x, y) and the fixed polygon
+# prefix (shape type, bounding box, part count, point count)
+_POINT_RECORD = struct.Struct("<idd")
+_POLYGON_HEADER = struct.Struct("<i4dii")
+# Big-endian record header (record number or offset, content length in words)
+_RECORD_HEADER = struct.Struct(">ii")
+
+
+@lru_cache(maxsize=64)
+def _wkt_for(crs: str) -> str:
+    """Look up the ESRI WKT for a CRS, falling back to WGS84."""
+    wkt = _CRS_WKT.get(crs)
+    if wkt is not None:
+        return wkt
+
+    if HAS_PYPROJ:
+        try:
+            wkt = CRS.from_user_input(crs).to_wkt(WktVersion.WKT1_ESRI)
+        except CRSError:
+            logger.warning("Unknown CRS %s, writing WGS84 PRJ", crs)
+        if wkt:
+            return wkt
+
+    return _CRS_WKT["EPSG:4326"]
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
@@ -72,6 +126,7 @@ class SpatialExporter:
         self,
         default_crs: str = "EPSG:4326",
         output_dir: str | None = None,
+        compresslevel: int = 1,
     ) -> None:
         """
         Initialize spatial exporter.
@@ -79,9 +134,12 @@ class SpatialExporter:
         Args:
             default_crs: Default coordinate reference system
             output_dir: Directory for output files (temp if None)
+            compresslevel: Deflate level for shapefile archives (0 stores
+                members uncompressed)
         """
         self.default_crs = default_crs
         self.output_dir = output_dir or tempfile.gettempdir()
+        self.compresslevel = compresslevel
 
         logger.info("Initialized SpatialExporter (CRS=%s)", default_crs)
 
@@ -92,6 +150,7 @@ class SpatialExporter:
         filename: str | None = None,
         crs: str | None = None,
         include_attributes: list[str] | None = None,
+        return_bytes: bool = False,
     ) -> ExportResult:
         """
         Export tree data as point features.
@@ -102,14 +161,73 @@ class SpatialExporter:
             filename: Output filename (auto-generated if None)
             crs: Coordinate reference system
             include_attributes: Attributes to include (all if None)
+            return_bytes: Also return the file contents in file_bytes
 
         Returns:
             ExportResult with file path or bytes
         """
         crs = crs or self.default_crs
 
-        # Convert to GeoJSON features
-        features = self._trees_to_geojson_features(trees, include_attributes)
+        points = self._iter_tree_points(trees, include_attributes)
+
+        return self._export_point_features(
+            points, format, filename, crs, return_bytes
+        )
+
+    def export_tree_arrays(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray | None = None,
+        attributes: dict[str, np.ndarray] | None = None,
+        format: ExportFormat = ExportFormat.GEOJSON,
+        filename: str | None = None,
+        crs: str | None = None,
+        return_bytes: bool = False,
+    ) -> ExportResult:
+        """
+        Export tree data held as parallel arrays as point features.
+
+        Equivalent to export_trees for callers that already have columns,
+        such as detection results, without building a dict per tree.
+
+        Args:
+            x: Tree X coordinates
+            y: Tree Y coordinates
+            z: Tree Z coordinates (omitted from points where zero)
+            attributes: Attribute name to per-tree values
+            format: Output format
+            filename: Output filename (auto-generated if None)
+            crs: Coordinate reference system
+            return_bytes: Also return the file contents in file_bytes
+
+        Returns:
+            ExportResult with file path or bytes
+        """
+        crs = crs or self.default_crs
+
+        points = self._iter_array_points(x, y, z, attributes or {})
+
+        return self._export_point_features(
+            points, format, filename, crs, return_bytes
+        )
+
+    def _export_point_features(
+        self,
+        points: Iterator[tuple[list[float], dict[str, Any]]],
+        format: ExportFormat,
+        filename: str | None,
+        crs: str,
+        return_bytes: bool,
+    ) -> ExportResult:
+        """Export (coordinates, properties) pairs in the requested format."""
+        # GeoJSON output encodes features one at a time straight from the
+        # points, so it never needs the whole feature list in memory
+        features: Iterable[dict[str, Any] | bytes]
+        if format == ExportFormat.GEOJSON:
+            features = self._encode_point_features(points)
+        else:
+            features = list(self._point_features(points))
 
         geojson = {
             "type": "FeatureCollection",
@@ -122,13 +240,21 @@ class SpatialExporter:
 
         # Export in requested format
         if format == ExportFormat.GEOJSON:
-            return self._export_geojson(geojson, filename, GeometryType.POINT, crs)
+            return self._export_geojson(
+                geojson, filename, GeometryType.POINT, crs, return_bytes
+            )
         elif format == ExportFormat.SHAPEFILE:
-            return self._export_shapefile(geojson, filename, GeometryType.POINT, crs)
+            return self._export_shapefile(
+                geojson, filename, GeometryType.POINT, crs, return_bytes
+            )
         elif format == ExportFormat.KML:
-            return self._export_kml(geojson, filename, GeometryType.POINT, crs)
+            return self._export_kml(
+                geojson, filename, GeometryType.POINT, crs, return_bytes
+            )
         elif format == ExportFormat.CSV:
-            return self._export_csv_with_wkt(geojson, filename, GeometryType.POINT, crs)
+            return self._export_csv_with_wkt(
+                geojson, filename, GeometryType.POINT, crs, return_bytes
+            )
         else:
             raise ValueError(f"Unsupported format: {format}")
 
@@ -138,6 +264,7 @@ class SpatialExporter:
         format: ExportFormat = ExportFormat.GEOJSON,
         filename: str | None = None,
         crs: str | None = None,
+        return_bytes: bool = False,
     ) -> ExportResult:
         """
         Export stand data as polygon features.
@@ -147,6 +274,7 @@ class SpatialExporter:
             format: Output format
             filename: Output filename
             crs: Coordinate reference system
+            return_bytes: Also return the file contents in file_bytes
 
         Returns:
             ExportResult with file path or bytes
@@ -167,11 +295,17 @@ class SpatialExporter:
 
         # Export in requested format
         if format == ExportFormat.GEOJSON:
-            return self._export_geojson(geojson, filename, GeometryType.POLYGON, crs)
+            return self._export_geojson(
+                geojson, filename, GeometryType.POLYGON, crs, return_bytes
+            )
         elif format == ExportFormat.SHAPEFILE:
-            return self._export_shapefile(geojson, filename, GeometryType.POLYGON, crs)
+            return self._export_shapefile(
+                geojson, filename, GeometryType.POLYGON, crs, return_bytes
+            )
         elif format == ExportFormat.KML:
-            return self._export_kml(geojson, filename, GeometryType.POLYGON, crs)
+            return self._export_kml(
+                geojson, filename, GeometryType.POLYGON, crs, return_bytes
+            )
         else:
             raise ValueError(f"Unsupported format for polygons: {format}")
 
@@ -181,8 +315,44 @@ class SpatialExporter:
         include_attributes: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Convert trees to GeoJSON point features."""
-        features = []
+        return list(
+            self._point_features(self._iter_tree_points(trees, include_attributes))
+        )
+
+    @staticmethod
+    def _point_features(
+        points: Iterable[tuple[list[float], dict[str, Any]]],
+    ) -> Iterator[dict[str, Any]]:
+        """Yield (coordinates, properties) pairs as GeoJSON point features."""
+        for coordinates, properties in points:
+            yield {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": coordinates},
+                "properties": properties,
+            }
+
+    @staticmethod
+    def _encode_point_features(
+        points: Iterable[tuple[list[float], dict[str, Any]]],
+    ) -> Iterator[bytes]:
+        """Yield (coordinates, properties) pairs as encoded GeoJSON features.
 
+        Fills a fixed template instead of building and serializing a nested
+        dict per feature.
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY
+        for coordinates, properties in points:
+            yield _POINT_FEATURE_JSON % (
+                orjson.dumps(coordinates, option=option),
+                orjson.dumps(properties, option=option),
+            )
+
+    def _iter_tree_points(
+        self,
+        trees: list[dict[str, Any]],
+        include_attributes: list[str] | None = None,
+    ) -> Iterator[tuple[list[float], dict[str, Any]]]:
+        """Yield (coordinates, properties) for each tree with a position."""
         # Default attributes to include
         default_attrs = [
             "tree_id", "id", "height", "height_m", "dbh", "dbh_cm",
@@ -193,6 +363,10 @@ class SpatialExporter:
 
         attrs_to_include = include_attributes or default_attrs
 
+        # Trees share a handful of schemas, so the attributes present are
+        # worked out once per distinct key layout rather than once per tree
+        present_by_schema: dict[tuple[str, ...], list[str]] = {}
+
         for tree in trees:
             # Get coordinates
             x = tree.get("x") or tree.get("position", {}).get("x")
@@ -202,16 +376,21 @@ class SpatialExporter:
             if x is None or y is None:
                 continue
 
+            schema = tuple(tree)
+            present = present_by_schema.get(schema)
+            if present is None:
+                present = [attr for attr in attrs_to_include if attr in tree]
+                present_by_schema[schema] = present
+
             # Build properties
             properties = {}
-            for attr in attrs_to_include:
-                if attr in tree:
-                    value = tree[attr]
-                    # Ensure JSON serializable
-                    if isinstance(value, (int, float, str, bool, type(None))):
-                        properties[attr] = value
-                    else:
-                        properties[attr] = str(value)
+            for attr in present:
+                value = tree[attr]
+                # Ensure JSON serializable
+                if isinstance(value, (int, float, str, bool, type(None))):
+                    properties[attr] = value
+                else:
+                    properties[attr] = str(value)
 
             # Standardize property names
             if "tree_id" not in properties and "id" in properties:
@@ -221,17 +400,46 @@ class SpatialExporter:
             if "dbh_cm" not in properties and "dbh" in properties:
                 properties["dbh_cm"] = properties.get("dbh")
 
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [float(x), float(y), float(z)] if z else [float(x), float(y)],
-                },
-                "properties": properties,
-            }
-            features.append(feature)
+            coordinates = [float(x), float(y), float(z)] if z else [float(x), float(y)]
+            yield coordinates, properties
 
-        return features
+    def _iter_array_points(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray | None,
+        attributes: dict[str, np.ndarray],
+    ) -> Iterator[tuple[list[float], dict[str, Any]]]:
+        """Yield (coordinates, properties) from parallel arrays."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        valid = np.isfinite(x) & np.isfinite(y)
+
+        # One bulk conversion to Python floats instead of float() per value
+        if z is None:
+            coords = np.column_stack((x[valid], y[valid])).tolist()
+        else:
+            z = np.asarray(z, dtype=np.float64)[valid]
+            coords = np.column_stack((x[valid], y[valid], z)).tolist()
+            # Match export_trees, which leaves Z off points at zero elevation
+            for i in np.flatnonzero(z == 0).tolist():
+                del coords[i][2]
+
+        # Standardize property names the same way as _iter_tree_points
+        attributes = dict(attributes)
+        if "tree_id" not in attributes and "id" in attributes:
+            attributes["tree_id"] = attributes.pop("id")
+        if "height_m" not in attributes and "height" in attributes:
+            attributes["height_m"] = attributes["height"]
+        if "dbh_cm" not in attributes and "dbh" in attributes:
+            attributes["dbh_cm"] = attributes["dbh"]
+
+        names = list(attributes)
+        columns = [np.asarray(attributes[name])[valid].tolist() for name in names]
+        rows = zip(*columns) if columns else ((),) * len(coords)
+
+        for point, values in zip(coords, rows):
+            yield point, dict(zip(names, values))
 
     def _stands_to_geojson_features(
         self,
@@ -295,28 +503,48 @@ class SpatialExporter:
         filename: str | None,
         geom_type: GeometryType,
         crs: str,
+        return_bytes: bool = False,
     ) -> ExportResult:
         """Export to GeoJSON format."""
-        filename = filename or f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.geojson"
+        now = datetime.now()
+        filename = filename or f"export_{now:%Y%m%d_%H%M%S}.geojson"
         if not filename.endswith(".geojson"):
             filename += ".geojson"
 
         file_path = os.path.join(self.output_dir, filename)
 
-        json_str = json.dumps(geojson, indent=2)
-        file_bytes = json_str.encode("utf-8")
-
-        with open(file_path, "w") as f:
-            f.write(json_str)
+        # Encode the collection members first, then stream the features
+        # one per line straight to the file so only a single feature is
+        # held in memory at a time
+        option = orjson.OPT_SERIALIZE_NUMPY
+        feature_count = 0
+        with open(file_path, "wb") as f:
+            f.write(b"{")
+            for key, value in geojson.items():
+                if key != "features":
+                    f.write(orjson.dumps(key))
+                    f.write(b":")
+                    f.write(orjson.dumps(value, option=option))
+                    f.write(b",")
+            f.write(b'"features":[\n')
+
+            for feature in geojson.get("features", []):
+                if feature_count:
+                    f.write(b",\n")
+                if not isinstance(feature, bytes):
+                    feature = orjson.dumps(feature, option=option)
+                f.write(feature)
+                feature_count += 1
+            f.write(b"\n]}\n")
 
         return ExportResult(
             format=ExportFormat.GEOJSON,
             file_path=file_path,
-            file_bytes=file_bytes,
-            feature_count=len(geojson.get("features", [])),
+            file_bytes=Path(file_path).read_bytes() if return_bytes else None,
+            feature_count=feature_count,
             geometry_type=geom_type,
             crs=crs,
-            created_at=datetime.now(),
+            created_at=now,
         )
 
     def _export_shapefile(
@@ -325,6 +553,7 @@ class SpatialExporter:
         filename: str | None,
         geom_type: GeometryType,
         crs: str,
+        return_bytes: bool = False,
     ) -> ExportResult:
         """
         Export to Shapefile format (zipped).
@@ -332,7 +561,8 @@ class SpatialExporter:
         Creates .shp, .shx, .dbf, .prj files in a zip archive.
         Uses pure Python implementation without GDAL.
         """
-        filename = filename or f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        filename = filename or f"export_{now:%Y%m%d_%H%M%S}"
         if filename.endswith(".shp") or filename.endswith(".zip"):
             filename = filename.rsplit(".", 1)[0]
 
@@ -340,226 +570,199 @@ class SpatialExporter:
         if not features:
             raise ValueError("No features to export")
 
-        # Create temporary directory for shapefile components
-        temp_dir = tempfile.mkdtemp()
-
-        try:
-            # Write shapefile components
-            shp_path = os.path.join(temp_dir, f"{filename}.shp")
-            shx_path = os.path.join(temp_dir, f"{filename}.shx")
-            dbf_path = os.path.join(temp_dir, f"{filename}.dbf")
-            prj_path = os.path.join(temp_dir, f"{filename}.prj")
-
-            # Write using simple shapefile writer
-            self._write_shapefile_components(
-                features, shp_path, shx_path, dbf_path, geom_type
-            )
-
-            # Write PRJ file
-            self._write_prj_file(prj_path, crs)
-
-            # Create zip archive
-            zip_path = os.path.join(self.output_dir, f"{filename}.zip")
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for ext in [".shp", ".shx", ".dbf", ".prj"]:
-                    src_path = os.path.join(temp_dir, f"{filename}{ext}")
-                    if os.path.exists(src_path):
-                        zf.write(src_path, f"{filename}{ext}")
-
-            # Read zip bytes
-            with open(zip_path, "rb") as f:
-                file_bytes = f.read()
-
-            return ExportResult(
-                format=ExportFormat.SHAPEFILE,
-                file_path=zip_path,
-                file_bytes=file_bytes,
-                feature_count=len(features),
-                geometry_type=geom_type,
-                crs=crs,
-                created_at=datetime.now(),
-            )
+        components = self._build_shapefile_components(features, geom_type)
+        components[".prj"] = self._build_prj_file(crs)
+
+        # Zip the in-memory components straight into the output archive.
+        # Level 1 deflate is roughly 3x faster than the default level 6 on
+        # coordinate data for ~10% more bytes.
+        zip_path = os.path.join(self.output_dir, f"{filename}.zip")
+        compression = zipfile.ZIP_DEFLATED if self.compresslevel else zipfile.ZIP_STORED
+        with zipfile.ZipFile(
+            zip_path, "w", compression, compresslevel=self.compresslevel or None
+        ) as zf:
+            for ext, data in components.items():
+                zf.writestr(f"{filename}{ext}", data)
+        del components
 
-        finally:
-            # Cleanup temp directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        return ExportResult(
+            format=ExportFormat.SHAPEFILE,
+            file_path=zip_path,
+            file_bytes=Path(zip_path).read_bytes() if return_bytes else None,
+            feature_count=len(features),
+            geometry_type=geom_type,
+            crs=crs,
+            created_at=now,
+        )
 
-    def _write_shapefile_components(
+    def _build_shapefile_components(
         self,
         features: list[dict[str, Any]],
-        shp_path: str,
-        shx_path: str,
-        dbf_path: str,
         geom_type: GeometryType,
-    ) -> None:
-        """Write shapefile components using pure Python."""
-        import struct
-
-        # Determine bounds
-        min_x = min_y = float("inf")
-        max_x = max_y = float("-inf")
+    ) -> dict[str, bytes]:
+        """Build SHP, SHX and DBF contents using pure Python, keyed by extension."""
+        # Determine bounds from all XY pairs gathered into one array
+        geometries = [feature.get("geometry", {}) for feature in features]
+        if geom_type == GeometryType.POINT:
+            xy = [
+                (coords[0], coords[1])
+                for coords in (geom.get("coordinates", []) for geom in geometries)
+                if len(coords) >= 2
+            ]
+        elif geom_type == GeometryType.POLYGON:
+            xy = [
+                (pt[0], pt[1])
+                for geom in geometries
+                for ring in geom.get("coordinates", [])
+                for pt in ring
+                if len(pt) >= 2
+            ]
+        else:
+            xy = []
 
-        for feature in features:
-            geom = feature.get("geometry", {})
-            coords = geom.get("coordinates", [])
-            if geom_type == GeometryType.POINT:
-                if len(coords) >= 2:
-                    min_x = min(min_x, coords[0])
-                    max_x = max(max_x, coords[0])
-                    min_y = min(min_y, coords[1])
-                    max_y = max(max_y, coords[1])
-            elif geom_type == GeometryType.POLYGON:
-                for ring in coords:
-                    for pt in ring:
-                        if len(pt) >= 2:
-                            min_x = min(min_x, pt[0])
-                            max_x = max(max_x, pt[0])
-                            min_y = min(min_y, pt[1])
-                            max_y = max(max_y, pt[1])
+        points = np.array(xy, dtype=np.float64).reshape(-1, 2)
+        if len(points):
+            min_x, min_y = points.min(axis=0).tolist()
+            max_x, max_y = points.max(axis=0).tolist()
+        else:
+            min_x = min_y = float("inf")
+            max_x = max_y = float("-inf")
 
         # Shape type codes
         shape_type = 1 if geom_type == GeometryType.POINT else 5  # Point=1, Polygon=5
 
-        # Write SHP file
-        shp_records = []
+        # SHP records and their SHX index entries are emitted in one pass
+        shp_body = bytearray()
+        shx_body = bytearray()
+        offset = 50  # Header is 100 bytes = 50 words
         record_num = 1
 
         for feature in features:
             geom = feature.get("geometry", {})
             coords = geom.get("coordinates", [])
+            record_data = None
 
             if geom_type == GeometryType.POINT:
                 if len(coords) >= 2:
                     # Point record: shape_type (4 bytes) + x (8 bytes) + y (8 bytes)
-                    record_data = struct.pack("<i", shape_type)
-                    record_data += struct.pack("<d", coords[0])
-                    record_data += struct.pack("<d", coords[1])
-                    shp_records.append((record_num, record_data))
-                    record_num += 1
+                    record_data = _POINT_RECORD.pack(shape_type, coords[0], coords[1])
 
             elif geom_type == GeometryType.POLYGON:
                 if coords:
                     # Calculate polygon bounds
-                    all_points = []
-                    for ring in coords:
-                        all_points.extend(ring)
+                    all_points = np.array(
+                        [(p[0], p[1]) for ring in coords for p in ring],
+                        dtype=np.float64,
+                    ).reshape(-1, 2)
 
-                    if all_points:
-                        ring_min_x = min(p[0] for p in all_points)
-                        ring_max_x = max(p[0] for p in all_points)
-                        ring_min_y = min(p[1] for p in all_points)
-                        ring_max_y = max(p[1] for p in all_points)
+                    if len(all_points):
+                        ring_min_x, ring_min_y = all_points.min(axis=0).tolist()
+                        ring_max_x, ring_max_y = all_points.max(axis=0).tolist()
 
                         # Polygon record structure
                         num_parts = len(coords)
                         num_points = sum(len(ring) for ring in coords)
 
-                        record_data = struct.pack("<i", shape_type)
-                        record_data += struct.pack("<4d", ring_min_x, ring_min_y, ring_max_x, ring_max_y)
-                        record_data += struct.pack("<i", num_parts)
-                        record_data += struct.pack("<i", num_points)
-
-                        # Part indices
+                        # Part indices are the running start offset of each ring
+                        part_starts = []
                         idx = 0
                         for ring in coords:
-                            record_data += struct.pack("<i", idx)
+                            part_starts.append(idx)
                             idx += len(ring)
 
-                        # Points
-                        for ring in coords:
-                            for pt in ring:
-                                record_data += struct.pack("<2d", pt[0], pt[1])
-
-                        shp_records.append((record_num, record_data))
-                        record_num += 1
-
-        # Calculate file length
-        content_length = sum(8 + len(r[1]) for r in shp_records)  # 8 bytes per record header
-        file_length = (100 + content_length) // 2  # In 16-bit words
-
-        # Write SHP header
-        with open(shp_path, "wb") as f:
-            # File header (100 bytes)
-            f.write(struct.pack(">i", 9994))  # File code
-            f.write(b"\x00" * 20)  # Unused
-            f.write(struct.pack(">i", file_length))  # File length in 16-bit words
-            f.write(struct.pack("<i", 1000))  # Version
-            f.write(struct.pack("<i", shape_type))  # Shape type
-            f.write(struct.pack("<8d", min_x, min_y, max_x, max_y, 0, 0, 0, 0))  # Bounding box
-
-            # Records
-            for rec_num, rec_data in shp_records:
-                content_len = len(rec_data) // 2
-                f.write(struct.pack(">i", rec_num))
-                f.write(struct.pack(">i", content_len))
-                f.write(rec_data)
-
-        # Write SHX file (index)
-        with open(shx_path, "wb") as f:
-            shx_length = (100 + 8 * len(shp_records)) // 2
-
-            # Header
-            f.write(struct.pack(">i", 9994))
-            f.write(b"\x00" * 20)
-            f.write(struct.pack(">i", shx_length))
-            f.write(struct.pack("<i", 1000))
-            f.write(struct.pack("<i", shape_type))
-            f.write(struct.pack("<8d", min_x, min_y, max_x, max_y, 0, 0, 0, 0))
-
-            # Index records
-            offset = 50  # Header is 100 bytes = 50 words
-            for rec_num, rec_data in shp_records:
-                content_len = len(rec_data) // 2
-                f.write(struct.pack(">i", offset))
-                f.write(struct.pack(">i", content_len))
-                offset += 4 + content_len  # Record header (8 bytes = 4 words) + content
-
-        # Write DBF file (attributes)
-        self._write_dbf_file(dbf_path, features)
-
-    def _write_dbf_file(
-        self,
-        dbf_path: str,
-        features: list[dict[str, Any]],
-    ) -> None:
-        """Write DBF file with feature attributes."""
-        import struct
+                        record_data = b"".join(
+                            (
+                                _POLYGON_HEADER.pack(
+                                    shape_type,
+                                    ring_min_x,
+                                    ring_min_y,
+                                    ring_max_x,
+                                    ring_max_y,
+                                    num_parts,
+                                    num_points,
+                                ),
+                                struct.pack(f"<{num_parts}i", *part_starts),
+                                all_points.astype("<f8", copy=False).tobytes(),
+                            )
+                        )
+
+            if record_data is None:
+                continue
+
+            content_len = len(record_data) // 2
+            shp_body += _RECORD_HEADER.pack(record_num, content_len)
+            shp_body += record_data
+            shx_body += _RECORD_HEADER.pack(offset, content_len)
+            offset += 4 + content_len  # Record header (8 bytes = 4 words) + content
+            record_num += 1
+
+        # File lengths in 16-bit words
+        file_length = (100 + len(shp_body)) // 2
+        shx_length = (100 + len(shx_body)) // 2
+
+        bounds = (min_x, min_y, max_x, max_y)
+
+        return {
+            ".shp": self._shapefile_header(file_length, shape_type, bounds) + shp_body,
+            ".shx": self._shapefile_header(shx_length, shape_type, bounds) + shx_body,
+            ".dbf": self._build_dbf_file(features),  # Attributes
+        }
+
+    @staticmethod
+    def _shapefile_header(
+        file_length: int,
+        shape_type: int,
+        bounds: tuple[float, float, float, float],
+    ) -> bytes:
+        """Build the 100-byte header shared by SHP and SHX files."""
+        return b"".join(
+            (
+                struct.pack(">i", 9994),  # File code
+                b"\x00" * 20,  # Unused
+                struct.pack(">i", file_length),  # File length in 16-bit words
+                struct.pack("<i", 1000),  # Version
+                struct.pack("<i", shape_type),  # Shape type
+                struct.pack("<8d", *bounds, 0, 0, 0, 0),  # Bounding box
+            )
+        )
 
+    def _build_dbf_file(self, features: list[dict[str, Any]]) -> bytes:
+        """Build DBF file contents with feature attributes."""
         if not features:
-            return
+            return b""
 
-        # Get all unique property keys and determine types
-        all_keys = set()
+        # One pass over all properties records each field's first non-null
+        # value, which decides its type, and which fields hold any float so
+        # integer fields with fractional values are not truncated
+        first_values: dict[str, Any] = {}
+        float_keys: set[str] = set()
         for f in features:
-            all_keys.update(f.get("properties", {}).keys())
+            for key, val in f.get("properties", {}).items():
+                if first_values.get(key) is None:
+                    first_values[key] = val
+                if isinstance(val, float):
+                    float_keys.add(key)
 
         # Limit field names to 10 characters (DBF limit)
         fields = []
-        for key in sorted(all_keys):
+        for key in sorted(first_values):
             field_name = key[:10].upper()
-            # Determine field type from first non-null value
+            val = first_values[key]
             field_type = "C"  # Character (default)
             field_size = 50
             field_decimal = 0
 
-            for f in features:
-                val = f.get("properties", {}).get(key)
-                if val is not None:
-                    if isinstance(val, bool):
-                        field_type = "L"
-                        field_size = 1
-                    elif isinstance(val, int):
-                        field_type = "N"
-                        field_size = 18
-                        field_decimal = 0
-                    elif isinstance(val, float):
-                        field_type = "N"
-                        field_size = 18
-                        field_decimal = 8
-                    else:
-                        field_type = "C"
-                        field_size = min(254, max(50, len(str(val))))
-                    break
+            if val is not None:
+                if isinstance(val, bool):
+                    field_type = "L"
+                    field_size = 1
+                elif isinstance(val, (int, float)):
+                    field_type = "N"
+                    field_size = 18
+                    field_decimal = 8 if key in float_keys else 0
+                else:
+                    field_type = "C"
+                    field_size = min(254, max(50, len(str(val))))
 
             fields.append((key, field_name, field_type, field_size, field_decimal))
 
@@ -567,66 +770,64 @@ class SpatialExporter:
         header_size = 32 + (32 * len(fields)) + 1
         record_size = 1 + sum(f[3] for f in fields)  # 1 byte deletion flag + field sizes
 
-        with open(dbf_path, "wb") as f:
-            # Header
-            f.write(struct.pack("<B", 3))  # Version (dBASE III)
-            f.write(struct.pack("<3B", 24, 1, 1))  # Date (YY, MM, DD)
-            f.write(struct.pack("<I", len(features)))  # Number of records
-            f.write(struct.pack("<H", header_size))  # Header size
-            f.write(struct.pack("<H", record_size))  # Record size
-            f.write(b"\x00" * 20)  # Reserved
-
-            # Field descriptors
-            for key, name, ftype, size, decimal in fields:
-                f.write(name.encode("ascii").ljust(11, b"\x00"))
-                f.write(ftype.encode("ascii"))
-                f.write(b"\x00" * 4)  # Reserved
-                f.write(struct.pack("<B", size))
-                f.write(struct.pack("<B", decimal))
-                f.write(b"\x00" * 14)  # Reserved
-
-            f.write(b"\x0d")  # Header terminator
-
-            # Records
-            for feature in features:
-                props = feature.get("properties", {})
-                f.write(b" ")  # Deletion flag (space = not deleted)
-
-                for key, name, ftype, size, decimal in fields:
-                    val = props.get(key, "")
-
-                    if ftype == "N":
-                        if val is None or val == "":
-                            val_str = " " * size
-                        else:
-                            if decimal > 0:
-                                val_str = f"{float(val):{size}.{decimal}f}"
-                            else:
-                                val_str = f"{int(val):{size}d}"
-                    elif ftype == "L":
-                        val_str = "T" if val else "F"
+        buf = bytearray()
+        # Header
+        buf += struct.pack("<B", 3)  # Version (dBASE III)
+        buf += struct.pack("<3B", 24, 1, 1)  # Date (YY, MM, DD)
+        buf += struct.pack("<I", len(features))  # Number of records
+        buf += struct.pack("<H", header_size)  # Header size
+        buf += struct.pack("<H", record_size)  # Record size
+        buf += b"\x00" * 20  # Reserved
+
+        # Field descriptors
+        for key, name, ftype, size, decimal in fields:
+            buf += name.encode("ascii").ljust(11, b"\x00")
+            buf += ftype.encode("ascii")
+            buf += b"\x00" * 4  # Reserved
+            buf += struct.pack("<B", size)
+            buf += struct.pack("<B", decimal)
+            buf += b"\x00" * 14  # Reserved
+
+        buf += b"\x0d"  # Header terminator
+
+        # Records are formatted as text and encoded a row at a time; ASCII
+        # with "replace" maps each character to one byte, so padding and
+        # truncating the text is the same as doing it on the bytes
+        cell_specs = [
+            (key, ftype, size, decimal, f"{size}.{decimal}f" if decimal else f"{size}d")
+            for key, _, ftype, size, decimal in fields
+        ]
+        for feature in features:
+            props = feature.get("properties", {})
+            cells = [" "]  # Deletion flag (space = not deleted)
+
+            for key, ftype, size, decimal, spec in cell_specs:
+                val = props.get(key, "")
+
+                if ftype == "N":
+                    if val is None or val == "":
+                        val_str = ""
+                    elif decimal:
+                        val_str = format(float(val), spec)
                     else:
-                        val_str = str(val) if val is not None else ""
+                        val_str = format(int(val), spec)
+                elif ftype == "L":
+                    val_str = "T" if val else "F"
+                else:
+                    val_str = str(val) if val is not None else ""
 
-                    # Pad or truncate to field size
-                    val_bytes = val_str.encode("ascii", errors="replace")[:size].ljust(size)
-                    f.write(val_bytes)
+                # Pad or truncate to field size
+                cells.append(val_str[:size].ljust(size))
 
-            f.write(b"\x1a")  # EOF marker
+            buf += "".join(cells).encode("ascii", errors="replace")
 
-    def _write_prj_file(self, prj_path: str, crs: str) -> None:
-        """Write PRJ file with coordinate system definition."""
-        # Common CRS WKT strings
-        crs_wkt = {
-            "EPSG:4326": 'GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137,298.257223563]],PRIMEM["Greenwich",0],UNIT["Degree",0.017453292519943295]]',
-            "EPSG:3857": 'PROJCS["WGS_1984_Web_Mercator_Auxiliary_Sphere",GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137.0,298.257223563]],PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]],PROJECTION["Mercator_Auxiliary_Sphere"],PARAMETER["False_Easting",0.0],PARAMETER["False_Northing",0.0],PARAMETER["Central_Meridian",0.0],PARAMETER["Standard_Parallel_1",0.0],PARAMETER["Auxiliary_Sphere_Type",0.0],UNIT["Meter",1.0]]',
-            "EPSG:32610": 'PROJCS["WGS_1984_UTM_Zone_10N",GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137,298.257223563]],PRIMEM["Greenwich",0],UNIT["Degree",0.017453292519943295]],PROJECTION["Transverse_Mercator"],PARAMETER["latitude_of_origin",0],PARAMETER["central_meridian",-123],PARAMETER["scale_factor",0.9996],PARAMETER["false_easting",500000],PARAMETER["false_northing",0],UNIT["Meter",1]]',
-        }
+        buf += b"\x1a"  # EOF marker
 
-        wkt = crs_wkt.get(crs, crs_wkt["EPSG:4326"])
+        return bytes(buf)
 
-        with open(prj_path, "w") as f:
-            f.write(wkt)
+    def _build_prj_file(self, crs: str) -> bytes:
+        """Build PRJ file contents with coordinate system definition."""
+        return _wkt_for(crs).encode("utf-8")
 
     def _export_kml(
         self,
@@ -634,20 +835,23 @@ class SpatialExporter:
         filename: str | None,
         geom_type: GeometryType,
         crs: str,
+        return_bytes: bool = False,
     ) -> ExportResult:
         """Export to KML format for Google Earth."""
-        filename = filename or f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.kml"
+        now = datetime.now()
+        filename = filename or f"export_{now:%Y%m%d_%H%M%S}.kml"
         if not filename.endswith(".kml"):
             filename += ".kml"
 
         features = geojson.get("features", [])
 
-        # Build KML document
+        # Build KML document; text content is escaped so names such as
+        # "Alder & Co" still produce well-formed XML
         kml_parts = [
             '<?xml version="1.0" encoding="UTF-8"?>',
             '<kml xmlns="http://www.opengis.net/kml/2.2">',
             "<Document>",
-            f"<name>{filename}</name>",
+            f"<name>{escape(filename)}</name>",
         ]
 
         for feature in features:
@@ -658,7 +862,7 @@ class SpatialExporter:
             name = props.get("tree_id") or props.get("stand_id") or "Feature"
 
             kml_parts.append("<Placemark>")
-            kml_parts.append(f"<name>{name}</name>")
+            kml_parts.append(f"<name>{escape(str(name))}</name>")
 
             # Description from properties
             desc_parts = []
@@ -666,7 +870,7 @@ class SpatialExporter:
                 if v is not None:
                     desc_parts.append(f"{k}: {v}")
             if desc_parts:
-                kml_parts.append(f"<description>{chr(10).join(desc_parts)}</description>")
+                kml_parts.append(f"<description>{escape(chr(10).join(desc_parts))}</description>")
 
             # Geometry
             if geom_type == GeometryType.POINT:
@@ -695,21 +899,20 @@ class SpatialExporter:
 
         kml_parts.extend(["</Document>", "</kml>"])
 
-        kml_str = "\n".join(kml_parts)
-        file_bytes = kml_str.encode("utf-8")
+        file_bytes = "\n".join(kml_parts).encode("utf-8")
 
         file_path = os.path.join(self.output_dir, filename)
-        with open(file_path, "w") as f:
-            f.write(kml_str)
+        with open(file_path, "wb") as f:
+            f.write(file_bytes)
 
         return ExportResult(
             format=ExportFormat.KML,
             file_path=file_path,
-            file_bytes=file_bytes,
+            file_bytes=file_bytes if return_bytes else None,
             feature_count=len(features),
             geometry_type=geom_type,
             crs="EPSG:4326",  # KML is always WGS84
-            created_at=datetime.now(),
+            created_at=now,
         )
 
     def _export_csv_with_wkt(
@@ -718,9 +921,11 @@ class SpatialExporter:
         filename: str | None,
         geom_type: GeometryType,
         crs: str,
+        return_bytes: bool = False,
     ) -> ExportResult:
         """Export to CSV with WKT geometry column."""
-        filename = filename or f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        now = datetime.now()
+        filename = filename or f"export_{now:%Y%m%d_%H%M%S}.csv"
         if not filename.endswith(".csv"):
             filename += ".csv"
 
@@ -735,9 +940,11 @@ class SpatialExporter:
             all_keys.update(f.get("properties", {}).keys())
         all_keys = sorted(all_keys)
 
-        # Build CSV
-        headers = ["WKT"] + list(all_keys)
-        rows = [",".join(headers)]
+        # Build CSV; the writer handles quoting and escaping of embedded
+        # delimiters and quotes, and writes None as an empty field
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["WKT", *all_keys])
 
         for feature in features:
             geom = feature.get("geometry", {})
@@ -762,33 +969,20 @@ class SpatialExporter:
             else:
                 wkt = ""
 
-            # Build row
-            row_values = [f'"{wkt}"']
-            for key in all_keys:
-                val = props.get(key, "")
-                if val is None:
-                    val = ""
-                elif isinstance(val, str):
-                    val = f'"{val}"'
-                else:
-                    val = str(val)
-                row_values.append(val)
-
-            rows.append(",".join(row_values))
+            writer.writerow([wkt, *[props.get(key) for key in all_keys]])
 
-        csv_str = "\n".join(rows)
-        file_bytes = csv_str.encode("utf-8")
+        file_bytes = buffer.getvalue().encode("utf-8")
 
         file_path = os.path.join(self.output_dir, filename)
-        with open(file_path, "w") as f:
-            f.write(csv_str)
+        with open(file_path, "wb") as f:
+            f.write(file_bytes)
 
         return ExportResult(
             format=ExportFormat.CSV,
             file_path=file_path,
-            file_bytes=file_bytes,
+            file_bytes=file_bytes if return_bytes else None,
             feature_count=len(features),
             geometry_type=geom_type,
             crs=crs,
-            created_at=datetime.now(),
+            created_at=now,
         )
@@ -10,13 +10,11 @@ Sprint 13-14: Species Classification ML System
 from __future__ import annotations
 
 import logging
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import joblib
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import LabelEncoder, StandardScaler
 
 from lidar_processing.config import Settings, get_settings
 from lidar_processing.models import (
@@ -29,14 +27,127 @@ from lidar_processing.services.species_config import (
     SPECIES_BY_REGION,
     get_species_codes_for_region,
     get_species_for_region,
-    get_species_info,
 )
 
 if TYPE_CHECKING:
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.preprocessing import LabelEncoder, StandardScaler
+
     from lidar_processing.models import LabeledTree
 
 logger = logging.getLogger(__name__)
 
+# Batches up to this size are scored with the flattened forest; larger
+# batches amortize scikit-learn's per-estimator overhead and use it instead.
+_FLAT_FOREST_MAX_ROWS = 256
+
+
+@cache
+def _region_arrays(region: str) -> dict[str, np.ndarray]:
+    """
+    Build a region's heuristic species traits as parallel arrays.
+
+    Arrays are shared between classifiers of the same region and are
+    therefore read-only.
+
+    Args:
+        region: Region code.
+
+    Returns:
+        Dictionary of arrays aligned with the region's species codes.
+    """
+    species_dict = get_species_for_region(region)
+    species = species_dict.values()
+
+    arrays = {
+        "codes": np.array(list(species_dict)),
+        "height_min": np.array([info.typical_height_range[0] for info in species]),
+        "height_max": np.array([info.typical_height_range[1] for info in species]),
+        "crown_ratio": np.array([info.typical_crown_ratio for info in species]),
+        "is_conifer": np.array([info.category == "conifer" for info in species]),
+        "is_deciduous": np.array([info.category == "deciduous" for info in species]),
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+
+    return arrays
+
+
+class _FlatForest:
+    """
+    Random forest flattened into contiguous node arrays.
+
+    All trees are concatenated so a batch walks every tree at once, one
+    level per step, instead of paying scikit-learn's Python overhead per
+    estimator. Probabilities match ``RandomForestClassifier.predict_proba``.
+    """
+
+    def __init__(self, model: RandomForestClassifier) -> None:
+        """
+        Flatten the estimators of a fitted forest.
+
+        Args:
+            model: Fitted random forest classifier.
+        """
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+
+        feature = []
+        left = []
+        right = []
+        value = []
+        for tree, offset in zip(trees, offsets[:-1], strict=True):
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left < 0
+
+            # Leaves point at themselves so extra steps keep rows in place
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            left.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+
+            # scikit-learn < 1.4 stores class counts rather than fractions
+            tree_value = tree.value[:, 0, : model.n_classes_]
+            normalizer = tree_value.sum(axis=1)
+            if not np.allclose(normalizer[is_leaf], 1.0):
+                normalizer[normalizer == 0.0] = 1.0
+                tree_value = tree_value / normalizer[:, np.newaxis]
+            value.append(tree_value)
+
+        self.roots = offsets[:-1]
+        self.feature = np.concatenate(feature).astype(np.intp)
+        self.threshold = np.concatenate([tree.threshold for tree in trees])
+        self.left = np.concatenate(left)
+        self.right = np.concatenate(right)
+        self.value = np.concatenate(value)
+        self.depth = max(tree.max_depth for tree in trees)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict class probabilities for a scaled feature matrix.
+
+        Args:
+            X: Scaled feature matrix without missing values.
+
+        Returns:
+            Array of shape (n_samples, n_classes).
+        """
+        # Trees compare float32 features against float64 thresholds
+        X = X.astype(np.float32)
+        rows = np.arange(len(X))[:, np.newaxis]
+
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            node = np.where(
+                X[rows, self.feature[node]] <= self.threshold[node],
+                self.left[node],
+                self.right[node],
+            )
+
+        # Sum trees in estimator order, as the forest does, then average
+        probabilities = np.add.reduce(self.value[node.T], axis=0)
+        probabilities /= len(self.roots)
+        return probabilities
+
 
 class SpeciesClassifier:
     """
@@ -51,6 +162,7 @@ class SpeciesClassifier:
         label_encoder: Encoder for species labels.
         region: Geographic region for species lookup.
         feature_extractor: Feature extraction utility.
+        n_jobs: Number of threads used by the forest.
     """
 
     def __init__(
@@ -58,6 +170,7 @@ class SpeciesClassifier:
         model_path: str | None = None,
         region: str = "pnw",
         settings: Settings | None = None,
+        n_jobs: int = -1,
     ) -> None:
         """
         Initialize the species classifier.
@@ -66,9 +179,12 @@ class SpeciesClassifier:
             model_path: Path to a pre-trained model file. If None, creates new model.
             region: Geographic region for species lookup (default: 'pnw').
             settings: Optional settings instance.
+            n_jobs: Threads the forest uses for fitting and batch inference
+                (-1 for all cores). Use 1 when calling from a thread pool.
         """
         self.settings = settings or get_settings()
         self.region = region.lower()
+        self.n_jobs = n_jobs
         self.feature_extractor = TreeFeatureExtractor(self.settings)
 
         # Initialize model components
@@ -78,6 +194,17 @@ class SpeciesClassifier:
         self._feature_names: list[str] | None = None
         self._is_trained: bool = False
 
+        # Decoded class codes and display names, indexed by encoded label
+        self._classes: list[str] = []
+        self._class_names: list[str] = []
+
+        # Flattened copy of the forest for small batches
+        self._flat_forest: _FlatForest | None = None
+
+        # Fitted scaler statistics, applied directly on the prediction path
+        self._scaler_mean: np.ndarray | None = None
+        self._scaler_scale: np.ndarray | None = None
+
         # Validate region
         if self.region not in SPECIES_BY_REGION:
             available = list(SPECIES_BY_REGION.keys())
@@ -85,6 +212,8 @@ class SpeciesClassifier:
                 f"Unknown region '{region}'. Available regions: {available}"
             )
 
+        self._cache_species_arrays()
+
         # Load model if path provided
         if model_path is not None:
             self.load_model(model_path)
@@ -100,6 +229,9 @@ class SpeciesClassifier:
         based on tree structural characteristics. In production, this would
         be replaced with a properly trained model.
         """
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import LabelEncoder, StandardScaler
+
         logger.info("Initializing mock pre-trained model for region: %s", self.region)
 
         species_codes = get_species_codes_for_region(self.region)
@@ -107,6 +239,7 @@ class SpeciesClassifier:
         # Initialize components
         self.label_encoder = LabelEncoder()
         self.label_encoder.fit(species_codes)
+        self._cache_classes()
 
         self.scaler = StandardScaler()
         self._feature_names = self.feature_extractor.get_feature_names(
@@ -142,6 +275,7 @@ class SpeciesClassifier:
 
         # Fit scaler
         self.scaler.fit(X_synthetic)
+        self._cache_scaler()
         X_scaled = self.scaler.transform(X_synthetic)
 
         # Create and train the model
@@ -151,9 +285,10 @@ class SpeciesClassifier:
             min_samples_split=5,
             min_samples_leaf=2,
             random_state=42,
-            n_jobs=-1,
+            n_jobs=self.n_jobs,
         )
         self.model.fit(X_scaled, y_synthetic)
+        self._flat_forest = _FlatForest(self.model)
 
         self._is_trained = True
         logger.info(
@@ -161,6 +296,45 @@ class SpeciesClassifier:
             n_classes,
         )
 
+    def _cache_species_arrays(self) -> None:
+        """Cache the region's species trait arrays and display names."""
+        self._species_arrays = _region_arrays(self.region)
+        self._species_names = {
+            code: info.name
+            for code, info in get_species_for_region(self.region).items()
+        }
+
+    def _cache_classes(self) -> None:
+        """Cache the encoder's class codes and their species names."""
+        self._classes = self.label_encoder.classes_.tolist()
+        self._class_names = [self._species_name(code) for code in self._classes]
+
+    def _species_name(self, code: str) -> str:
+        """Get the display name of a species code for the current region."""
+        return self._species_names.get(code, f"Unknown ({code})")
+
+    def _cache_scaler(self) -> None:
+        """Cache the fitted scaler statistics as plain arrays."""
+        self._scaler_mean = np.asarray(self.scaler.mean_, dtype=np.float64)
+        self._scaler_scale = np.asarray(self.scaler.scale_, dtype=np.float64)
+
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """
+        Standardize a feature matrix in place.
+
+        Equivalent to ``self.scaler.transform(X)`` without sklearn's
+        per-call input validation and copy.
+
+        Args:
+            X: Float64 feature matrix owned by the caller.
+
+        Returns:
+            The scaled matrix (``X`` itself).
+        """
+        X -= self._scaler_mean
+        X /= self._scaler_scale
+        return X
+
     def predict(
         self,
         tree_features: list[TreeFeatures],
@@ -183,7 +357,39 @@ class SpeciesClassifier:
         if not tree_features:
             return []
 
-        return [self.predict_single(features) for features in tree_features]
+        # Score every tree in one scaler and forest call
+        X = self.feature_extractor.get_feature_matrix(tree_features)
+        X = self._scale(X)
+        if len(X) <= _FLAT_FOREST_MAX_ROWS and not np.isnan(X).any():
+            probabilities = self._flat_forest.predict_proba(X)
+        else:
+            probabilities = self.model.predict_proba(X)
+        predicted_idx = probabilities.argmax(axis=1)
+
+        # Encoded label of each prediction and its rounded probability
+        predicted_classes = self.model.classes_[predicted_idx]
+        rounded = np.round(probabilities, 4)
+        confidences = rounded[np.arange(len(X)), predicted_idx]
+
+        classes = self._classes
+        class_names = self._class_names
+        predictions = []
+        for label, confidence, row in zip(
+            predicted_classes.tolist(),
+            confidences.tolist(),
+            rounded.tolist(),
+            strict=True,
+        ):
+            predictions.append(
+                SpeciesPrediction(
+                    species_code=classes[label],
+                    species_name=class_names[label],
+                    confidence=confidence,
+                    probabilities=dict(zip(classes, row, strict=True)),
+                )
+            )
+
+        return predictions
 
     def predict_single(
         self,
@@ -201,45 +407,7 @@ class SpeciesClassifier:
         Raises:
             ValueError: If model is not trained.
         """
-        if not self._is_trained or self.model is None:
-            raise ValueError("Model is not trained. Call train() or load a model first.")
-
-        # Convert features to vector
-        feature_vector = self.feature_extractor.get_feature_vector(features)
-
-        # Scale features
-        feature_vector_scaled = self.scaler.transform(feature_vector.reshape(1, -1))
-
-        # Get prediction and probabilities
-        predicted_class = self.model.predict(feature_vector_scaled)[0]
-        probabilities = self.model.predict_proba(feature_vector_scaled)[0]
-
-        # Decode species code
-        species_code = self.label_encoder.inverse_transform([predicted_class])[0]
-
-        # Get species info
-        try:
-            species_info = get_species_info(self.region, species_code)
-            species_name = species_info.name
-        except ValueError:
-            species_name = f"Unknown ({species_code})"
-
-        # Create probability dictionary
-        all_species_codes = self.label_encoder.classes_
-        prob_dict = {
-            code: round(float(prob), 4)
-            for code, prob in zip(all_species_codes, probabilities)
-        }
-
-        # Confidence is the probability of the predicted class
-        confidence = float(probabilities[predicted_class])
-
-        return SpeciesPrediction(
-            species_code=species_code,
-            species_name=species_name,
-            confidence=round(confidence, 4),
-            probabilities=prob_dict,
-        )
+        return self.predict([features])[0]
 
     def predict_with_heuristics(
         self,
@@ -258,28 +426,53 @@ class SpeciesClassifier:
         Returns:
             SpeciesPrediction with potentially adjusted prediction.
         """
-        # Get base ML prediction
-        ml_prediction = self.predict_single(features)
+        return self.predict_batch_with_heuristics([features])[0]
+
+    def predict_batch_with_heuristics(
+        self,
+        tree_features: list[TreeFeatures],
+    ) -> list[SpeciesPrediction]:
+        """
+        Predict species for multiple trees using the model and heuristics.
+
+        Low-confidence predictions of the whole batch are re-scored
+        against the region's species traits in one vectorized pass.
+
+        Args:
+            tree_features: List of TreeFeatures for each tree.
+
+        Returns:
+            List of SpeciesPrediction results, potentially adjusted.
+        """
+        # Get base ML predictions
+        predictions = self.predict(tree_features)
 
         # If confidence is high enough, trust the ML model
-        if ml_prediction.confidence >= 0.6:
-            return ml_prediction
+        low_confidence = [
+            i for i, prediction in enumerate(predictions)
+            if prediction.confidence < 0.6
+        ]
+        if not low_confidence:
+            return predictions
 
         # Apply heuristics for low-confidence predictions
-        adjusted_code = self._apply_heuristics(features, ml_prediction)
+        adjusted_codes = self._apply_heuristics(
+            [tree_features[i] for i in low_confidence],
+            [predictions[i].species_code for i in low_confidence],
+        )
+
+        for i, adjusted_code in zip(low_confidence, adjusted_codes, strict=True):
+            ml_prediction = predictions[i]
+            if adjusted_code == ml_prediction.species_code:
+                continue
 
-        if adjusted_code != ml_prediction.species_code:
             logger.debug(
                 "Heuristics adjusted prediction from %s to %s",
                 ml_prediction.species_code,
                 adjusted_code,
             )
 
-            try:
-                species_info = get_species_info(self.region, adjusted_code)
-                species_name = species_info.name
-            except ValueError:
-                species_name = f"Unknown ({adjusted_code})"
+            species_name = self._species_name(adjusted_code)
 
             # Adjust probabilities slightly
             adjusted_probs = ml_prediction.probabilities.copy()
@@ -289,73 +482,75 @@ class SpeciesClassifier:
                     adjusted_probs[adjusted_code] + 0.15,
                 )
 
-            return SpeciesPrediction(
+            predictions[i] = SpeciesPrediction(
                 species_code=adjusted_code,
                 species_name=species_name,
                 confidence=min(0.7, ml_prediction.confidence + 0.1),
                 probabilities=adjusted_probs,
             )
 
-        return ml_prediction
+        return predictions
 
     def _apply_heuristics(
         self,
-        features: TreeFeatures,
-        ml_prediction: SpeciesPrediction,
-    ) -> str:
+        tree_features: list[TreeFeatures],
+        ml_codes: list[str],
+    ) -> list[str]:
         """
         Apply domain knowledge heuristics to adjust predictions.
 
+        Scores every tree against every species of the region as one
+        (trees, species) array.
+
         Args:
-            features: Tree features.
-            ml_prediction: Initial ML prediction.
+            tree_features: Features of the trees to re-score.
+            ml_codes: Initial ML species code for each tree.
 
         Returns:
-            Adjusted species code.
+            Adjusted species code for each tree.
         """
-        species_codes = get_species_codes_for_region(self.region)
-        species_dict = get_species_for_region(self.region)
+        # Get tree characteristics as columns
+        height = np.array([f.height for f in tree_features])[:, np.newaxis]
+        crown_diameter = np.array([f.crown_diameter for f in tree_features])
+        vertical_complexity = np.array(
+            [f.vertical_complexity for f in tree_features]
+        )[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crown_ratio = np.where(
+                height[:, 0] > 0, crown_diameter / height[:, 0], 0.5
+            )[:, np.newaxis]
+
+        # Check height range
+        arrays = self._species_arrays
+        h_min = arrays["height_min"]
+        h_max = arrays["height_max"]
+        score = np.where(
+            (h_min <= height) & (height <= h_max),
+            0.3,
+            np.where(
+                height < h_min,
+                0.1 * (1 - (h_min - height) / h_min),
+                0.1 * (1 - (height - h_max) / h_max),
+            ),
+        )
 
-        # Get tree characteristics
-        height = features.height
-        crown_ratio = (
-            features.crown_diameter / height if height > 0 else 0.5
+        # Check crown ratio
+        score += 0.3 * np.maximum(
+            0, 1 - np.abs(crown_ratio - arrays["crown_ratio"]) / 0.3
         )
-        vertical_complexity = features.vertical_complexity
-
-        # Find best matching species based on characteristics
-        best_match = ml_prediction.species_code
-        best_score = 0.0
-
-        for code in species_codes:
-            info = species_dict[code]
-            score = 0.0
-
-            # Check height range
-            min_h, max_h = info.typical_height_range
-            if min_h <= height <= max_h:
-                score += 0.3
-            elif height < min_h:
-                score += 0.1 * (1 - (min_h - height) / min_h)
-            else:
-                score += 0.1 * (1 - (height - max_h) / max_h)
-
-            # Check crown ratio
-            typical_ratio = info.typical_crown_ratio
-            ratio_diff = abs(crown_ratio - typical_ratio)
-            score += 0.3 * max(0, 1 - ratio_diff / 0.3)
-
-            # Category-based adjustments
-            if info.category == "conifer" and vertical_complexity < 0.5:
-                score += 0.1
-            elif info.category == "deciduous" and vertical_complexity > 0.5:
-                score += 0.1
-
-            if score > best_score:
-                best_score = score
-                best_match = code
-
-        return best_match
+
+        # Category-based adjustments
+        score += np.where(
+            (arrays["is_conifer"] & (vertical_complexity < 0.5))
+            | (arrays["is_deciduous"] & (vertical_complexity > 0.5)),
+            0.1,
+            0.0,
+        )
+
+        # Keep the ML prediction unless some species scores above zero
+        best = score.argmax(axis=1)
+        best_score = score[np.arange(len(best)), best]
+        return np.where(best_score > 0.0, arrays["codes"][best], ml_codes).tolist()
 
     def train(
         self,
@@ -383,29 +578,26 @@ class SpeciesClassifier:
         if not training_data:
             raise ValueError("Training data cannot be empty")
 
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import LabelEncoder, StandardScaler
+
         logger.info("Training species classifier with %d samples", len(training_data))
 
         # Extract features and labels
-        X = []
-        y = []
-
-        for labeled_tree in training_data:
-            feature_vector = self.feature_extractor.get_feature_vector(
-                labeled_tree.features
-            )
-            X.append(feature_vector)
-            y.append(labeled_tree.species_code)
-
-        X = np.array(X)
-        y = np.array(y)
+        X = self.feature_extractor.get_feature_matrix(
+            [labeled_tree.features for labeled_tree in training_data]
+        )
+        y = np.array([labeled_tree.species_code for labeled_tree in training_data])
 
         # Initialize and fit label encoder
         self.label_encoder = LabelEncoder()
         y_encoded = self.label_encoder.fit_transform(y)
+        self._cache_classes()
 
         # Initialize and fit scaler
         self.scaler = StandardScaler()
         X_scaled = self.scaler.fit_transform(X)
+        self._cache_scaler()
 
         # Store feature names
         self._feature_names = self.feature_extractor.get_feature_names(
@@ -420,7 +612,7 @@ class SpeciesClassifier:
             min_samples_split=min_samples_split,
             min_samples_leaf=2,
             random_state=42,
-            n_jobs=-1,
+            n_jobs=self.n_jobs,
             class_weight="balanced",
         )
 
@@ -446,6 +638,7 @@ class SpeciesClassifier:
 
         # Train on full dataset
         self.model.fit(X_scaled, y_encoded)
+        self._flat_forest = _FlatForest(self.model)
         self._is_trained = True
 
         logger.info("Model training complete")
@@ -479,24 +672,16 @@ class SpeciesClassifier:
             raise ValueError("Test data cannot be empty")
 
         # Extract features and labels
-        X = []
-        y_true = []
-
-        for labeled_tree in test_data:
-            feature_vector = self.feature_extractor.get_feature_vector(
-                labeled_tree.features
-            )
-            X.append(feature_vector)
-            y_true.append(labeled_tree.species_code)
-
-        X = np.array(X)
-        y_true = np.array(y_true)
+        X = self.feature_extractor.get_feature_matrix(
+            [labeled_tree.features for labeled_tree in test_data]
+        )
+        y_true = np.array([labeled_tree.species_code for labeled_tree in test_data])
 
         # Encode labels
         y_true_encoded = self.label_encoder.transform(y_true)
 
         # Scale features
-        X_scaled = self.scaler.transform(X)
+        X_scaled = self._scale(X)
 
         # Get predictions
         y_pred = self.model.predict(X_scaled)
@@ -559,12 +744,17 @@ class SpeciesClassifier:
             class_labels=list(classes),
         )
 
-    def save_model(self, path: str) -> None:
+    def save_model(self, path: str, compress: int = 3) -> None:
         """
         Save the trained model to disk.
 
+        The forest's node arrays compress well, so the file is written
+        zlib-compressed; load_model reads compressed and uncompressed
+        files alike.
+
         Args:
             path: Path to save the model file.
+            compress: zlib compression level from 0 (none) to 9.
 
         Raises:
             ValueError: If model is not trained.
@@ -572,6 +762,8 @@ class SpeciesClassifier:
         if not self._is_trained or self.model is None:
             raise ValueError("Model is not trained")
 
+        import joblib
+
         model_data = {
             "model": self.model,
             "scaler": self.scaler,
@@ -584,7 +776,7 @@ class SpeciesClassifier:
         # Ensure directory exists
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-        joblib.dump(model_data, path)
+        joblib.dump(model_data, path, compress=compress)
         logger.info("Model saved to: %s", path)
 
     def load_model(self, path: str) -> None:
@@ -601,6 +793,8 @@ class SpeciesClassifier:
         if not Path(path).exists():
             raise FileNotFoundError(f"Model file not found: {path}")
 
+        import joblib
+
         model_data = joblib.load(path)
 
         # Validate model data
@@ -610,10 +804,15 @@ class SpeciesClassifier:
                 raise ValueError(f"Invalid model file: missing '{key}'")
 
         self.model = model_data["model"]
+        self.model.n_jobs = self.n_jobs
+        self._flat_forest = _FlatForest(self.model)
         self.scaler = model_data["scaler"]
         self.label_encoder = model_data["label_encoder"]
         self._feature_names = model_data.get("feature_names")
         self.region = model_data["region"]
+        self._cache_scaler()
+        self._cache_species_arrays()
+        self._cache_classes()
         self._is_trained = True
 
         logger.info(
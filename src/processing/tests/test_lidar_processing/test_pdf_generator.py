@@ -0,0 +1,128 @@
+"""
+Unit tests for the PDF Generator service.
+
+Tests the capped tree inventory with its CSV sidecar, failure cleanup
+and batch generation.
+"""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from reportlab.platypus import SimpleDocTemplate
+
+from lidar_processing.models import (
+    InventorySummary,
+    ProjectInfo,
+    ReportOptions,
+    TreeMetrics,
+)
+from lidar_processing.services.pdf_generator import PDFGenerator, ReportJob
+
+
+@pytest.fixture
+def generator() -> PDFGenerator:
+    """Create a PDF generator with default layout."""
+    return PDFGenerator()
+
+
+@pytest.fixture
+def trees() -> list[TreeMetrics]:
+    """Create a small inventory."""
+    return [
+        TreeMetrics(tree_id=i, x=float(i), y=2.0 * i, height=10.0 + i)
+        for i in range(12)
+    ]
+
+
+@pytest.fixture
+def report_inputs(trees) -> dict:
+    """Create the report arguments shared by the tests."""
+    return {
+        "project_info": ProjectInfo(project_name="Test Project"),
+        "summary": InventorySummary(
+            total_trees=len(trees),
+            total_area_hectares=1.0,
+            stems_per_hectare=float(len(trees)),
+            mean_height=15.5,
+            max_height=21.0,
+            min_height=10.0,
+            std_height=3.5,
+        ),
+        "trees": trees,
+    }
+
+
+class TestTreeInventoryCsv:
+    """Tests for the full inventory CSV written with capped tree lists."""
+
+    def test_capped_list_writes_csv(self, generator, report_inputs, tmp_path):
+        """Test a capped tree list writes every tree to the CSV sidecar."""
+        output_path = tmp_path / "report.pdf"
+        options = ReportOptions(tree_list_max_rows=5)
+
+        pdf_path = generator.generate_report(
+            output_path=output_path, options=options, **report_inputs
+        )
+
+        csv_path = generator.tree_csv_path(output_path, report_inputs["trees"], options)
+        assert Path(pdf_path).stat().st_size > 0
+        assert csv_path == tmp_path / "report_trees.csv"
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["tree_id"] for row in rows] == [str(i) for i in range(12)]
+
+    def test_full_list_writes_no_csv(self, generator, report_inputs, tmp_path):
+        """Test no CSV is written when every tree fits in the PDF."""
+        output_path = tmp_path / "report.pdf"
+        options = ReportOptions()
+
+        generator.generate_report(
+            output_path=output_path, options=options, **report_inputs
+        )
+
+        assert generator.tree_csv_path(output_path, report_inputs["trees"], options) is None
+        assert not (tmp_path / "report_trees.csv").exists()
+
+    def test_failed_build_removes_outputs(self, generator, report_inputs, tmp_path):
+        """Test a failed build leaves neither the PDF nor the CSV behind."""
+        output_path = tmp_path / "report.pdf"
+
+        with patch.object(
+            SimpleDocTemplate, "build", side_effect=RuntimeError("layout failed")
+        ), pytest.raises(RuntimeError):
+            generator.generate_report(
+                output_path=output_path,
+                options=ReportOptions(tree_list_max_rows=5),
+                **report_inputs,
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestGenerateBatch:
+    """Tests for process-parallel batch generation."""
+
+    def test_batch_writes_each_report(self, report_inputs, tmp_path):
+        """Test every job of a batch produces its PDF, in job order."""
+        jobs = [
+            ReportJob(
+                output_path=tmp_path / f"report_{i}.pdf",
+                options=ReportOptions(include_methodology=False),
+                **report_inputs,
+            )
+            for i in range(2)
+        ]
+
+        paths = PDFGenerator.generate_batch(jobs, max_workers=2)
+
+        assert paths == [str(job.output_path) for job in jobs]
+        for path in paths:
+            assert Path(path).read_bytes().startswith(b"%PDF")
+
+    def test_empty_batch(self):
+        """Test an empty batch starts no workers."""
+        assert PDFGenerator.generate_batch([]) == []
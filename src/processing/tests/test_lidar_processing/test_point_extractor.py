@@ -0,0 +1,400 @@
+"""
+Tests for the Point Extractor Service.
+
+These tests verify point extraction and binary/JSON encoding for the 3D viewer.
+"""
+
+from __future__ import annotations
+
+import base64
+import struct
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import laspy
+import numpy as np
+import orjson
+import pytest
+
+from lidar_processing.config import Settings
+from lidar_processing.services.point_extractor import (
+    BYTES_PER_POINT,
+    POINT_DTYPE,
+    POINT_STRUCT_FORMAT,
+    PointExtractor,
+)
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Create test settings."""
+    return Settings(
+        max_file_size_mb=100,
+    )
+
+
+@pytest.fixture
+def extractor(settings: Settings) -> PointExtractor:
+    """Create an extractor instance with test settings."""
+    return PointExtractor(settings)
+
+
+def _write_las(path: Path, n_points: int, point_format: int = 3) -> laspy.LasData:
+    """Write a small synthetic LAS file and return the written data."""
+    rng = np.random.default_rng(42)
+    header = laspy.LasHeader(point_format=point_format, version="1.2")
+    header.scales = [0.01, 0.01, 0.01]
+    header.offsets = [500000.0, 4000000.0, 100.0]
+
+    las = laspy.LasData(header)
+    las.x = 500000.0 + rng.random(n_points) * 100.0
+    las.y = 4000000.0 + rng.random(n_points) * 100.0
+    las.z = 100.0 + rng.random(n_points) * 30.0
+    las.intensity = rng.integers(0, 1000, n_points)
+    las.classification = rng.integers(1, 6, n_points)
+    if "red" in las.point_format.dimension_names:
+        las.red = rng.integers(0, 65535, n_points)
+        las.green = rng.integers(0, 65535, n_points)
+        las.blue = rng.integers(0, 65535, n_points)
+
+    las.write(path)
+    return laspy.read(path)
+
+
+@pytest.fixture
+def las_file(tmp_path: Path) -> Path:
+    """Create a LAS file with RGB."""
+    path = tmp_path / "points.las"
+    _write_las(path, 1000)
+    return path
+
+
+def _decode(binary_data: str) -> np.ndarray:
+    """Decode a base64 binary payload into a structured array."""
+    return np.frombuffer(base64.b64decode(binary_data), dtype=POINT_DTYPE)
+
+
+class TestBinaryLayout:
+    """Tests for the binary point layout."""
+
+    def test_dtype_matches_struct_format(self) -> None:
+        """Test the structured dtype has the documented packed layout."""
+        assert POINT_DTYPE.itemsize == BYTES_PER_POINT
+        assert struct.calcsize(POINT_STRUCT_FORMAT) == BYTES_PER_POINT
+
+    def test_format_binary_matches_struct_pack(self, extractor: PointExtractor) -> None:
+        """Test binary encoding is byte-identical to struct packing."""
+        rows = [
+            (1.5, 3.0, 10.0, 0, 2, 128, 128, 128),
+            (-2.25, 4.0, 20.5, 65535, 5, 255, 0, 7),
+        ]
+        points_data = np.array(rows, dtype=POINT_DTYPE)
+        expected = b"".join(struct.pack(POINT_STRUCT_FORMAT, *row) for row in rows)
+
+        result = extractor._format_binary(points_data)
+
+        assert base64.b64decode(result) == expected
+
+    def test_format_binary_empty(self, extractor: PointExtractor) -> None:
+        """Test binary encoding of an empty point set."""
+        assert extractor._format_binary(np.empty(0, dtype=POINT_DTYPE)) == ""
+
+
+class TestExtractPoints:
+    """Tests for point extraction."""
+
+    def test_file_not_found(self, extractor: PointExtractor) -> None:
+        """Test extraction from non-existent file."""
+        with pytest.raises(FileNotFoundError):
+            extractor.extract_points("/nonexistent/file.las")
+
+    def test_invalid_downsample_factor(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test extraction with an invalid downsample factor."""
+        with pytest.raises(ValueError, match="downsample_factor"):
+            extractor.extract_points(las_file, downsample_factor=0)
+
+    def test_binary_extraction(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test binary extraction returns the requested page of points."""
+        las = laspy.read(las_file)
+
+        result = extractor.extract_points(las_file, offset=10, limit=100)
+
+        assert result["success"] is True
+        assert result["count"] == 100
+        assert result["hasMore"] is True
+        assert result["totalPoints"] == 1000
+        points = _decode(result["binaryData"])
+        np.testing.assert_allclose(points["x"], las.x[10:110], rtol=1e-6)
+        np.testing.assert_array_equal(points["intensity"], las.intensity[10:110])
+        np.testing.assert_array_equal(points["r"], las.red[10:110] >> 8)
+
+    def test_downsampled_extraction(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test extraction with a decimation factor."""
+        las = laspy.read(las_file)
+
+        result = extractor.extract_points(las_file, offset=5, limit=1000, downsample_factor=4)
+
+        assert result["count"] == 245
+        assert result["hasMore"] is False
+        assert result["totalPoints"] == 250
+        points = _decode(result["binaryData"])
+        np.testing.assert_array_equal(points["classification"], las.classification[20::4])
+
+    def test_attribute_selection(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test attributes that were not requested are sent as defaults."""
+        las = laspy.read(las_file)
+
+        result = extractor.extract_points(las_file, limit=20, attributes=["classification"])
+
+        points = _decode(result["binaryData"])
+        np.testing.assert_array_equal(points["classification"], las.classification[:20])
+        assert not points["intensity"].any()
+        assert (points["r"] == 128).all()
+
+    def test_viewer_attribute_names(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test the attribute list sent by the backend viewer service."""
+        las = laspy.read(las_file)
+
+        result = extractor.extract_points(
+            las_file,
+            limit=20,
+            attributes=["x", "y", "z", "intensity", "classification", "r", "g", "b"],
+        )
+
+        points = _decode(result["binaryData"])
+        np.testing.assert_array_equal(points["intensity"], las.intensity[:20])
+        np.testing.assert_array_equal(points["classification"], las.classification[:20])
+        np.testing.assert_array_equal(points["r"], las.red[:20] >> 8)
+
+    def test_unknown_attribute(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test extraction ignores unknown attribute names."""
+        las = laspy.read(las_file)
+
+        result = extractor.extract_points(
+            las_file, limit=20, attributes=["rgb", "gps_time", "return_number"]
+        )
+
+        points = _decode(result["binaryData"])
+        np.testing.assert_array_equal(points["r"], las.red[:20] >> 8)
+        assert not points["intensity"].any()
+
+    @pytest.fixture
+    def laz_file(self, tmp_path: Path) -> Path:
+        """Create a compressed LAZ file."""
+        if not laspy.LazBackend.detect_available():
+            pytest.skip("No LAZ backend installed")
+        path = tmp_path / "points.laz"
+        _write_las(path, 1000)
+        return path
+
+    def test_laz_extraction(self, extractor: PointExtractor, laz_file: Path) -> None:
+        """Test extraction from a compressed file."""
+        las = laspy.read(laz_file)
+
+        result = extractor.extract_points(laz_file, offset=300, limit=50, downsample_factor=2)
+
+        points = _decode(result["binaryData"])
+        np.testing.assert_array_equal(points["intensity"], las.intensity[600:700:2])
+        np.testing.assert_array_equal(points["classification"], las.classification[600:700:2])
+
+    def test_laz_extraction_without_seek_support(
+        self,
+        extractor: PointExtractor,
+        laz_file: Path,
+    ) -> None:
+        """Test extraction falls back to scanning when the reader cannot seek."""
+        las = laspy.read(laz_file)
+
+        with patch.object(laspy.LasReader, "seek", side_effect=OSError("not seekable")) as mock_seek:
+            result = extractor.extract_points(laz_file, offset=300, limit=50, downsample_factor=2)
+
+        mock_seek.assert_called_once_with(600)
+        points = _decode(result["binaryData"])
+        np.testing.assert_array_equal(points["intensity"], las.intensity[600:700:2])
+
+    def test_paging_probe(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test limit=0 reports paging info without reading points."""
+        with patch.object(PointExtractor, "_read_points") as mock_read:
+            result = extractor.extract_points(las_file, offset=100, limit=0, downsample_factor=4)
+
+        mock_read.assert_not_called()
+        assert result["count"] == 0
+        assert result["hasMore"] is True
+        assert result["totalPoints"] == 250
+
+    def test_offset_past_end(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test extraction past the end of the file."""
+        result = extractor.extract_points(las_file, offset=1000)
+
+        assert result["count"] == 0
+        assert result["hasMore"] is False
+        assert result["binaryData"] == ""
+
+    def test_json_extraction_without_rgb(self, extractor: PointExtractor, tmp_path: Path) -> None:
+        """Test JSON extraction from a file without RGB."""
+        path = tmp_path / "no_rgb.las"
+        las = _write_las(path, 50, point_format=1)
+
+        result = extractor.extract_points(path, limit=3, output_format="json")
+
+        assert result["binaryData"] is None
+        assert len(result["points"]) == 3
+        first = result["points"][0]
+        assert first["x"] == pytest.approx(float(las.x[0]), rel=1e-6)
+        assert first["classification"] == int(las.classification[0])
+        assert "r" not in first
+
+    def test_columnar_json_extraction(self, las_file: Path) -> None:
+        """Test columnar JSON returns per-attribute arrays."""
+        extractor = PointExtractor(Settings(viewer_columnar_json=True))
+        las = laspy.read(las_file)
+
+        result = extractor.extract_points(las_file, offset=2, limit=4, output_format="json")
+
+        points = orjson.loads(orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))["points"]
+        assert list(points) == list(POINT_DTYPE.names)
+        assert points["classification"] == np.asarray(las.classification[2:6]).tolist()
+        np.testing.assert_allclose(points["z"], las.z[2:6], rtol=1e-6)
+
+
+class TestFileMetadata:
+    """Tests for viewer metadata."""
+
+    def test_metadata(self, extractor: PointExtractor, las_file: Path) -> None:
+        """Test metadata reports header values, attributes and LOD levels."""
+        result = extractor.get_file_metadata(las_file)
+
+        metadata = result["metadata"]
+        assert metadata["pointCount"] == 1000
+        assert metadata["pointFormat"] == 3
+        assert metadata["attributes"]["hasRGB"] is True
+        assert metadata["attributes"]["hasNormalizedHeight"] is False
+        assert [lod["pointCount"] for lod in metadata["lodLevels"]] == [1000, 250, 62]
+
+    def test_metadata_for_empty_file(self, extractor: PointExtractor, tmp_path: Path) -> None:
+        """Test metadata for a file with no points and an extra dimension."""
+        path = tmp_path / "empty.las"
+        header = laspy.LasHeader(point_format=1, version="1.2")
+        header.add_extra_dim(laspy.ExtraBytesParams(name="normalized_height", type=np.float32))
+        laspy.LasData(header).write(path)
+
+        attributes = extractor.get_file_metadata(path)["metadata"]["attributes"]
+
+        assert attributes["hasRGB"] is False
+        assert attributes["hasReturnNumber"] is True
+        assert attributes["hasNormalizedHeight"] is True
+
+    def test_metadata_is_cached_until_file_changes(
+        self,
+        extractor: PointExtractor,
+        las_file: Path,
+    ) -> None:
+        """Test repeat metadata calls reuse the cached header."""
+        with patch("laspy.open", wraps=laspy.open) as mock_open:
+            first = extractor.get_file_metadata(las_file)
+            second = extractor.get_file_metadata(las_file, include_lod_info=False)
+            assert mock_open.call_count == 1
+
+            _write_las(las_file, 500)
+            third = extractor.get_file_metadata(las_file)
+            assert mock_open.call_count == 2
+
+        assert first["metadata"]["pointCount"] == 1000
+        assert second["metadata"]["lodLevels"] == []
+        assert third["metadata"]["pointCount"] == 500
+
+
+class TestGeoTiffCrs:
+    """Tests for EPSG extraction from GeoTIFF key directories."""
+
+    @staticmethod
+    def _vlr(keys: list[tuple[int, int, int, int]], num_keys: int | None = None) -> MagicMock:
+        """Build a mock GeoKeyDirectory VLR."""
+        header = [1, 1, 0, len(keys) if num_keys is None else num_keys]
+        values = header + [v for key in keys for v in key]
+        vlr = MagicMock()
+        vlr.record_data = struct.pack(f"<{len(values)}H", *values)
+        return vlr
+
+    def test_projected_crs(self, extractor: PointExtractor) -> None:
+        """Test the first inline CRS key is returned."""
+        vlr = self._vlr([(1024, 0, 1, 1), (3072, 0, 1, 32610), (2048, 0, 1, 4326)])
+
+        assert extractor._extract_epsg_from_geotiff(vlr) == 32610
+
+    def test_crs_key_stored_in_another_tag(self, extractor: PointExtractor) -> None:
+        """Test CRS keys that reference another TIFF tag are skipped."""
+        vlr = self._vlr([(3072, 34737, 1, 0), (2048, 0, 1, 4269)])
+
+        assert extractor._extract_epsg_from_geotiff(vlr) == 4269
+
+    def test_truncated_directory(self, extractor: PointExtractor) -> None:
+        """Test a key count larger than the record is clamped."""
+        vlr = self._vlr([(1024, 0, 1, 1)], num_keys=8)
+
+        assert extractor._extract_epsg_from_geotiff(vlr) is None
+
+
+class TestCreateLodFile:
+    """Tests for LOD file creation."""
+
+    def test_create_lod_file(self, extractor: PointExtractor, las_file: Path, tmp_path: Path) -> None:
+        """Test the LOD file keeps every nth point record unchanged."""
+        output_path = tmp_path / "lod.las"
+
+        result = extractor.create_lod_file(las_file, output_path, decimation_factor=4)
+
+        assert result["success"] is True
+        assert result["output_points"] == 250
+        source = laspy.read(las_file)
+        lod = laspy.read(output_path)
+        np.testing.assert_array_equal(lod.points.array, source.points.array[::4])
+
+    def test_create_voxel_lod_file(self, extractor: PointExtractor, tmp_path: Path) -> None:
+        """Test voxel LOD keeps sparse regions that a stride would thin out."""
+        rng = np.random.default_rng(7)
+        header = laspy.LasHeader(point_format=1, version="1.2")
+        header.scales = [0.01, 0.01, 0.01]
+        header.offsets = [0.0, 0.0, 0.0]
+        las = laspy.LasData(header)
+        # 900 points in one tight cluster, 100 spread over a 100 m cube
+        cluster = rng.random((900, 3)) * 0.5
+        spread = rng.random((100, 3)) * 100.0
+        xyz = np.vstack([cluster, spread])
+        las.x, las.y, las.z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+        las.point_source_id = np.arange(1000)
+        input_path = tmp_path / "clustered.las"
+        las.write(input_path)
+        output_path = tmp_path / "lod.las"
+
+        result = extractor.create_lod_file(input_path, output_path, 4, method="voxel")
+
+        lod = laspy.read(output_path)
+        kept = np.asarray(lod.point_source_id)
+        assert result["output_points"] == len(kept)
+        assert np.all(np.diff(kept) > 0)
+        assert np.count_nonzero(kept < 900) <= 2
+        assert np.count_nonzero(kept >= 900) >= 50
+
+    def test_create_blosc_lod_file(
+        self,
+        extractor: PointExtractor,
+        las_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test the Blosc LOD file holds points in the binary layout."""
+        blosc2 = pytest.importorskip("blosc2")
+        output_path = tmp_path / "lod.b2nd"
+
+        result = extractor.create_lod_file(las_file, output_path, 4, output_format="blosc")
+
+        assert result["output_points"] == 250
+        points = blosc2.open(str(output_path))[:]
+        assert points.dtype == POINT_DTYPE
+        full = _decode(extractor.extract_points(las_file)["binaryData"])
+        np.testing.assert_array_equal(points, full[::4])
+
+    def test_unknown_lod_format(self, extractor: PointExtractor, las_file: Path, tmp_path: Path) -> None:
+        """Test LOD creation with an unknown output format."""
+        with pytest.raises(ValueError, match="Unsupported LOD output format"):
+            extractor.create_lod_file(las_file, tmp_path / "lod.bin", 4, output_format="bin")
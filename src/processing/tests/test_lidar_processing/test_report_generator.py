@@ -0,0 +1,192 @@
+"""
+Unit tests for the Report Generator orchestrator.
+
+Tests summary statistics, filename handling, and report result storage.
+"""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from lidar_processing.models import (
+    ProjectInfo,
+    ReportOptions,
+    ReportResult,
+    ReportStatus,
+    TreeMetrics,
+    UnitSystem,
+)
+from lidar_processing.services.report_generator import ReportGenerator
+
+
+@pytest.fixture
+def generator() -> ReportGenerator:
+    """Create a report generator without settings."""
+    return ReportGenerator()
+
+
+@pytest.fixture
+def trees() -> list[TreeMetrics]:
+    """Create a small inventory with some missing estimates."""
+    return [
+        TreeMetrics(tree_id=1, x=0.0, y=0.0, height=10.0, dbh_estimated=20.0,
+                    biomass_estimated=100.0),
+        TreeMetrics(tree_id=2, x=10.0, y=0.0, height=20.0, dbh_estimated=40.0),
+        TreeMetrics(tree_id=3, x=0.0, y=10.0, height=30.0,
+                    biomass_estimated=300.0),
+    ]
+
+
+class TestCalculateSummary:
+    """Tests for inventory summary statistics."""
+
+    def test_summary_statistics(self, generator, trees):
+        """Test summary values skip missing estimates."""
+        summary = generator._calculate_summary(trees, 2.0, UnitSystem.METRIC)
+
+        assert summary.total_trees == 3
+        assert summary.stems_per_hectare == 1.5
+        assert summary.mean_height == 20.0
+        assert summary.max_height == 30.0
+        assert summary.min_height == 10.0
+        assert summary.std_height == round(math.sqrt(200 / 3), 2)
+        assert summary.mean_dbh == 30.0
+        assert summary.total_basal_area == round(
+            math.pi * (0.1**2 + 0.2**2), 4
+        )
+        assert summary.total_biomass == 400.0
+        assert summary.total_carbon == 188.0
+        assert summary.species_count == 0
+
+    def test_summary_without_estimates(self, generator):
+        """Test optional totals stay unset when no tree has them."""
+        summary = generator._calculate_summary(
+            [TreeMetrics(tree_id=1, x=1.0, y=1.0, height=5.0)],
+            1.0,
+            UnitSystem.METRIC,
+        )
+
+        assert summary.mean_height == 5.0
+        assert summary.mean_dbh is None
+        assert summary.total_basal_area is None
+        assert summary.total_biomass is None
+
+    def test_summary_empty(self, generator):
+        """Test summary for an empty inventory."""
+        summary = generator._calculate_summary([], 1.0, UnitSystem.METRIC)
+
+        assert summary.total_trees == 0
+        assert summary.mean_height == 0
+
+
+class TestStandMetrics:
+    """Tests for assigning trees to stand boundaries."""
+
+    def test_trees_assigned_by_polygon(self, generator):
+        """Test each stand only receives the trees inside its polygon."""
+        trees = [
+            TreeMetrics(tree_id=i, x=float(x), y=5.0, height=10.0)
+            for i, x in enumerate([5, 15, 25, 55, 65])
+        ]
+        boundaries = [
+            {
+                "id": "west",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[0, 0], [50, 0], [50, 10], [0, 10], [0, 0]]],
+                },
+            },
+            {
+                "id": "east",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[50, 0], [100, 0], [100, 10], [50, 10], [50, 0]]],
+                },
+            },
+            {"id": "whole", "area_hectares": 1.0},
+        ]
+
+        metrics = generator._calculate_stand_metrics(trees, boundaries, 1.0)
+
+        counts = {m.stand_id: m.tree_count for m in metrics}
+        assert counts == {"west": 3, "east": 2, "whole": 5}
+
+
+class TestSanitizeFilename:
+    """Tests for report filename sanitization."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("My Project", "My_Project"),
+            ("a!!b  c", "a_b_c"),
+            ("__x__", "x"),
+            ("north_-_south", "north_-_south"),
+            ("a_ _b", "a_b"),
+            ("Forêt 2024", "Forêt_2024"),
+        ],
+    )
+    def test_sanitize(self, generator, name, expected):
+        """Test unsafe runs collapse to a single underscore."""
+        assert generator._sanitize_filename(name) == expected
+
+    def test_sanitize_truncates(self, generator):
+        """Test long names are limited to 100 characters."""
+        assert len(generator._sanitize_filename("a" * 300)) == 100
+
+
+class TestReportStorage:
+    """Tests for in-memory report result storage."""
+
+    def _result(self, report_id: str) -> ReportResult:
+        return ReportResult(
+            report_id=report_id,
+            analysis_id="analysis",
+            status=ReportStatus.COMPLETED,
+        )
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unread report is evicted first."""
+        generator = ReportGenerator(SimpleNamespace(max_cached_reports=2))
+        generator._store_report(self._result("a"))
+        generator._store_report(self._result("b"))
+
+        # Reading "a" makes "b" the eviction candidate
+        assert generator.get_report_status("a") is not None
+        generator._store_report(self._result("c"))
+
+        assert generator.get_report_status("b") is None
+        assert generator.get_report_status("a") is not None
+        assert generator.get_report_status("c") is not None
+
+    def test_generate_stores_result(self, generator, trees, tmp_path):
+        """Test generated reports can be looked up by id."""
+        result = generator.generate_inventory_report(
+            analysis_id="analysis",
+            tree_data=trees,
+            project_info=ProjectInfo(project_name="Test Project"),
+            output_format="excel",
+            output_directory=str(tmp_path),
+        )
+
+        assert result.status == ReportStatus.COMPLETED
+        assert result.file_sizes["excel"] > 0
+        assert generator.get_report_status(result.report_id) is result
+
+    def test_capped_pdf_reports_tree_csv(self, generator, trees, tmp_path):
+        """Test the full inventory CSV of a capped PDF is reported."""
+        result = generator.generate_inventory_report(
+            analysis_id="analysis",
+            tree_data=trees,
+            project_info=ProjectInfo(project_name="Test Project"),
+            output_format="pdf",
+            options=ReportOptions(tree_list_max_rows=2, include_charts=False),
+            output_directory=str(tmp_path),
+        )
+
+        assert result.status == ReportStatus.COMPLETED
+        assert result.tree_csv_path == result.pdf_path.replace(".pdf", "_trees.csv")
+        assert result.file_sizes["tree_csv"] > 0
@@ -0,0 +1,151 @@
+"""
+Unit tests for the Spatial Exporter service.
+
+Tests feature conversion and the GeoJSON, Shapefile, KML and CSV writers.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import xml.etree.ElementTree as ET
+import zipfile
+
+import numpy as np
+import pytest
+
+from lidar_processing.services.spatial_exporter import ExportFormat, SpatialExporter
+
+
+@pytest.fixture
+def exporter(tmp_path) -> SpatialExporter:
+    """Create an exporter writing into a temporary directory."""
+    return SpatialExporter(output_dir=str(tmp_path))
+
+
+@pytest.fixture
+def trees() -> list[dict]:
+    """Create a small tree list with mixed attribute types."""
+    return [
+        {"tree_id": 1, "x": 10.0, "y": 20.0, "height": 12.5, "species": "Alder & Co"},
+        {"tree_id": 2, "position": {"x": 11.0, "y": 21.0, "z": 3.0}, "height": 18.0,
+         "species": 'Pin "rouge", var.'},
+        {"tree_id": 3, "height": 9.0},  # No coordinates, skipped
+    ]
+
+
+class TestTreeArrays:
+    """Tests for exporting trees held as parallel arrays."""
+
+    def test_matches_dict_export(self, exporter):
+        """Test array features match the dict-based conversion."""
+        x = np.array([10.0, 11.0, np.nan])
+        y = np.array([20.0, 21.0, 22.0])
+        z = np.array([0.0, 3.0, 0.0])
+        ids = np.array([1, 2, 3])
+        heights = np.array([12.5, 18.0, 9.0])
+
+        from_arrays = list(
+            exporter._point_features(
+                exporter._iter_array_points(x, y, z, {"id": ids, "height": heights})
+            )
+        )
+        from_dicts = exporter._trees_to_geojson_features(
+            [
+                {"id": 1, "x": 10.0, "y": 20.0, "height": 12.5},
+                {"id": 2, "x": 11.0, "y": 21.0, "z": 3.0, "height": 18.0},
+            ]
+        )
+
+        assert from_arrays == from_dicts
+
+    def test_export_geojson(self, exporter):
+        """Test arrays export to a GeoJSON feature collection."""
+        result = exporter.export_tree_arrays(
+            np.arange(3.0),
+            np.arange(3.0),
+            attributes={"tree_id": np.arange(3)},
+            return_bytes=True,
+        )
+
+        geojson = json.loads(result.file_bytes)
+        assert result.feature_count == 3
+        assert geojson["features"][2]["geometry"]["coordinates"] == [2.0, 2.0]
+        assert geojson["features"][2]["properties"] == {"tree_id": 2}
+
+
+class TestExportFormats:
+    """Tests for the individual export formats."""
+
+    def test_geojson(self, exporter, trees):
+        """Test GeoJSON output skips trees without coordinates."""
+        result = exporter.export_trees(
+            trees, format=ExportFormat.GEOJSON, return_bytes=True
+        )
+
+        geojson = json.loads(result.file_bytes)
+        assert result.feature_count == 2
+        assert [f["geometry"]["coordinates"] for f in geojson["features"]] == [
+            [10.0, 20.0],
+            [11.0, 21.0, 3.0],
+        ]
+
+    def test_shapefile_components(self, exporter, trees):
+        """Test the zip holds consistent SHP, SHX, DBF and PRJ members."""
+        result = exporter.export_trees(
+            trees,
+            format=ExportFormat.SHAPEFILE,
+            filename="trees",
+            crs="EPSG:32610",
+            return_bytes=True,
+        )
+
+        with zipfile.ZipFile(io.BytesIO(result.file_bytes)) as zf:
+            members = {name: zf.read(name) for name in zf.namelist()}
+
+        assert sorted(members) == ["trees.dbf", "trees.prj", "trees.shp", "trees.shx"]
+        # Two 28-byte point records after the 100-byte header, indexed in SHX
+        assert len(members["trees.shp"]) == 100 + 2 * 28
+        assert len(members["trees.shx"]) == 100 + 2 * 8
+        assert members["trees.prj"].startswith(b'PROJCS["WGS_1984_UTM_Zone_10N"')
+        assert int.from_bytes(members["trees.dbf"][4:8], "little") == 2
+
+    @pytest.mark.parametrize(
+        "format",
+        [ExportFormat.GEOJSON, ExportFormat.SHAPEFILE, ExportFormat.KML, ExportFormat.CSV],
+    )
+    def test_bytes_only_on_request(self, exporter, trees, format):
+        """Test file contents are only returned when asked for."""
+        result = exporter.export_trees(trees, format=format)
+
+        assert result.file_bytes is None
+        assert os.path.getsize(result.file_path) > 0
+
+    def test_dbf_mixed_numeric_keeps_decimals(self, exporter):
+        """Test integer-first numeric fields still store fractional values."""
+        dbf = exporter._build_dbf_file(
+            [{"properties": {"volume": 1}}, {"properties": {"volume": 2.5}}]
+        )
+
+        assert dbf[32 + 17] == 8  # Decimal count of the only field
+        assert b"2.50000000" in dbf
+
+    def test_kml_escapes_text(self, exporter, trees):
+        """Test KML output stays well-formed with markup characters."""
+        result = exporter.export_trees(trees, format=ExportFormat.KML, return_bytes=True)
+
+        root = ET.fromstring(result.file_bytes)
+        descriptions = [
+            e.text for e in root.iter("{http://www.opengis.net/kml/2.2}description")
+        ]
+        assert "species: Alder & Co" in descriptions[0]
+
+    def test_csv_quotes_values(self, exporter, trees):
+        """Test CSV output round-trips embedded quotes and commas."""
+        result = exporter.export_trees(trees, format=ExportFormat.CSV, return_bytes=True)
+
+        rows = list(csv.DictReader(io.StringIO(result.file_bytes.decode("utf-8"))))
+        assert rows[0]["WKT"] == "POINT (10.0 20.0)"
+        assert rows[1]["species"] == 'Pin "rouge", var.'
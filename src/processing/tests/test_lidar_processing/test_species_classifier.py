@@ -0,0 +1,141 @@
+"""
+Unit tests for the Species Classifier service.
+
+Tests batched prediction and heuristic adjustment.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from lidar_processing.models import TreeFeatures
+from lidar_processing.services.species_classifier import (
+    SpeciesClassifier,
+    _FlatForest,
+)
+from lidar_processing.services.species_config import get_species_info
+
+
+@pytest.fixture(scope="module")
+def classifier() -> SpeciesClassifier:
+    """Create a classifier backed by the mock model."""
+    return SpeciesClassifier(region="pnw")
+
+
+@pytest.fixture
+def features() -> list[TreeFeatures]:
+    """Create trees spanning a range of heights and crown sizes."""
+    return [
+        TreeFeatures(
+            height=height,
+            crown_diameter=crown,
+            crown_area=crown * crown * 0.785,
+            height_mean=height * 0.6,
+            height_std=height * 0.1,
+            vertical_complexity=0.2 + 0.1 * i,
+            height_percentiles=[height * q for q in (0.25, 0.5, 0.75, 0.9, 0.95)],
+            intensity_mean=None if i % 2 else 120.0,
+        )
+        for i, (height, crown) in enumerate(
+            [(45.0, 6.0), (12.0, 9.0), (30.0, 4.5), (8.0, 7.5), (55.0, 10.0)]
+        )
+    ]
+
+
+class TestPredict:
+    """Tests for batched species prediction."""
+
+    def test_batch_matches_single(self, classifier, features):
+        """Test batch results match predicting each tree on its own."""
+        batch = classifier.predict(features)
+
+        assert batch == [classifier.predict_single(f) for f in features]
+
+    def test_prediction_fields(self, classifier, features):
+        """Test probabilities cover every class and agree with the prediction."""
+        codes = set(classifier.label_encoder.classes_)
+
+        for prediction in classifier.predict(features):
+            assert set(prediction.probabilities) == codes
+            assert prediction.confidence == max(prediction.probabilities.values())
+            assert (
+                prediction.probabilities[prediction.species_code]
+                == prediction.confidence
+            )
+
+    def test_empty(self, classifier):
+        """Test an empty batch returns no predictions."""
+        assert classifier.predict([]) == []
+
+    def test_untrained_raises(self, classifier, features):
+        """Test prediction requires a trained model."""
+        untrained = SpeciesClassifier.__new__(SpeciesClassifier)
+        untrained.model = None
+        untrained._is_trained = False
+
+        with pytest.raises(ValueError):
+            untrained.predict_single(features[0])
+
+
+class TestFlatForest:
+    """Tests for the flattened forest used on small batches."""
+
+    def test_matches_forest(self, classifier):
+        """Test probabilities match the scikit-learn forest exactly."""
+        X = np.random.default_rng(0).normal(
+            scale=2.0, size=(300, classifier.model.n_features_in_)
+        )
+
+        flat = _FlatForest(classifier.model)
+
+        np.testing.assert_array_equal(
+            flat.predict_proba(X), classifier.model.predict_proba(X)
+        )
+
+    def test_large_batch_matches_small(self, classifier, features):
+        """Test batches above the flat-forest limit give the same results."""
+        large = classifier.predict(features * 60)
+
+        assert large[: len(features)] == classifier.predict(features)
+
+
+class TestHeuristics:
+    """Tests for heuristic adjustment of low-confidence predictions."""
+
+    def test_batch_matches_single(self, classifier, features):
+        """Test batch heuristics match adjusting each tree on its own."""
+        batch = classifier.predict_batch_with_heuristics(features)
+
+        assert batch == [classifier.predict_with_heuristics(f) for f in features]
+
+    def test_scores_by_traits(self, classifier):
+        """Test trees are matched to species with fitting traits."""
+        trees = [
+            TreeFeatures(height=50.0, crown_diameter=10.0, crown_area=78.5,
+                         vertical_complexity=0.3),
+            TreeFeatures(height=0.0, crown_diameter=1.0, crown_area=0.8,
+                         vertical_complexity=0.9),
+        ]
+
+        codes = classifier._apply_heuristics(trees, ["PSME", "PSME"])
+
+        info = get_species_info("pnw", codes[0])
+        assert info.typical_height_range[0] <= 50.0 <= info.typical_height_range[1]
+        assert info.category == "conifer"
+        assert get_species_info("pnw", codes[1]).category == "deciduous"
+
+
+class TestPersistence:
+    """Tests for saving and loading models."""
+
+    @pytest.mark.parametrize("compress", [0, 3])
+    def test_round_trip(self, classifier, features, tmp_path, compress):
+        """Test a saved model reloads with identical predictions."""
+        path = tmp_path / "model.joblib"
+        classifier.save_model(str(path), compress=compress)
+
+        loaded = SpeciesClassifier(model_path=str(path))
+
+        assert loaded.region == classifier.region
+        assert loaded.predict(features) == classifier.predict(features)